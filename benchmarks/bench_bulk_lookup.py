@@ -0,0 +1,61 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Compare the bulk lookup strategies of api.get_elements_by_ids against the
+stub CLI: parallel lookups per key and a single scan of the library.
+
+Usage: python benchmarks/bench_bulk_lookup.py [--elements 100000] [--keys 10 1000 100000]
+'''
+
+import argparse
+import json
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+LIBRARY_PATH = '/mnt/library/das-element.lib'
+
+# parallel lookups start one process per key, skip them for huge key counts
+MAX_PARALLEL_KEYS = 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--elements', type=int, default=100000)
+    parser.add_argument('--keys', type=int, nargs='+', default=[10, 1000, 100000])
+    parser.add_argument('--workers', type=int, default=16)
+    args = parser.parse_args()
+
+    os.environ['DASELEMENT_CLI'] = os.path.join(HERE, 'stub_cli.py')
+    os.environ['STUB_CLI_ELEMENTS'] = str(args.elements)
+
+    from daselement_api import api as de
+
+    for key_count in args.keys:
+        element_ids = list(range(1, key_count + 1))
+        for strategy, threshold in (('parallel', float('inf')), ('scan', 0)):
+            if strategy == 'parallel' and key_count > MAX_PARALLEL_KEYS:
+                continue
+            de.BULK_SCAN_THRESHOLD = threshold
+            start = time.perf_counter()
+            elements = de.get_elements_by_ids(LIBRARY_PATH,
+                                              element_ids,
+                                              workers=args.workers)
+            print(json.dumps({
+                'keys': key_count,
+                'strategy': strategy,
+                'found': sum(1 for element in elements.values() if element),
+                'total_s': time.perf_counter() - start
+            }))
+
+
+if __name__ == '__main__':
+    main()
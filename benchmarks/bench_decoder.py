@@ -0,0 +1,79 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Compare the decoding of a large get-elements output of the stub CLI:
+the previous text decode with the json module against parsing the bytes
+with each installed backend, and the raw bytes without parsing.
+
+Usage: python benchmarks/bench_decoder.py [--elements 100000] [--repeat 3]
+'''
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+LIBRARY_PATH = '/mnt/library/das-element.lib'
+
+
+def best_of(function, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--elements', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ['DASELEMENT_CLI'] = os.path.join(HERE, 'stub_cli.py')
+    os.environ['STUB_CLI_ELEMENTS'] = str(args.elements)
+
+    from daselement_api import api as de
+    from daselement_api import decoder
+
+    output = subprocess.check_output(
+        [os.environ['DASELEMENT_CLI'], 'get-elements', LIBRARY_PATH])
+
+    def report(mode, function):
+        print(json.dumps({
+            'elements': args.elements,
+            'bytes': len(output),
+            'mode': mode,
+            'best_s': best_of(function, args.repeat)
+        }))
+
+    # decode only
+    report('text+json', lambda: json.loads(
+        output.decode('utf8', 'ignore').strip('\n')))
+    for backend in decoder.BACKENDS:
+        try:
+            decoder.set_backend(backend)
+        except ImportError:
+            continue
+        report('bytes+' + backend, lambda: decoder.loads(output))
+    decoder.set_backend()
+
+    # whole call including the stub CLI
+    report('get_elements+' + decoder.backend,
+           lambda: de.get_elements(LIBRARY_PATH))
+    report('get_elements.raw', lambda: de.get_elements.raw(LIBRARY_PATH))
+
+
+if __name__ == '__main__':
+    main()
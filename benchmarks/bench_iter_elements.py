@@ -0,0 +1,77 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Compare peak memory and time to first element of api.iter_elements,
+api.get_elements and api.get_elements_compact against the stub CLI.
+
+Usage: python benchmarks/bench_iter_elements.py [--elements 100000]
+'''
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+LIBRARY_PATH = '/mnt/library/das-element.lib'
+
+
+def measure(mode):
+    from daselement_api import api as de
+
+    start = time.perf_counter()
+    first = None
+    count = 0
+    if mode == 'iter':
+        elements = de.iter_elements(LIBRARY_PATH)
+    elif mode == 'compact':
+        elements = de.get_elements_compact(LIBRARY_PATH)
+    else:
+        elements = de.get_elements(LIBRARY_PATH)
+    for _ in elements:
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+
+    return {
+        'mode': mode,
+        'elements': count,
+        'first_element_s': first,
+        'total_s': time.perf_counter() - start,
+        # kilobytes on Linux, bytes on MacOS
+        'peak_rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--elements', type=int, default=100000)
+    parser.add_argument('--mode', choices=['get', 'iter', 'compact'])
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(measure(args.mode)))
+        return
+
+    environment = dict(os.environ,
+                       DASELEMENT_CLI=os.path.join(HERE, 'stub_cli.py'),
+                       STUB_CLI_ELEMENTS=str(args.elements))
+    for mode in ('get', 'iter', 'compact'):
+        # separate processes, the peak RSS can only grow within a process
+        output = subprocess.check_output(
+            [sys.executable, __file__, '--mode', mode], env=environment)
+        print(output.decode('utf8').strip())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Benchmark the in-process disk scanner (api.iter_paths_from_disk) on a
+synthetic show tree with empty frame files.
+
+Usage: python benchmarks/bench_scanner.py [--files 1000000] [--workers 1 8 32] [--cli]
+
+With --cli the real CLI (DASELEMENT_CLI_FULL) runs get_paths_from_disk on
+the same tree for comparison.
+'''
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+FRAMES_PER_SEQUENCE = 100
+SEQUENCES_PER_DIRECTORY = 10
+
+
+def create_tree(root, file_count):
+    sequence_count = max(1, file_count // FRAMES_PER_SEQUENCE)
+    for sequence in range(sequence_count):
+        directory = os.path.join(
+            root, 'seq_{:03d}'.format(sequence // 1000),
+            'shot_{:04d}'.format(sequence // SEQUENCES_PER_DIRECTORY),
+            'plate')
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        for frame in range(1001, 1001 + FRAMES_PER_SEQUENCE):
+            path = os.path.join(
+                directory, 'plate_{:02d}.{:04d}.exr'.format(
+                    sequence % SEQUENCES_PER_DIRECTORY, frame))
+            open(path, 'w').close()
+    return sequence_count
+
+
+def measure(name, paths):
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in paths:
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    print(json.dumps({
+        'scanner': name,
+        'paths': count,
+        'first_path_s': first,
+        'total_s': time.perf_counter() - start
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=1000000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--cli', action='store_true')
+    args = parser.parse_args()
+
+    from daselement_api import api as de
+
+    root = tempfile.mkdtemp(prefix='daselement_bench_scanner_')
+    try:
+        start = time.perf_counter()
+        sequences = create_tree(root, args.files)
+        print(json.dumps({
+            'files': sequences * FRAMES_PER_SEQUENCE,
+            'sequences': sequences,
+            'create_s': time.perf_counter() - start
+        }))
+
+        for workers in args.workers:
+            measure('python_workers_{}'.format(workers),
+                    de.iter_paths_from_disk(root, workers=workers))
+
+        if args.cli:
+            measure('cli', de.get_paths_from_disk(root))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
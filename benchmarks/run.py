@@ -0,0 +1,362 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Benchmark suite of the API against the stub CLI (benchmarks/stub_cli.py).
+
+Scenarios:
+
+- `overhead`: time per call of the API compared to starting the stub CLI directly, per startup latency
+- `get_elements`: throughput and peak memory of get_elements and iter_elements per library size
+- `lookup`: latency percentiles of get_element_by_id, get_element_by_uuid and get_element_by_name
+- `ingest`: throughput of ingest_many
+- `update`: throughput of update_many
+
+The results are written as JSON, a previous result file can be compared
+with `--compare`.
+
+Usage:
+
+```
+python benchmarks/run.py --output results.json
+python benchmarks/run.py --scenarios get_elements --elements 1000 100000 1000000
+python benchmarks/run.py --output new.json --compare results.json
+```
+'''
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+
+STUB_CLI = os.path.join(HERE, 'stub_cli.py')
+LIBRARY_PATH = '/mnt/library/das-element.lib'
+SCENARIOS = ('overhead', 'get_elements', 'lookup', 'ingest', 'update')
+
+
+def set_stub_environment(elements=1000, startup=0.0):
+    os.environ['DASELEMENT_CLI'] = STUB_CLI
+    os.environ['DASELEMENT_CLI_FULL'] = STUB_CLI
+    os.environ['STUB_CLI_ELEMENTS'] = str(elements)
+    os.environ['STUB_CLI_STARTUP'] = str(startup)
+
+    from daselement_api import manager
+    manager.EXECUTABLE_CLI = STUB_CLI
+    manager.EXECUTABLE_CLI_FULL = STUB_CLI
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    if not values:
+        return None
+    rank = (len(values) - 1) * percent / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def latency_stats(durations):
+    return {
+        'calls': len(durations),
+        'mean_s': sum(durations) / len(durations),
+        'p50_s': percentile(durations, 50),
+        'p90_s': percentile(durations, 90),
+        'p99_s': percentile(durations, 99),
+        'max_s': max(durations)
+    }
+
+
+def get_peak_rss():
+    # kilobytes on Linux, bytes on MacOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+# --- scenarios ---
+
+
+def bench_overhead(args):
+    from daselement_api import api as de
+
+    results = []
+    for startup in args.startup:
+        set_stub_environment(startup=startup)
+        direct = []
+        for _ in range(args.calls):
+            start = time.perf_counter()
+            subprocess.run([STUB_CLI, 'get-libraries'],
+                           stdout=subprocess.PIPE,
+                           check=True)
+            direct.append(time.perf_counter() - start)
+
+        api = []
+        for _ in range(args.calls):
+            start = time.perf_counter()
+            de.get_libraries()
+            api.append(time.perf_counter() - start)
+
+        stats = latency_stats(api)
+        stats['direct_mean_s'] = sum(direct) / len(direct)
+        stats['overhead_s'] = stats['mean_s'] - stats['direct_mean_s']
+        results.append(dict({
+            'scenario': 'overhead',
+            'startup': startup
+        }, **stats))
+    return results
+
+
+def measure_get_elements(mode):
+    # runs in its own process, the peak RSS only grows within a process
+    from daselement_api import api as de
+
+    start = time.perf_counter()
+    first = None
+    count = 0
+    elements = de.iter_elements(
+        LIBRARY_PATH) if mode == 'iter' else de.get_elements(LIBRARY_PATH)
+    for _ in elements:
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+    return {
+        'count': count,
+        'first_element_s': first,
+        'total_s': total,
+        'elements_per_s': count / total if total else None,
+        'peak_rss_kb': get_peak_rss()
+    }
+
+
+def bench_get_elements(args):
+    results = []
+    for elements in args.elements:
+        for mode in ('get', 'iter'):
+            environment = dict(os.environ,
+                               DASELEMENT_CLI=STUB_CLI,
+                               DASELEMENT_CLI_FULL=STUB_CLI,
+                               STUB_CLI_ELEMENTS=str(elements),
+                               STUB_CLI_STARTUP='0')
+            output = subprocess.check_output(
+                [sys.executable, __file__, '--measure-get-elements', mode],
+                env=environment)
+            results.append(
+                dict({
+                    'scenario': 'get_elements',
+                    'elements': elements,
+                    'mode': mode
+                }, **json.loads(output)))
+    return results
+
+
+def bench_lookup(args):
+    from daselement_api import api as de
+
+    results = []
+    for elements in args.elements:
+        set_stub_environment(elements=elements)
+        randomizer = random.Random(elements)
+        indices = [randomizer.randrange(elements) for _ in range(args.calls)]
+        library = de.iter_elements(LIBRARY_PATH)
+        # uuid and name of the looked up elements, without keeping the library in memory
+        wanted = set(indices)
+        keys = {}
+        for index, element in enumerate(library):
+            if index in wanted:
+                keys[index] = (element['uuid'], element['name'])
+
+        lookups = (
+            ('id', lambda index: de.get_element_by_id(LIBRARY_PATH, index + 1)),
+            ('uuid', lambda index: de.get_element_by_uuid(
+                keys[index][0], library_path=LIBRARY_PATH)),
+            ('name', lambda index: de.get_element_by_name(
+                LIBRARY_PATH, keys[index][1])),
+        )
+        for kind, lookup in lookups:
+            durations = []
+            for index in indices:
+                start = time.perf_counter()
+                lookup(index)
+                durations.append(time.perf_counter() - start)
+            results.append(
+                dict({
+                    'scenario': 'lookup',
+                    'elements': elements,
+                    'kind': kind
+                }, **latency_stats(durations)))
+    return results
+
+
+def bench_ingest(args):
+    from daselement_api import api as de
+
+    set_stub_environment()
+    items = [{
+        'path': '/mnt/source/shot_{:04d}/plate.1001-1100#.exr'.format(index),
+        'mapping': 'copy & rename',
+        'category': 'Q3196',
+        'tags': ['fire', 'flame'],
+        'metadata': {
+            'shot': 'shot_{:04d}'.format(index)
+        }
+    } for index in range(args.items)]
+
+    start = time.perf_counter()
+    results = de.ingest_many(LIBRARY_PATH, items, workers=args.workers)
+    total = time.perf_counter() - start
+    return [{
+        'scenario': 'ingest',
+        'items': len(items),
+        'workers': args.workers,
+        'failed': sum(1 for result in results if not result.ok),
+        'total_s': total,
+        'items_per_s': len(items) / total
+    }]
+
+
+def bench_update(args):
+    from daselement_api import api as de
+
+    set_stub_environment(elements=max(args.items, 1000))
+    updates = [(element_id, {
+        'rating': element_id % 6
+    }) for element_id in range(1, args.items + 1)]
+
+    start = time.perf_counter()
+    results = de.update_many(LIBRARY_PATH,
+                             'Element',
+                             updates,
+                             workers=args.workers)
+    total = time.perf_counter() - start
+    return [{
+        'scenario': 'update',
+        'items': len(updates),
+        'workers': args.workers,
+        'failed': sum(1 for result in results if not result.ok),
+        'total_s': total,
+        'items_per_s': len(updates) / total
+    }]
+
+
+BENCHMARKS = {
+    'overhead': bench_overhead,
+    'get_elements': bench_get_elements,
+    'lookup': bench_lookup,
+    'ingest': bench_ingest,
+    'update': bench_update
+}
+
+# --- results ---
+
+
+def get_metadata():
+    from daselement_api import _version
+
+    try:
+        revision = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT,
+            stderr=subprocess.DEVNULL).decode('utf8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+
+    return {
+        'version': _version.__version__,
+        'revision': revision,
+        'created_at': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def get_result_key(result):
+    # the parameters of a result are all values that are not measurements
+    return tuple(
+        sorted((key, value) for key, value in result.items()
+               if not key.endswith(('_s', '_per_s', '_kb'))
+               and key not in ('calls', 'count', 'failed')))
+
+
+def compare(previous, current):
+    '''
+    Print the change of each measurement against a previous run.
+    '''
+    previous_results = {
+        get_result_key(result): result
+        for result in previous['results']
+    }
+    print('Compared to {} ({})'.format(previous['meta'].get('version'),
+                                       previous['meta'].get('revision')))
+    for result in current['results']:
+        before = previous_results.get(get_result_key(result))
+        if before is None:
+            continue
+        changes = []
+        for key, value in result.items():
+            if (key.endswith(('_s', '_kb')) and isinstance(value, (int, float))
+                    and before.get(key)):
+                changes.append('{} {:+.1f}%'.format(
+                    key, (value / before[key] - 1) * 100))
+        print('{}: {}'.format(
+            ', '.join('{}={}'.format(key, value)
+                      for key, value in get_result_key(result)),
+            ', '.join(changes)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS,
+                        default=list(SCENARIOS))
+    parser.add_argument('--elements', type=int, nargs='+',
+                        default=[1000, 100000],
+                        help='library sizes, up to 1000000')
+    parser.add_argument('--startup', type=float, nargs='+', default=[0.0, 0.05],
+                        help='startup latencies of the stub CLI in seconds')
+    parser.add_argument('--calls', type=int, default=50,
+                        help='calls per latency measurement')
+    parser.add_argument('--items', type=int, default=500,
+                        help='items per bulk ingest and update')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--output', help='file path of the JSON results')
+    parser.add_argument('--compare', help='file path of previous JSON results')
+    parser.add_argument('--measure-get-elements', choices=['get', 'iter'],
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure_get_elements:
+        print(json.dumps(measure_get_elements(args.measure_get_elements)))
+        return
+
+    set_stub_environment()
+    report = {'meta': get_metadata(), 'results': []}
+    for scenario in args.scenarios:
+        for result in BENCHMARKS[scenario](args):
+            print(json.dumps(result))
+            report['results'].append(result)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as previous:
+            compare(json.load(previous), report)
+
+
+if __name__ == '__main__':
+    main()
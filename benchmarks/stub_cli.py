@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Synthetic stand-in for the das-element-cli used by the benchmarks.
+
+Point the environment variables DASELEMENT_CLI and DASELEMENT_CLI_FULL at this
+file. Every library path resolves to a generated library with realistic
+element, category and tag payloads.
+
+Environment variables:
+
+- `STUB_CLI_ELEMENTS`: number of elements per library (Default: 1000)
+- `STUB_CLI_STARTUP`: startup latency of each call in seconds (Default: 0)
+- `STUB_CLI_MODEL_LOAD`: model load time of each predict and get-meaningful-frame call in seconds (Default: 0)
+'''
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+CATEGORIES = [
+    ('Q3196', 'fire', 'rapid oxidation of a material'),
+    ('Q235544', 'flame', 'visible, gaseous part of a fire'),
+    ('Q327954', 'torch', 'stick with a flaming end used as a source of light'),
+    ('Q7946', 'smoke', 'mixture of gases and suspended particles'),
+    ('Q3881', 'water', 'chemical compound'),
+    ('Q8068', 'explosion', 'rapid increase in volume'),
+    ('Q11663', 'weather', 'state of the atmosphere'),
+    ('Q1144593', 'debris', 'wreckage of something destroyed'),
+]
+CATEGORY_PARENTS = {'Q235544': 'Q3196', 'Q327954': 'Q235544', 'Q7946': 'Q3196'}
+TAGS = [('Q{}'.format(100000 + index), 'tag_{:02d}'.format(index))
+        for index in range(50)]
+MEDIA_TYPES = ['image', 'sequence', 'sequence', 'sequence', 'movie']
+RESOLUTIONS = [(1920, 1080), (2048, 1152), (3840, 2160), (4096, 2160),
+               (6144, 3160)]
+
+
+def element_count():
+    return int(os.getenv('STUB_CLI_ELEMENTS') or 1000)
+
+
+def library_prefix(library_path):
+    return hashlib.md5(library_path.encode('utf8')).hexdigest()[:20]
+
+
+def make_uuid(library_path, index):
+    return '{}{:012x}'.format(library_prefix(library_path), index)
+
+
+def make_category(category_id):
+    for index, (id_, name, description) in enumerate(CATEGORIES):
+        if id_ == category_id:
+            category = {
+                'child_counter': index,
+                'description': description,
+                'id': id_,
+                'name': name,
+                'type': 'default'
+            }
+            parent_id = CATEGORY_PARENTS.get(id_)
+            if parent_id:
+                category['parents'] = [{'id': parent_id}]
+            return category
+    return None
+
+
+def make_tag(index):
+    id_, name = TAGS[index]
+    return {
+        'elements_count': 100 + index,
+        'id': id_,
+        'name': name,
+        'type': 'default'
+    }
+
+
+def make_element(library_path, index):
+    category_id = CATEGORIES[index % len(CATEGORIES)][0]
+    category = make_category(category_id)
+    media_type = MEDIA_TYPES[index % len(MEDIA_TYPES)]
+    width, height = RESOLUTIONS[index % len(RESOLUTIONS)]
+    frame_count = 1 if media_type == 'image' else 24 + index % 200
+    name = '{}_{:05d}'.format(category['name'], index + 1)
+    root = '/mnt/library/{}/{}'.format(category['name'], name)
+    return {
+        'category': category,
+        'category_id': category_id,
+        'channel': 3 + index % 2,
+        'colorspace': 'ACES2065-1' if index % 3 else 'sRGB',
+        'colorspace_source': 'ACES2065-1' if index % 3 else 'sRGB',
+        'created_at': '2022-05-{:02d}T08:26:52.{:06d}'.format(
+            1 + index % 28, index % 1000000),
+        'feature_id': 1,
+        'frame_count': frame_count,
+        'frame_first': 1001,
+        'frame_last': 1000 + frame_count,
+        'frame_rate': '' if media_type == 'image' else '24',
+        'height': height,
+        'id': index + 1,
+        'media_type': media_type,
+        'name': name,
+        'number': '{:05d}'.format(index + 1),
+        'path': '{}/main_{}x{}_source/{}.####.exr'.format(
+            root, width, height, name),
+        'path_filmstrip': '{}/filmstrip_11520x270_srgb/{}.jpg'.format(
+            root, name),
+        'path_proxy': '{}/proxy_1920x1080_srgb/{}.mov'.format(root, name),
+        'path_source': '/mnt/source/{}.####.exr'.format(name),
+        'path_thumbnail': '{}/thumb_960x540_srgb/{}.jpg'.format(root, name),
+        'pixel_aspect': '1',
+        'rating': str(index % 6),
+        'tags': [make_tag((index * step) % len(TAGS)) for step in (1, 7, 13)],
+        'uuid': make_uuid(library_path, index),
+        'width': width
+    }
+
+
+def write_elements(library_path):
+    write = sys.stdout.write
+    write('[')
+    for index in range(element_count()):
+        if index:
+            write(',')
+        write(json.dumps(make_element(library_path, index)))
+    write(']\n')
+
+
+def find_index(library_path, kind, value):
+    count = element_count()
+    if kind == 'id':
+        index = int(value) - 1
+    elif kind == 'uuid':
+        if not value.startswith(library_prefix(library_path)):
+            return None
+        index = int(value[20:], 16)
+    else:
+        index = int(value.rsplit('_', 1)[-1]) - 1
+    return index if 0 <= index < count else None
+
+
+def fail(message):
+    sys.stderr.write(message + '\n')
+    sys.exit(1)
+
+
+def main(arguments):
+    time.sleep(float(os.getenv('STUB_CLI_STARTUP') or 0))
+
+    if len(arguments) == 1 and arguments[0].startswith('@'):
+        # arguments file, one argument per line
+        with open(arguments[0][1:], encoding='utf8') as arguments_file:
+            arguments = arguments_file.read().splitlines()
+
+    if arguments[:1] == ['--config']:
+        arguments = arguments[2:]
+    command, arguments = arguments[0], arguments[1:]
+
+    def option(name, default=None):
+        if name in arguments:
+            return arguments[arguments.index(name) + 1]
+        return default
+
+    if command == 'get-libraries':
+        libraries = os.getenv('STUB_CLI_LIBRARIES',
+                              '/mnt/library/das-element.lib').split(os.pathsep)
+        result = {library: {'path': library} for library in libraries}
+    elif command == 'get-elements':
+        return write_elements(arguments[0])
+    elif command in ('get-element-by-id', 'get-element-by-name'):
+        library_path, value = arguments[0], arguments[1]
+        index = find_index(library_path, command.rsplit('-', 1)[-1], value)
+        if index is None:
+            fail('Element not found: {}'.format(value))
+        result = make_element(library_path, index)
+    elif command == 'get-element-by-uuid':
+        library_path = option('--library', '/mnt/library/das-element.lib')
+        index = find_index(library_path, 'uuid', arguments[0])
+        if index is None:
+            fail('Element not found: {}'.format(arguments[0]))
+        result = make_element(library_path, index)
+    elif command == 'get-categories':
+        result = [make_category(category[0]) for category in CATEGORIES]
+    elif command == 'get-tags':
+        result = [make_tag(index) for index in range(len(TAGS))]
+    elif command == 'update':
+        library_path, entity_type, entity_id, data = arguments[:4]
+        if entity_type.lower() != 'element':
+            result = dict({'id': entity_id}, **json.loads(data))
+        else:
+            result = make_element(library_path, int(entity_id) - 1)
+            result.update(json.loads(data))
+    elif command == 'ingest':
+        library_path = option('--library')
+        index = element_count() + int(time.time() * 1000) % 100000
+        result = make_element(library_path, index)
+        result['path_source'] = option('--path')
+    elif command == 'predict':
+        time.sleep(float(os.getenv('STUB_CLI_MODEL_LOAD') or 0))
+        top = int(option('--top', 2))
+        paths = [
+            argument for index, argument in enumerate(arguments)
+            if not argument.startswith('--') and
+            not arguments[index - 1].startswith('--')
+        ]
+        result = {}
+        for path in paths:
+            offset = int(hashlib.md5(path.encode('utf8')).hexdigest(), 16)
+            result[path] = [{
+                'tag': name,
+                'id': id_,
+                'value': id_,
+                'description': description
+            } for id_, name, description in (
+                CATEGORIES[(offset + rank) % len(CATEGORIES)]
+                for rank in range(top))]
+    elif command == 'get-meaningful-frame':
+        time.sleep(float(os.getenv('STUB_CLI_MODEL_LOAD') or 0))
+        offset = int(hashlib.md5(arguments[0].encode('utf8')).hexdigest(), 16)
+        result = 1001 + offset % 100
+    elif command in ('delete-element', 'delete-elements',
+                     'render-element-proxies'):
+        result = True
+    else:
+        fail('Unknown command: {}'.format(command))
+
+    sys.stdout.write(json.dumps(result) + '\n')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,203 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Asyncio front-end of daselement_api.api (Python 3 only)
+
+Every public function of daselement_api.api has an awaitable twin with the
+same arguments and result, and `quiet` / `raw` variants. The calls go
+through the same steps as the functions in daselement_api.api: the config
+file path, CLI executables, worker pool, caches, UUID routing, listeners and
+metrics hooks are the ones of the active session (see daselement_api.session).
+The CLI runs as an asyncio subprocess, the steps around it like cache lookups,
+loading a taxonomy or hashing media files for the result cache run in a
+thread of the event loop, so they never block the loop.
+
+The number of CLI processes running at the same time is limited per event
+loop by `MAX_CONCURRENCY`. Cancelling a call kills its CLI process.
+
+```python
+import asyncio
+from daselement_api import aio as de_aio
+
+async def main():
+    library_path = '/some/path/das-element.lib'
+    elements = await de_aio.get_elements(library_path)
+    entities = await asyncio.gather(
+        *[de_aio.get_element_by_id(library_path, element['id']) for element in elements])
+
+asyncio.run(main())
+```
+'''
+
+import asyncio
+import contextvars
+import functools
+import time
+import weakref
+
+from . import api
+from .manager import CommandCall
+
+MAX_CONCURRENCY = 8
+'''
+Maximum number of CLI processes running at the same time per event loop
+'''
+
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore():
+    loop = asyncio.get_running_loop()
+    limit, semaphore = _semaphores.get(loop, (None, None))
+    if limit != MAX_CONCURRENCY:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        _semaphores[loop] = (MAX_CONCURRENCY, semaphore)
+    return semaphore
+
+
+async def _run_process(command, record=None):
+    # kills the process if the task gets cancelled, even while it is started
+    started_at = time.perf_counter()
+    spawn = asyncio.ensure_future(
+        asyncio.create_subprocess_exec(*command,
+                                       stdout=asyncio.subprocess.PIPE,
+                                       stderr=asyncio.subprocess.PIPE))
+    process = None
+    try:
+        process = await asyncio.shield(spawn)
+        if record is not None:
+            record.spawn_time = time.perf_counter() - started_at
+        output, error = await process.communicate()
+    finally:
+        if process is None:
+            try:
+                process = await spawn
+            except Exception:
+                process = None
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    if record is not None:
+        record.stdout_bytes = len(output)
+        record.stderr_bytes = len(error)
+    return process.returncode, output, error
+
+
+async def execute_command(arguments,
+                          cli_full=False,
+                          verbose=True,
+                          raw=False,
+                          executable=None,
+                          pool=None,
+                          hooks=None):
+    '''
+    Awaitable twin of daselement_api.manager.execute_command.
+    A call of the worker pool runs in a thread of the event loop.
+    '''
+    call = CommandCall(arguments,
+                       cli_full=cli_full,
+                       executable=executable,
+                       pool=pool,
+                       hooks=hooks)
+    try:
+        async with _get_semaphore():
+            if call.pool is not None:
+                loop = asyncio.get_running_loop()
+                returncode, output, error = call.worker_output(
+                    *await loop.run_in_executor(None, call.pool.run,
+                                                call.arguments))
+            else:
+                returncode, output, error = await _run_process(
+                    call.process_command, call.record)
+        return call.parse(returncode, output, error, verbose=verbose, raw=raw)
+    except BaseException as call_error:
+        call.failed(call_error)
+        raise
+    finally:
+        call.close()
+
+
+async def _call(function, args, kwargs, verbose=True, raw=False):
+    # the caches, routing and listeners of the sync call run in a thread,
+    # they might call the CLI themselves, like loading a taxonomy.
+    # The thread runs with the context of the task for its active session
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    calls = function.steps(args, kwargs, verbose=verbose, raw=raw)
+
+    def advance(method, *value):
+        # StopIteration can not be raised into a future
+        try:
+            return False, context.run(method, *value)
+        except StopIteration as stop:
+            return True, stop.value
+
+    def step(method, *value):
+        return loop.run_in_executor(None, advance, method, *value)
+
+    done, request = await step(next, calls)
+    while not done:
+        session, command, cli_full, call_verbose, call_raw = request
+        try:
+            result = await execute_command(
+                command,
+                cli_full=cli_full,
+                verbose=call_verbose,
+                raw=call_raw,
+                executable=session.get_executable(cli_full),
+                pool=session.get_pool(cli_full),
+                hooks=session.hooks)
+        except BaseException as error:
+            done, request = await step(calls.throw, error)
+        else:
+            done, request = await step(calls.send, result)
+    return request
+
+
+def _awaitable(function):
+
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs):
+        return await _call(function, args, kwargs)
+
+    async def quiet(*args, **kwargs):
+        return await _call(function, args, kwargs, verbose=False)
+
+    async def raw(*args, **kwargs):
+        return await _call(function, args, kwargs, raw=True)
+
+    wrapper.quiet = quiet
+    wrapper.raw = raw
+    return wrapper
+
+
+create_config = _awaitable(api.create_config)
+get_config_presets = _awaitable(api.get_config_presets)
+get_library_presets = _awaitable(api.get_library_presets)
+create_library = _awaitable(api.create_library)
+get_libraries = _awaitable(api.get_libraries)
+get_library_template_mappings = _awaitable(api.get_library_template_mappings)
+add_library = _awaitable(api.add_library)
+remove_library = _awaitable(api.remove_library)
+get_categories = _awaitable(api.get_categories)
+get_category = _awaitable(api.get_category)
+get_tags = _awaitable(api.get_tags)
+get_tag = _awaitable(api.get_tag)
+get_elements = _awaitable(api.get_elements)
+get_element_by_id = _awaitable(api.get_element_by_id)
+get_element_by_uuid = _awaitable(api.get_element_by_uuid)
+get_element_by_name = _awaitable(api.get_element_by_name)
+update = _awaitable(api.update)
+delete_element = _awaitable(api.delete_element)
+delete_elements = _awaitable(api.delete_elements)
+ingest = _awaitable(api.ingest)
+predict = _awaitable(api.predict)
+get_paths_from_disk = _awaitable(api.get_paths_from_disk)
+get_meaningful_frame = _awaitable(api.get_meaningful_frame)
+render_element_proxies = _awaitable(api.render_element_proxies)
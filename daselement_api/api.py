@@ -8,7 +8,7 @@
 """
 ## Das Element Python API
 
-API works for both Python 2 & 3
+API works with Python 3.7 and newer
 
 
 ---
@@ -48,18 +48,435 @@ for library, library_config_data in libraries.items():
 The library information is taken from the config file that is set for the current workstation.
 Either defined in the `~/.das-element/setup.ini` file or by the environment variable `DASELEMENT_CONFIG_PATH`
 
+Each function that calls the CLI has a `raw` variant that returns the JSON output of the CLI as bytes,
+to forward it unchanged without decoding it: `de.get_elements.raw(library_path)`
+
+The functions run on the default session, defined by `config` and the environment variables.
+To use several configs or CLI versions at the same time, e.g. from different threads,
+create a `Session` for each of them. A session has all functions of this module as methods
+and its own caches, worker processes and metrics hooks:
+
+```python
+from daselement_api import api as de
+
+session = de.Session(config='/some/path/my-config.conf', cli='/path/to/das-element-cli_2.0.3_lin')
+libraries = session.get_libraries()
+```
+
 """
 
-from .manager import execute_command, as_quoted_string, as_quoted_dict
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+
+from .batch import WORKERS as BATCH_WORKERS, Result, batch, map as batch_map
+from . import decoder
+from .cache import ElementCache
+from .index import ElementIndex
+from .journal import IngestJournal
+from .pipeline import IngestPipeline, read_manifest
+from .query import QueryIndex
+from .render import RenderScheduler
+from .result_cache import ResultCache
+from .routing import UUIDRouter
+from .session import Session, get_session
+from .table import build_table, import_numpy
+from .taxonomy import TaxonomyCache
+from . import scanner
+from .manager import (
+    CommandError,
+    command_fits,
+    as_quoted_string,
+    as_quoted_dict,
+)
+
+
+def __getattr__(name):
+    # `de.map` runs `batch.map`, it is not a global of this module
+    # to keep the builtin map
+    if name == "map":
+        return batch_map
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
 
 config = None
 """
 Variabel to define a custom config file path (.conf)
+of the default session. Use a `Session` for several configs at the same time.
+
+---
+"""
+
+
+element_cache = None
+"""
+In-process cache for element lookups of the default session. Disabled by default, see `enable_element_cache`
+
+---
+"""
+
+BULK_SCAN_THRESHOLD = 200
+"""
+Number of keys from which the bulk lookups (`get_elements_by_ids`, ...) scan all elements of the library
+instead of looking up each key on its own, as long as the size of the library is unknown.
+Once a library was scanned, the faster way is chosen from the measured cost of a CLI call,
+the scan time per element and the number of elements
+
+---
+"""
+
+uuid_router = None
+"""
+Routing table from element UUID to library of the default session. Disabled by default, see `enable_uuid_routing`
+
+---
+"""
+
+result_cache = None
+"""
+Persistent cache for the results of `predict` and `get_meaningful_frame` of the default session. Disabled by default, see `enable_result_cache`
 
 ---
 """
 
+taxonomy_cache = None
+"""
+In-process cache of the tags and categories of each library of the default session. Disabled by default, see `enable_taxonomy_cache`
+
+---
+"""
+
+_listeners = []
+
+# the calls that change data the listeners keep track of
+_WRITE_COMMANDS = ("update", "ingest", "delete_element", "delete_elements",
+                   "render_element_proxies")
+
+
+def _notify(session, name, arguments, result):
+    for listener in list(session.listeners):
+        listener(session.config, name, arguments, result)
+
+
+def _config_arguments():
+    # custom config file of the active session
+    config_path = get_session().config
+    return ["--config", config_path] if config_path else []
+
+
+def _command(cli_full=False, lookup=None, routed=False, cached_result=False, chunked=None,
+             taxonomy=None):
+    # the decorated function builds the CLI arguments,
+    # the builder is kept as `build_command` to be reused by other front-ends
+    # lookup: (kind, argument name) of an element lookup served by the element cache
+    # routed: a missing library path gets resolved by the UUID routing table
+    # cached_result: the result only depends on the media content and is served by the result cache
+    # chunked: name of a list argument that gets split into several calls if the command is too long
+    # taxonomy: (kind, argument name or None) of a tag / category lookup served by the taxonomy cache
+    def decorator(build_command):
+        signature = inspect.signature(build_command)
+        name = build_command.__name__
+
+        def steps(args, kwargs, verbose=True, raw=False):
+            # generator of the call: yields each CLI call as
+            # (session, command, cli_full, verbose, raw) and gets its result sent back,
+            # the sync `call` and the asyncio front-end only differ in how they run the CLI
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            session = get_session()
+            config = session.config
+
+            # raw calls return the bytes of the CLI and bypass the caches
+            cache = session.element_cache if lookup and not raw else None
+            if cache is not None:
+                element = cache.get(config, arguments.get("library_path"),
+                                    lookup[0], arguments[lookup[1]])
+                if element is not None:
+                    return element
+
+            # cached elements are found by UUID without a library path, only route CLI calls
+            router = session.uuid_router if routed else None
+            if router is not None and not arguments.get("library_path"):
+                arguments["library_path"] = router.route(
+                    config, arguments["element_uuid"])
+
+            taxonomies = session.taxonomy_cache if taxonomy and not raw else None
+            if taxonomies is not None:
+                key = arguments[taxonomy[1]] if taxonomy[1] else None
+                entity = taxonomies.lookup(config, arguments["library_path"],
+                                           taxonomy[0], key)
+                # unknown names go to the CLI, the entity might be new
+                if entity is not None:
+                    return entity
+
+            results = session.result_cache if cached_result and not raw else None
+            result_key = results.get_key(name, arguments) if results else None
+            if result_key is not None:
+                found, result = results.get(result_key)
+                if found:
+                    return result
+
+            result = None
+            try:
+                result = yield from run(session, arguments, verbose, raw)
+            finally:
+                # listeners get notified about failed calls as well,
+                # a failed write might have changed data partially.
+                # The raw output is only decoded for writes, the listeners skip reads
+                if raw and result is not None and session.listeners:
+                    _notify(session, name, arguments,
+                            decoder.loads(result) if name in _WRITE_COMMANDS else None)
+                else:
+                    _notify(session, name, arguments, result)
+
+            if cache is not None:
+                cache.put(config, arguments.get("library_path"), result)
+            if result_key is not None:
+                results.put(result_key, result)
+            return result
+
+        def run(session, arguments, verbose, raw=False):
+            if chunked:
+                arguments[chunked] = list(arguments[chunked])
+            command = build_command(**arguments)
+            values = arguments[chunked] if chunked else None
+            if values is None or len(values) < 2 or command_fits(command):
+                return (yield (session, command, cli_full, verbose, raw))
+
+            # split the list until each part fits on the command line
+            middle = len(values) // 2
+            parts = []
+            for part in (values[:middle], values[middle:]):
+                parts.append((yield from run(session, dict(arguments, **{chunked: part}),
+                                             verbose)))
+            result = all(parts)
+            return json.dumps(result).encode("utf8") if raw else result
+
+        def call(args, kwargs, verbose=True, raw=False):
+            calls = steps(args, kwargs, verbose=verbose, raw=raw)
+            try:
+                request = next(calls)
+                while True:
+                    session, command, full, call_verbose, call_raw = request
+                    try:
+                        result = session.execute(command,
+                                                 cli_full=full,
+                                                 verbose=call_verbose,
+                                                 raw=call_raw)
+                    except Exception as error:
+                        request = calls.throw(error)
+                    else:
+                        request = calls.send(result)
+            except StopIteration as stop:
+                return stop.value
+
+        @functools.wraps(build_command)
+        def wrapper(*args, **kwargs):
+            return call(args, kwargs)
+
+        def quiet(*args, **kwargs):
+            # same call without printing the failed command
+            return call(args, kwargs, verbose=False)
+
+        def raw(*args, **kwargs):
+            # same call returning the undecoded JSON output of the CLI as bytes
+            return call(args, kwargs, raw=True)
+
+        wrapper.quiet = quiet
+        wrapper.raw = raw
+        wrapper.steps = steps
+        wrapper.build_command = build_command
+        wrapper.cli_full = cli_full
+        return wrapper
+
+    return decorator
+
+
+def enable_element_cache(maxsize=1024, ttl=None):
+    """
+    Enable the in-process cache for `get_element_by_id`, `get_element_by_uuid` and `get_element_by_name`.
+    The lookups for the same element share one cache entry.
+    Cached elements get invalidated by `update`, `delete_element`, `delete_elements`, `ingest` and `render_element_proxies`.
+
+    **Args**:
+    > - **maxsize** (int): *[optional] Maximum number of cached elements*
+    > - **ttl** (float): *[optional] Seconds until a cached element expires*
+
+    **Returns**:
+    > - ElementCache
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    cache = de.enable_element_cache(maxsize=10000, ttl=300)
+
+    element = de.get_element_by_id('/some/path/das-element.lib', 1)
+    print(cache.stats())
+    ```
+
+    **Example result**:
+    `{'hits': 0, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 10000}`
+    """
+    session = get_session()
+    with session.lock:
+        disable_element_cache()
+        session.element_cache = cache = ElementCache(maxsize=maxsize, ttl=ttl)
+        session.listeners.append(cache.on_command)
+    return cache
+
+
+def disable_element_cache():
+    """
+    Disable and clear the in-process cache for element lookups.
+    """
+    session = get_session()
+    with session.lock:
+        cache, session.element_cache = session.element_cache, None
+        if cache is not None:
+            session.listeners.remove(cache.on_command)
+            cache.clear()
+
+
+def enable_result_cache(path=None, max_size=256 * 1024 * 1024):
+    """
+    Enable the persistent cache for `predict`, `predict_many` and `get_meaningful_frame`.
+    Cached results are returned without calling the CLI.
+
+    A result is keyed by the file path, the size and modification time of the file or of each frame of the sequence,
+    the content of the model file and the other arguments. Changed files get predicted again.
+    Directories are not cached.
+    The cache file can be used by several processes at the same time.
+
+    **Args**:
+    > - **path** (str): *[optional] File path of the cache file (Default: environment variable `DASELEMENT_RESULT_CACHE` or ~/.das-element/cache/results.db)*
+    > - **max_size** (int): *[optional] Maximum size of the cached results in bytes, the least recently used results get removed*
+
+    **Returns**:
+    > - ResultCache
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    cache = de.enable_result_cache()
+
+    frame = de.get_meaningful_frame('/some/file/path.1001-1099#.exr')
+    print(cache.stats())
+    ```
+
+    **Example result**:
+    `{'hits': 0, 'misses': 1, 'evictions': 0, 'entries': 1, 'size': 4, 'max_size': 268435456}`
+    """
+    session = get_session()
+    with session.lock:
+        disable_result_cache()
+        session.result_cache = cache = ResultCache(path=path,
+                                                   max_size=max_size)
+    return cache
+
+
+def disable_result_cache():
+    """
+    Disable the persistent result cache. The cache file is kept.
+    """
+    session = get_session()
+    with session.lock:
+        cache, session.result_cache = session.result_cache, None
+        if cache is not None:
+            cache.close()
+
+
+def enable_taxonomy_cache(max_age=300):
+    """
+    Enable the in-process cache of the tags and categories of each library.
+    `get_tags`, `get_tag`, `get_categories` and `get_category` are served from the cache
+    and `get_taxonomy` answers questions about the category hierarchy without a CLI call.
+
+    All tags and categories of a library are loaded on first use and again after `max_age` seconds.
+    `update` calls for a tag or category, element updates with tags and `ingest` with tags
+    of this process reload them on the next use.
+    Ingests, deletes and element updates of this process change the `elements_count`,
+    `get_tags`, `get_tag`, `get_categories` and `get_category` load them again on their next call.
+
+    **Args**:
+    > - **max_age** (float): *[optional] Seconds until the tags and categories get loaded again. None keeps them until a change in this process*
+
+    **Returns**:
+    > - TaxonomyCache
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    de.enable_taxonomy_cache(max_age=600)
+
+    tag = de.get_tag(library_path, 'fire')
+    ```
+    """
+    session = get_session()
+    with session.lock:
+        disable_taxonomy_cache()
+        session.taxonomy_cache = cache = TaxonomyCache(max_age=max_age)
+        session.listeners.append(cache.on_command)
+    return cache
+
+
+def disable_taxonomy_cache():
+    """
+    Disable and clear the in-process cache of tags and categories.
+    """
+    session = get_session()
+    with session.lock:
+        cache, session.taxonomy_cache = session.taxonomy_cache, None
+        if cache is not None:
+            session.listeners.remove(cache.on_command)
+            cache.clear()
+
+
+def get_taxonomy(library_path):
+    """
+    Get the tags and categories of the library with the category hierarchy.
+    Tags and categories are found by ID or name, the ancestors and descendants of each category are precomputed.
+    Uses the taxonomy cache if it is enabled, otherwise the tags and categories are loaded on each call.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+
+    **Returns**:
+    > - Taxonomy
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    de.enable_taxonomy_cache()
+
+    taxonomy = de.get_taxonomy(library_path)
+    taxonomy.get_category('flame')
+    taxonomy.ancestors('torch')
+    taxonomy.descendants('fire')
+    taxonomy.is_a('torch', 'fire')
+    taxonomy.parent_chain('torch')
+    ```
+
+    **Example result**:
+    `frozenset({'Q235544', 'Q3196'})`
+    """
+    session = get_session()
+    cache = session.taxonomy_cache
+    if cache is None:
+        return TaxonomyCache().load(library_path)
+    return cache.get(session.config, library_path)
 
+
+@_command(cli_full=True)
 def create_config(config_path, preset_key="blank", preset_path=None):
     """
     Create a new config file. Provide the preset key or file path to a config preset.
@@ -101,9 +518,10 @@ def create_config(config_path, preset_key="blank", preset_path=None):
 
     command += [as_quoted_string(config_path)]
 
-    return execute_command(command, cli_full=True)
+    return command
 
 
+@_command(cli_full=True)
 def get_config_presets():
     """
     Get all available config presets.
@@ -127,9 +545,10 @@ def get_config_presets():
     `das-element-cli get-config-presets`
     """
     command = ["get-config-presets"]
-    return execute_command(command, cli_full=True)
+    return command
 
 
+@_command(cli_full=True)
 def get_library_presets():
     """
     Get all available library presets.
@@ -153,9 +572,10 @@ def get_library_presets():
     `das-element-cli get-library-presets`
     """
     command = ["get-library-presets"]
-    return execute_command(command, cli_full=True)
+    return command
 
 
+@_command(cli_full=True)
 def create_library(
     library_path,
     name=None,
@@ -376,9 +796,10 @@ def create_library(
     if db_sslca_win:
         command += ["--db_sslca_win", as_quoted_string(db_sslca_win)]
 
-    return execute_command(command, cli_full=True)
+    return command
 
 
+@_command()
 def get_libraries():
     """
     Get all libraries data for current config.
@@ -396,11 +817,12 @@ def get_libraries():
         print(library_config_data)
     ```
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-libraries"]
-    return execute_command(command)
+    return command
 
 
+@_command()
 def get_library_template_mappings(library_path):
     """
     Get all template mappings data for library.
@@ -425,11 +847,12 @@ def get_library_template_mappings(library_path):
     **Example result**:
     `[{'key': 'copy & rename', 'value': {'extra': ['extra-job'], 'filmstrip': 'filmstrip', 'main': 'main', 'proxy': 'proxy mov', 'thumbnail': 'thumbnail'}}]`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-library-template-mappings", as_quoted_string(library_path)]
-    return execute_command(command)
+    return command
 
 
+@_command()
 def add_library(library_path, os_platform=None):
     """
     Add an existing library to the current config.
@@ -453,14 +876,15 @@ def add_library(library_path, os_platform=None):
     **Example result**:
     `true`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["add-library"]
     if os_platform is not None:
         command += ["--os", as_quoted_string(os_platform)]
     command += [as_quoted_string(library_path)]
-    return execute_command(command)
+    return command
 
 
+@_command()
 def remove_library(library_path, os_platform=None):
     """
     Remove an existing library to the current config.
@@ -484,14 +908,15 @@ def remove_library(library_path, os_platform=None):
     **Example result**:
     `true`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["remove-library"]
     if os_platform is not None:
         command += ["--os", as_quoted_string(os_platform)]
     command += [as_quoted_string(library_path)]
-    return execute_command(command)
+    return command
 
 
+@_command(taxonomy=("category", None))
 def get_categories(library_path):
     """
     Get all categories from the database for the library.
@@ -516,11 +941,12 @@ def get_categories(library_path):
     **Example result**:
     `[{'id': 'Q235544', 'type': 'default', 'name': 'flame', 'child_count': 5, 'child_counter': 5, 'parents': [{'description': 'rapid oxidation of a material; phenomenon that emits light and heat', 'id': 'Q3196', 'name': 'fire', 'synonyms': [{'language': 'en', 'value': 'fire'}, {'language': 'en', 'value': 'fires'}], 'type': 'default'}], 'children': [{'id': 'Q327954', 'name': 'torch'}], 'synonyms': [{'language': 'en', 'value': 'flame'}]}]`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-categories", as_quoted_string(library_path)]
-    return execute_command(command)
+    return command
 
 
+@_command(taxonomy=("category", "category_value"))
 def get_category(library_path, category_value):
     """
     Get category entity from the database for the library.
@@ -547,15 +973,16 @@ def get_category(library_path, category_value):
     **Example result**:
     `{"id": "Q3196", "type": "default", "name": "fire", "child_count": 130, "child_counter": 135}`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += [
         "get-category",
         as_quoted_string(library_path),
         as_quoted_string(category_value),
     ]
-    return execute_command(command)
+    return command
 
 
+@_command(taxonomy=("tag", None))
 def get_tags(library_path):
     """
     Get all tags from the database for the library.
@@ -580,11 +1007,12 @@ def get_tags(library_path):
     **Example result**:
     `[{'id': 'Q235544', 'name': 'flame', 'type': 'default', 'elements_count': 3, 'synonyms': [{'language': 'en', 'value': 'flame'}]}]`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-tags", as_quoted_string(library_path)]
-    return execute_command(command)
+    return command
 
 
+@_command(taxonomy=("tag", "tag_value"))
 def get_tag(library_path, tag_value):
     """
     Get tag entity from the database for the library.
@@ -609,11 +1037,12 @@ def get_tag(library_path, tag_value):
     **Example result**:
     `{"id": "Q3196", "name": "fire", "type": "default", "elements_count": 130}`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-tag", as_quoted_string(library_path), as_quoted_string(tag_value)]
-    return execute_command(command)
+    return command
 
 
+@_command()
 def get_elements(library_path):
     """
     Get all elements from the database for the library.
@@ -639,11 +1068,236 @@ def get_elements(library_path):
     **Example result**:
     `[{"category": {"child_counter": 1,"description": "stick with a flaming end used as a source of light","id": "Q327954","name": "torch","type": "default"},"category_id": "Q327954","channel": 3,"colorspace": "sRGB","colorspace_source": "sRGB","created_at": "2022-05-16T08:26:52.854774","feature_id": 1,"frame_count": 1,"frame_first": 1,"frame_last": 1,"frame_rate": "","height": 5413,"id": 1,"media_type": "image","name": "fire_00001","number": "00001","path": "/mnt/library/fire/fire_00001/main_3342x5413_source/fire_00001.jpg","path_filmstrip": "/mnt/library/fire/fire_00001/filmstrip_11520x270_srgb/fire_00001.jpg","path_proxy": "/mnt/library/fire/fire_00001/proxy_1920x1080_srgb/fire_00001.mov","path_source": "/mnt/source/lication/some-image.jpg","path_thumbnail": "/mnt/library/fire/fire_00001/thumb_960x540_srgb/fire_00001.jpg","pixel_aspect": "1","rating": "3","tags": [{"elements_count": 3,"id": "Q235544","name": "flame","type": "default"},{"elements_count": 56,"id": "Q3196","name": "fire","type": "default"},{"elements_count": 3,"id": "Q327954","name": "torch","type": "default"}],"uuid": "9947c549c6014a3ca831983275884051","width": 3342}]`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-elements", as_quoted_string(library_path)]
-    return execute_command(command)
+    return command
+
+
+def iter_elements(library_path):
+    """
+    Iterate over all elements from the database for the library.
+    Each element is returned as soon as the CLI has written it,
+    so only one element at a time is held in memory.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+
+    **Returns**:
+    > - Iterator[Dict]
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    for element in de.iter_elements(library_path):
+        print(element.get('path'))
+    ```
+    """
+    return get_session().iter_command(get_elements.build_command(library_path))
+
+
+def get_elements_compact(library_path):
+    """
+    Get all elements from the database for the library, like `get_elements`, in a compact form
+    for processes that keep many elements in memory.
+
+    Each element is an `Element` with its fields in slots. Equal tags and categories of a library are
+    one shared `Tag` / `Category` instance, repeated strings like the colorspace are shared as well.
+    Elements, tags and categories are read like dicts. They are not plain dicts though:
+    `element['tags']` is a tuple and tags and categories are read-only. Use `element.to_dict()` to get a plain dict.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+
+    **Returns**:
+    > - List[Element]
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    elements = de.get_elements_compact(library_path)
+    for element in elements:
+        print(element['name'], element['category']['name'], [tag['name'] for tag in element['tags']])
+    ```
+
+    **Example result**:
+    `[Element(id=1, name='fire_00001')]`
+    """
+    interner = get_session().get_interner(library_path)
+    return [interner.element(element) for element in iter_elements(library_path)]
+
+
+def get_elements_table(library_path):
+    """
+    Get all elements from the database for the library as a columnar `ElementTable` for vectorized filters.
+    Requires NumPy: `pip install daselement-api[table]`
+
+    Numeric fields (`id`, `width`, `height`, `frame_first`, `frame_last`, `frame_count`, `channel`, `rating`, `feature_id`)
+    are NumPy int64 arrays with -1 for a missing value. String fields are dictionary encoded `StringColumn`s.
+    The tags of the elements are stored as CSR offsets into the tag codes.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+
+    **Returns**:
+    > - ElementTable
 
+    **Example code**:
+    ```
+    from daselement_api import api as de
 
+    library_path = '/some/path/das-element.lib'
+
+    table = de.get_elements_table(library_path)
+
+    # all 4K+ sequences longer than 100 frames rated 3 or higher
+    mask = ((table['width'] >= 3840)
+            & table['media_type'].equals('sequence')
+            & (table['frame_count'] > 100)
+            & (table['rating'] >= 3))
+    for row in table.rows(mask):
+        print(table['uuid'][row], table['path'][row])
+    ```
+
+    **Example result**:
+    `array([   3,   17,   42, ...])`
+    """
+    import_numpy()
+    return build_table(iter_elements(library_path))
+
+
+def enable_uuid_routing(max_age=None):
+    """
+    Enable the routing table from element UUID to library.
+    `get_element_by_uuid`, `delete_element` and `render_element_proxies` without a library path
+    go straight to the library of the element instead of searching all libraries of the config.
+
+    The table is built in the background from the element UUIDs of all libraries on first use,
+    until it is ready the calls search all libraries. Building it reads every element of every library.
+    It is updated by `ingest`, `delete_element` and `delete_elements` of this process.
+    Elements created by other processes are found after `router.refresh()` or, with `max_age`, after the
+    next rebuild in the background.
+
+    **Args**:
+    > - **max_age** (float): *[optional] Seconds until the routing table gets rebuilt in the background. None only rebuilds it with `router.refresh()`*
+
+    **Returns**:
+    > - UUIDRouter
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    router = de.enable_uuid_routing()
+
+    element = de.get_element_by_uuid('9947c549c6014a3ca831983275884051')
+
+    # after other processes ingested many elements, unknown UUIDs still search all libraries
+    router.refresh()
+    ```
+    """
+    session = get_session()
+    with session.lock:
+        disable_uuid_routing()
+        session.uuid_router = router = UUIDRouter(max_age=max_age)
+        session.listeners.append(router.on_command)
+    return router
+
+
+def disable_uuid_routing():
+    """
+    Disable the routing table from element UUID to library.
+    """
+    session = get_session()
+    with session.lock:
+        router, session.uuid_router = session.uuid_router, None
+        if router is not None:
+            session.listeners.remove(router.on_command)
+
+
+def open_index(library_path, path=None, refresh=False):
+    """
+    Open the local SQLite index of the elements of a library.
+    Lookups and filters are served from the index file without calling the CLI.
+    Changes made with `update`, `ingest`, `delete_element` and `delete_elements` in this process are applied to the index.
+
+    An existing index opens from the disk without a CLI call, a new index reads all elements of the library once.
+    `index.refresh()` adds the elements created since, `index.rebuild()` also picks up changes made by other processes.
+    Both read the whole library, the CLI can not list only the changed elements.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+    > - **path** (str): *[optional] File path of the index file. Default directory: ~/.das-element/index*
+    > - **refresh** (bool): *[optional] Add the elements created since the last refresh, see `ElementIndex.refresh`*
+
+    **Returns**:
+    > - ElementIndex
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    index = de.open_index(library_path)
+    element = index.get_by_uuid('9947c549c6014a3ca831983275884051')
+    elements = index.filter(category_id='Q3196', tag_ids=['Q235544'], media_type='sequence')
+
+    index.close()
+    ```
+    """
+    index = ElementIndex(library_path, path=path)
+    if refresh or index.high_water_mark() is None:
+        index.refresh()
+    index.listen(get_session().listeners)
+    return index
+
+
+def create_query_index(library_path, elements=None):
+    """
+    Create an in-memory query engine over all elements of the library.
+    Queries with tag expressions, categories, value ranges, sorting and paging are answered
+    from inverted and sorted indexes without a CLI call.
+    `update`, `ingest`, `delete_element` and `delete_elements` calls of this process are applied to the index.
+    Call `close()` on the index to stop following the API calls.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+    > - **elements** (List[Dict]): *[optional] Already loaded elements of the library, like the result of `get_elements` or `get_elements_compact`*
+
+    **Returns**:
+    > - QueryIndex
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    index = de.create_query_index(library_path)
+    elements = index.query(tags='fire AND smoke',
+                           category='flame',
+                           ranges={'rating': (3, None), 'width': (3840, None)},
+                           order_by='-created_at',
+                           limit=50)
+    ```
+
+    **Example result**:
+    `[{"category": {"child_counter": 1,"description": "visible, gaseous part of a fire","id": "Q235544","name": "flame","type": "default"}, "category_id": "Q235544", "id": 42, ...}]`
+    """
+    if elements is None:
+        elements = iter_elements(library_path)
+    index = QueryIndex(elements, library_path=library_path)
+    index.listen(get_session().listeners)
+    return index
+
+
+@_command(lookup=("id", "element_id"))
 def get_element_by_id(library_path, element_id):
     """
     Get element entity based on the **element ID** from the database for the library.
@@ -670,11 +1324,12 @@ def get_element_by_id(library_path, element_id):
     **Example result**:
     `{"category": {"child_counter": 1,"description": "stick with a flaming end used as a source of light","id": "Q327954","name": "torch","type": "default"},"category_id": "Q327954","channel": 3,"colorspace": "sRGB","colorspace_source": "sRGB","created_at": "2022-05-16T08:26:52.854774","feature_id": 1,"frame_count": 1,"frame_first": 1,"frame_last": 1,"frame_rate": "","height": 5413,"id": 1,"media_type": "image","name": "fire_00001","number": "00001","path": "/mnt/library/fire/fire_00001/main_3342x5413_source/fire_00001.jpg","path_filmstrip": "/mnt/library/fire/fire_00001/filmstrip_11520x270_srgb/fire_00001.jpg","path_proxy": "/mnt/library/fire/fire_00001/proxy_1920x1080_srgb/fire_00001.mov","path_source": "/mnt/source/lication/some-image.jpg","path_thumbnail": "/mnt/library/fire/fire_00001/thumb_960x540_srgb/fire_00001.jpg","pixel_aspect": "1","rating": "3","tags": [{"elements_count": 3,"id": "Q235544","name": "flame","type": "default"},{"elements_count": 56,"id": "Q3196","name": "fire","type": "default"},{"elements_count": 3,"id": "Q327954","name": "torch","type": "default"}],"uuid": "9947c549c6014a3ca831983275884051","width": 3342}`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-element-by-id", as_quoted_string(library_path), element_id]
-    return execute_command(command)
+    return command
 
 
+@_command(lookup=("uuid", "element_uuid"), routed=True)
 def get_element_by_uuid(element_uuid, library_path=None):
     """
     Get element entity based on the **element UUID** from the database for the library.
@@ -706,13 +1361,14 @@ def get_element_by_uuid(element_uuid, library_path=None):
     **Example result**:
     `{"category": {"child_counter": 1,"description": "stick with a flaming end used as a source of light","id": "Q327954","name": "torch","type": "default"},"category_id": "Q327954","channel": 3,"colorspace": "sRGB","colorspace_source": "sRGB","created_at": "2022-05-16T08:26:52.854774","feature_id": 1,"frame_count": 1,"frame_first": 1,"frame_last": 1,"frame_rate": "","height": 5413,"id": 1,"media_type": "image","name": "fire_00001","number": "00001","path": "/mnt/library/fire/fire_00001/main_3342x5413_source/fire_00001.jpg","path_filmstrip": "/mnt/library/fire/fire_00001/filmstrip_11520x270_srgb/fire_00001.jpg","path_proxy": "/mnt/library/fire/fire_00001/proxy_1920x1080_srgb/fire_00001.mov","path_source": "/mnt/source/lication/some-image.jpg","path_thumbnail": "/mnt/library/fire/fire_00001/thumb_960x540_srgb/fire_00001.jpg","pixel_aspect": "1","rating": "3","tags": [{"elements_count": 3,"id": "Q235544","name": "flame","type": "default"},{"elements_count": 56,"id": "Q3196","name": "fire","type": "default"},{"elements_count": 3,"id": "Q327954","name": "torch","type": "default"}],"uuid": "9947c549c6014a3ca831983275884051","width": 3342}`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-element-by-uuid", element_uuid]
     if library_path:
         command += ["--library", as_quoted_string(library_path)]
-    return execute_command(command)
+    return command
 
 
+@_command(lookup=("name", "element_name"))
 def get_element_by_name(library_path, element_name):
     """
     Get element entity based on the **element name** from the database for the library.
@@ -739,11 +1395,234 @@ def get_element_by_name(library_path, element_name):
     **Example result**:
     `{"category": {"child_counter": 1,"description": "stick with a flaming end used as a source of light","id": "Q327954","name": "torch","type": "default"},"category_id": "Q327954","channel": 3,"colorspace": "sRGB","colorspace_source": "sRGB","created_at": "2022-05-16T08:26:52.854774","feature_id": 1,"frame_count": 1,"frame_first": 1,"frame_last": 1,"frame_rate": "","height": 5413,"id": 1,"media_type": "image","name": "fire_00001","number": "00001","path": "/mnt/library/fire/fire_00001/main_3342x5413_source/fire_00001.jpg","path_filmstrip": "/mnt/library/fire/fire_00001/filmstrip_11520x270_srgb/fire_00001.jpg","path_proxy": "/mnt/library/fire/fire_00001/proxy_1920x1080_srgb/fire_00001.mov","path_source": "/mnt/source/lication/some-image.jpg","path_thumbnail": "/mnt/library/fire/fire_00001/thumb_960x540_srgb/fire_00001.jpg","pixel_aspect": "1","rating": "3","tags": [{"elements_count": 3,"id": "Q235544","name": "flame","type": "default"},{"elements_count": 56,"id": "Q3196","name": "fire","type": "default"},{"elements_count": 3,"id": "Q327954","name": "torch","type": "default"}],"uuid": "9947c549c6014a3ca831983275884051","width": 3342}`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["get-element-by-name", as_quoted_string(library_path), element_name]
-    return execute_command(command)
+    return command
+
+
+NOT_FOUND_EXIT_CODES = (1,)
+"""
+Exit status of the CLI for the lookup of an element that does not exist.
+The bulk lookups (`get_elements_by_ids`, ...) return None for these keys and raise other errors,
+like a missing executable, a crashed CLI or another exit status
+
+---
+"""
+
+
+class _LookupCosts(object):
+    # measured costs of the bulk lookups of a session
+    # to choose between parallel lookups and a scan of the library
+
+    CALL_TIME = 0.05
+    WEIGHT = 0.3
+
+    def __init__(self):
+        self.call_time = None
+        self.element_time = None
+        self.sizes = {}
+        self._lock = threading.Lock()
+
+    def _average(self, current, value):
+        if current is None:
+            return value
+        return current + self.WEIGHT * (value - current)
+
+    def add_calls(self, seconds, calls, workers):
+        if calls:
+            with self._lock:
+                self.call_time = self._average(
+                    self.call_time, seconds * min(workers, calls) / calls)
+
+    def add_scan(self, key, seconds, count, complete):
+        with self._lock:
+            if complete:
+                self.sizes[key] = count
+            else:
+                self.sizes[key] = max(count, self.sizes.get(key, 0))
+            if count:
+                call_time = self.call_time or self.CALL_TIME
+                self.element_time = self._average(
+                    self.element_time, max(seconds - call_time, 0.0) / count)
+
+    def prefer_scan(self, keys, library_keys, workers):
+        sizes = [self.sizes.get(key) for key in library_keys]
+        if self.element_time is None or None in sizes:
+            return keys >= BULK_SCAN_THRESHOLD
+        call_time = self.call_time or self.CALL_TIME
+        parallel = -(-keys // workers) * call_time
+        scan = sum(call_time + size * self.element_time for size in sizes)
+        return scan < parallel
+
+
+def _lookup_many(kind, keys, library_path, function, workers):
+    # returns {key: element or None} in the order of the keys
+    keys = list(keys)
+    wanted = {}
+    for key in keys:
+        wanted.setdefault(str(key), []).append(key)
+    results = dict.fromkeys(keys)
+
+    def found(element):
+        for key in wanted.pop(str(element.get(kind)), []):
+            results[key] = element
+
+    session = get_session()
+    config = session.config
+    cache = session.element_cache
+    if cache is not None:
+        for key_string in list(wanted):
+            element = cache.get(config, library_path, kind, key_string)
+            if element is not None:
+                found(element)
+    if not wanted:
+        return results
+
+    with session.lock:
+        if session.lookup_costs is None:
+            session.lookup_costs = _LookupCosts()
+        costs = session.lookup_costs
+    workers = workers or BATCH_WORKERS
+    if library_path:
+        library_paths = [library_path]
+    else:
+        # only the libraries of the UUID routing table get scanned,
+        # the CLI searches all libraries for the other keys
+        router = session.uuid_router
+        library_paths = sorted(
+            set(router.route(config, key) for key in wanted) -
+            set([None])) if router is not None else []
+    if library_paths and costs.prefer_scan(
+            len(wanted), [(config, path) for path in library_paths], workers):
+        for path in library_paths:
+            started_at = time.perf_counter()
+            count = 0
+            for element in iter_elements(path):
+                count += 1
+                if str(element.get(kind)) in wanted:
+                    found(element)
+                    if cache is not None:
+                        cache.put(config, path, element)
+                    if not wanted:
+                        break
+            costs.add_scan((config, path), time.perf_counter() - started_at,
+                           count, complete=bool(wanted))
+            if not wanted:
+                break
+        if library_path or not wanted:
+            return results
+
+    # a failed lookup is a missing element only for its exit status,
+    # other errors (missing executable, crashed CLI) are raised
+    calls = [(function.quiet, (key, library_path) if kind == "uuid" else
+              (library_path, key)) for key in wanted]
+    started_at = time.perf_counter()
+    errors = []
+    for result in batch(calls, workers=workers):
+        if result.ok:
+            if isinstance(result.value, dict):
+                found(result.value)
+        elif not (isinstance(result.error, CommandError)
+                  and result.error.returncode in NOT_FOUND_EXIT_CODES):
+            errors.append(result.error)
+    costs.add_calls(time.perf_counter() - started_at, len(calls), workers)
+    if errors:
+        raise errors[0]
+    return results
+
+
+def get_elements_by_ids(library_path, element_ids, workers=None):
+    """
+    Get many element entities based on their **element IDs** from the database for the library.
+
+    The keys are looked up in parallel or all elements of the library are scanned once,
+    whatever is faster for the number of keys and the size of the library (see `BULK_SCAN_THRESHOLD`).
+    Errors of the CLI other than a missing element (see `NOT_FOUND_EXIT_CODES`) are raised.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+    > - **element_ids** (List[int]): *Element IDs in the database*
+    > - **workers** (int): *[optional] Number of parallel lookups*
 
+    **Returns**:
+    > - Dict[int, Dict]: *Key is the element ID - Value is the element entity or None if the element was not found*
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    elements = de.get_elements_by_ids(library_path, [1, 2, 3])
+    missing = [element_id for element_id, element in elements.items() if element is None]
+    ```
+    """
+    return _lookup_many("id", element_ids, library_path,
+                        get_element_by_id, workers)
+
+
+def get_elements_by_uuids(element_uuids, library_path=None, workers=None):
+    """
+    Get many element entities based on their **element UUIDs**.
+    If no library path is provided, all libraries of the current config will be searched.
+    Without a library path only the libraries of the UUID routing table (see `enable_uuid_routing`) get scanned,
+    the other keys are looked up by the CLI.
 
+    The keys are looked up in parallel or all elements of the library are scanned once,
+    whatever is faster for the number of keys and the size of the library (see `BULK_SCAN_THRESHOLD`).
+    Errors of the CLI other than a missing element (see `NOT_FOUND_EXIT_CODES`) are raised.
+
+    **Args**:
+    > - **element_uuids** (List[str]): *Element UUIDs (unique IDs) in the database*
+    > - **library_path** (str): *[optional] File path to the library file (.lib)*
+    > - **workers** (int): *[optional] Number of parallel lookups*
+
+    **Returns**:
+    > - Dict[str, Dict]: *Key is the element UUID - Value is the element entity or None if the element was not found*
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    element_uuids = ['8747c549ab344a3798405135ca831288', '9947c549c6014a3ca831983275884051']
+
+    elements = de.get_elements_by_uuids(element_uuids)
+    ```
+    """
+    return _lookup_many("uuid", element_uuids, library_path,
+                        get_element_by_uuid, workers)
+
+
+def get_elements_by_names(library_path, element_names, workers=None):
+    """
+    Get many element entities based on their **element names** from the database for the library.
+
+    The keys are looked up in parallel or all elements of the library are scanned once,
+    whatever is faster for the number of keys and the size of the library (see `BULK_SCAN_THRESHOLD`).
+    Errors of the CLI other than a missing element (see `NOT_FOUND_EXIT_CODES`) are raised.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+    > - **element_names** (List[str]): *Element names in the database*
+    > - **workers** (int): *[optional] Number of parallel lookups*
+
+    **Returns**:
+    > - Dict[str, Dict]: *Key is the element name - Value is the element entity or None if the element was not found*
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    elements = de.get_elements_by_names(library_path, ['fire_00001', 'fire_00002'])
+    ```
+    """
+    return _lookup_many("name", element_names, library_path,
+                        get_element_by_name, workers)
+
+
+@_command()
 def update(library_path, entity_type, entity_id, data):
     """
     Updates database entity with new data
@@ -784,17 +1663,91 @@ def update(library_path, entity_type, entity_id, data):
     ##### Linux/MacOS
     `das-element-cli update /mnt/library/das-element.lib element 1 '{\"rating\": 3}'`
     """
-    command = ["--config", config] if config else []
+    return _update_command(library_path, entity_type, entity_id,
+                           as_quoted_dict(data))
+
+
+def _update_command(library_path, entity_type, entity_id, payload):
+    command = _config_arguments()
     command += [
         "update",
         as_quoted_string(library_path),
         as_quoted_string(entity_type),
         as_quoted_string(entity_id),
-        as_quoted_dict(data),
+        payload,
     ]
-    return execute_command(command)
+    return command
+
+
+def update_many(library_path,
+                entity_type,
+                updates,
+                workers=None,
+                continue_on_error=True):
+    """
+    Updates many database entities of the same type with new data in parallel.
+    Equal data is serialized only once, also if it is a separate dictionary per update.
 
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+    > - **entity_type** (str): *Type of entity to update. Options: [Category, Element, Tag]*
+    > - **updates** (List[Tuple[Union[str, int], Dict]]): *List of (entity ID, data) pairs*
+    > - **workers** (int): *[optional] Number of updates running at the same time*
+    > - **continue_on_error** (bool): *[optional] Continue with the other updates if one fails. Otherwise the error is raised*
 
+    **Returns**:
+    > - List[Result]: *Result per update in the same order. `result.value` is the updated entity, `result.error` the error of a failed update*
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+    updates = [(element_id, {'rating': 3}) for element_id in range(1, 20001)]
+
+    results = de.update_many(library_path, 'Element', updates, workers=16)
+    failed = [result for result in results if not result.ok]
+    ```
+    """
+    payloads = {}
+    calls = []
+    for entity_id, data in updates:
+        try:
+            key = json.dumps(data, sort_keys=True)
+        except (TypeError, ValueError):
+            # not JSON serializable, the CLI call reports the error
+            key = id(data)
+        if key not in payloads:
+            payloads[key] = (data, as_quoted_dict(data))
+        calls.append((_update_one, (library_path, entity_type, entity_id,
+                                    data, payloads[key][1])))
+
+    results = []
+    for result in batch(calls, workers=workers):
+        if not result.ok and not continue_on_error:
+            raise result.error
+        results.append(result)
+    return results
+
+
+def _update_one(library_path, entity_type, entity_id, data, payload):
+    command = _update_command(library_path, entity_type, entity_id, payload)
+    arguments = {
+        "library_path": library_path,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "data": data,
+    }
+    session = get_session()
+    result = None
+    try:
+        result = session.execute(command)
+    finally:
+        _notify(session, "update", arguments, result)
+    return result
+
+
+@_command(cli_full=True, routed=True)
 def delete_element(
     element_uuid,
     delete_from_database=False,
@@ -833,7 +1786,7 @@ def delete_element(
     **Example result**:
     `true`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += [
         "delete-element",
         element_uuid,
@@ -846,9 +1799,10 @@ def delete_element(
         command += ["--proxy"]
     if library_path:
         command += ["--library", as_quoted_string(library_path)]
-    return execute_command(command, cli_full=True)
+    return command
 
 
+@_command(cli_full=True, chunked="element_uuids")
 def delete_elements(
     element_uuids,
     delete_from_database=False,
@@ -859,6 +1813,7 @@ def delete_elements(
     """
     Deletes multiple element entities based on a list of **element UUIDs**.
     The options define what gets deleted. Either the database record, main and/or proxy files on disk, or both.
+    A list of UUIDs that is too long for the command line is deleted in several calls.
 
     **Args**:
     > - **element_uuids** (List[str]): *List of Element UUIDs (unique IDs) in the database*
@@ -887,7 +1842,7 @@ def delete_elements(
     **Example result**:
     `true`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += ["delete-elements"]
     if delete_from_database:
         command += ["--database"]
@@ -898,9 +1853,10 @@ def delete_elements(
     if library_path:
         command += ["--library", as_quoted_string(library_path)]
     command += [as_quoted_string(",".join(element_uuids))]
-    return execute_command(command, cli_full=True)
+    return command
 
 
+@_command(cli_full=True)
 def ingest(
     library_path,
     mapping,
@@ -969,7 +1925,7 @@ def ingest(
     **Example command line command**:
     `das-element-cli ingest --library /mnt/library/das-element.lib --mapping "copy & rename" --path /some/file/path.%04d.exr --category Q3196 --tags foo,bar,baz --colorspace ACES2065-1 --media_type sequence --metadata foo bar -m lens "70 mm" --path_thumbnail /file/path/thumbnail.jpg --path_proxy /file/path/proxy.mov --additional /path/additional.exr texture alpha`
     """
-    command = ["--config", config] if config else []
+    command = _config_arguments()
     command += (
         [
             "ingest",
@@ -1015,9 +1971,94 @@ def ingest(
         ]
     )
 
-    return execute_command(command, cli_full=True)
+    return command
+
+
+def ingest_many(
+    library_path,
+    items,
+    defaults=None,
+    workers=4,
+    queue_size=64,
+    mapping_limits=None,
+    progress=None,
+    continue_on_error=True,
+    journal=None,
+):
+    """
+    Ingest many new elements to the library concurrently.
+
+    The items are consumed while they are ingested, so a generator that is still discovering files
+    streams directly into the ingest. At most `queue_size` discovered items are waiting at a time.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+    > - **items** (Iterable[Union[str, Dict]]): *File paths or dictionaries with the arguments of `ingest` per item (path, mapping, category, tags, metadata, ...)*
+    > - **defaults** (Dict): *[optional] Arguments of `ingest` used for all items, unless the item defines them*
+    > - **workers** (int): *[optional] Number of ingests running at the same time*
+    > - **queue_size** (int): *[optional] Maximum number of discovered items waiting to be ingested*
+    > - **mapping_limits** (Dict[str, int]): *[optional] Maximum number of ingests running at the same time per mapping. Useful for I/O heavy mappings*
+    > - **progress** (Callable[[IngestStats], None]): *[optional] Called after each item with the live statistics (items/s, bytes/s, failures)*
+    > - **continue_on_error** (bool): *[optional] Continue with the other items if one fails. Otherwise the error is raised*
+    > - **journal** (Union[str, IngestJournal]): *[optional] File path of a journal file. Paths that were ingested by a previous run with the same journal are skipped, failed and unfinished paths are ingested again*
+
+    **Returns**:
+    > - List[Result]: *Result per item in the order of the items. `result.value` is the new element entity (only `{'uuid': ...}` for items skipped by the journal), `result.error` the error of a failed item*
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+    paths = de.get_paths_from_disk('/mnt/delivery')
 
+    results = de.ingest_many(library_path,
+                             paths,
+                             defaults={'mapping': 'copy & rename', 'category': 'Q235544', 'tags': ['delivery']},
+                             workers=8,
+                             mapping_limits={'copy & rename': 4},
+                             progress=lambda stats: print(stats))
 
+    # items from a manifest file with one JSON object per line
+    results = de.ingest_many(library_path, de.read_manifest('/some/path/manifest.jsonl'))
+
+    # resumable: a re-run after a crash skips the already ingested paths
+    results = de.ingest_many(library_path, paths, defaults={'mapping': 'copy & rename', 'category': 'Q235544'},
+                             journal='/some/path/delivery.journal')
+    ```
+    """
+    defaults = defaults or {}
+
+    def prepare(items):
+        for item in items:
+            if not isinstance(item, dict):
+                item = {"path": item}
+            yield dict(defaults, **item)
+
+    def ingest_item(**arguments):
+        return ingest.quiet(library_path, **arguments)
+
+    opened_journal = None
+    if journal is not None and not isinstance(journal, IngestJournal):
+        journal = opened_journal = IngestJournal(journal)
+
+    pipeline = IngestPipeline(
+        get_session().bind(ingest_item),
+        workers=workers,
+        queue_size=queue_size,
+        mapping_limits=mapping_limits,
+        progress=progress,
+        continue_on_error=continue_on_error,
+        journal=journal,
+    )
+    try:
+        return pipeline.run(prepare(items))
+    finally:
+        if opened_journal is not None:
+            opened_journal.close()
+
+
+@_command(cli_full=True, cached_result=True)
 def predict(path, model, top=2, filmstrip_frames=36):
     """
     Predict the category for a given file path.
@@ -1046,14 +2087,142 @@ def predict(path, model, top=2, filmstrip_frames=36):
     `das-element-cli predict --top=2 /some/file/path`
 
     """
+    return _predict_command([path], model, top, filmstrip_frames)
+
+
+def _predict_command(paths, model, top, filmstrip_frames):
     command = ["predict", "--top", top, "--filmstrip_frames", filmstrip_frames]
     command += ["--model", as_quoted_string(model)]
-    command += ["--filmstrip_frames", filmstrip_frames]
-    command += ["--top", top]
-    command += [as_quoted_string(path)]
-    return execute_command(command, cli_full=True)
+    command += [as_quoted_string(path) for path in paths]
+    return command
+
+
+def predict_many(paths, model, top=2, filmstrip_frames=36, chunk_size=50, workers=2):
+    """
+    Predict the categories for many file paths with as few CLI calls as possible.
+
+    The paths are split into chunks of `chunk_size` paths, each chunk is predicted by one CLI call,
+    so the model is loaded once per chunk instead of once per path. The chunks run in parallel
+    and the results are returned per path as soon as its chunk is done.
+    With `enable_result_cache` the cached paths are returned first and only the others get predicted.
+
+
+    **Args**:
+
+    > - **paths** (List[str]): *file paths to movie files, image sequences or directories*
+    > - **model** (str): *Define a custom model file path (.wit)*
+    > - **top** (int): [optional] *Return the top X predictions*
+    > - **filmstrip_frames** (int): [optional] *Number of frames to validate for a movie file or sequence*
+    > - **chunk_size** (int): [optional] *Maximum number of paths per CLI call. Chunks are made smaller if the paths do not fit on the command line*
+    > - **workers** (int): [optional] *Number of CLI calls running at the same time*
+
+
+    **Returns**:
+    > - Iterator[Result]: *Result per predicted path in the order of completion. `result.index` is the index of the input path, `result.call` the path of the prediction,
+    `result.value` the list of predicted categories. A directory gets a Result per file and sequence inside of it.
+    `result.error` is the error of a failed chunk or of a path the CLI returned no prediction for*
 
 
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    paths = de.get_paths_from_disk('/mnt/delivery')
+    model = '/some/path/model.wit'
+
+    for result in de.predict_many(paths, model, top=1, workers=4):
+        if result.ok:
+            print(result.call, result.value)
+    ```
+    """
+    paths = list(paths)
+    session = get_session()
+    cache = session.result_cache
+    keys = {}
+    if cache is not None:
+        uncached = []
+        for index, path in enumerate(paths):
+            key = cache.get_key("predict", {"path": path, "model": model, "top": top,
+                                            "filmstrip_frames": filmstrip_frames})
+            found, value = cache.get(key) if key else (False, None)
+            # the output keys of the cached value might differ from the path
+            predictions = _match_predictions([path], value).get(0) if found else None
+            if predictions:
+                for output_path, value in predictions.items():
+                    yield Result(index, output_path, value=value)
+            else:
+                keys[path] = key
+                uncached.append((index, path))
+    else:
+        uncached = list(enumerate(paths))
+
+    indices = [index for index, _ in uncached]
+    paths = [path for _, path in uncached]
+    chunks = []
+    start = 0
+    while start < len(paths):
+        end = min(start + max(1, chunk_size), len(paths))
+        while end - start > 1 and not command_fits(
+                _predict_command(paths[start:end], model, top,
+                                 filmstrip_frames)):
+            end = start + (end - start) // 2
+        chunks.append((start, paths[start:end]))
+        start = end
+
+    def predict_chunk(chunk_paths):
+        command = _predict_command(chunk_paths, model, top, filmstrip_frames)
+        return session.execute(command, cli_full=True)
+
+    calls = [(predict_chunk, (chunk_paths, )) for _, chunk_paths in chunks]
+    for result in batch(calls, workers=workers, ordered=False):
+        start, chunk_paths = chunks[result.index]
+        if not result.ok:
+            for offset, path in enumerate(chunk_paths):
+                yield Result(indices[start + offset], path, error=result.error)
+            continue
+
+        matched = _match_predictions(chunk_paths, result.value)
+        for offset, path in enumerate(chunk_paths):
+            predictions = matched.get(offset)
+            if not predictions:
+                yield Result(indices[start + offset], path,
+                             error=Exception("No prediction for path: {}".format(path)))
+                continue
+
+            if keys.get(path):
+                cache.put(keys[path], predictions)
+            for output_path, value in predictions.items():
+                yield Result(indices[start + offset], output_path, value=value)
+
+
+def _normalize_path(path):
+    return os.path.normcase(os.path.normpath(os.path.abspath(os.path.expanduser(str(path)))))
+
+
+def _match_predictions(paths, predictions):
+    # {position of the input path: {output path: predictions}},
+    # the output paths of a directory are the files and sequences inside of it
+    positions = {}
+    for position, path in enumerate(paths):
+        positions.setdefault(_normalize_path(path), position)
+
+    matched = {}
+    for output_path, value in (predictions or {}).items():
+        normalized = _normalize_path(output_path)
+        position = positions.get(normalized)
+        if position is None:
+            parents = [
+                path for path in positions
+                if normalized.startswith(path.rstrip(os.sep) + os.sep)
+            ]
+            if parents:
+                position = positions[max(parents, key=len)]
+        if position is not None:
+            matched.setdefault(position, {})[output_path] = value
+    return matched
+
+
+@_command(cli_full=True)
 def get_paths_from_disk(path, as_sequence=True):
     """
     Recursively searches for files and sequences in a given directory. Since version 1.2.5
@@ -1088,9 +2257,88 @@ def get_paths_from_disk(path, as_sequence=True):
         command += ["--as_single_files"]
 
     command += [path]
-    return execute_command(command, cli_full=True)
+    return command
+
+
+def iter_paths_from_disk(path, as_sequence=True, workers=None):
+    """
+    Recursively searches for files and sequences in a given directory, like `get_paths_from_disk`,
+    but in this process and without the CLI. Sub-directories are read in parallel
+    and the paths of each directory are returned as soon as it has been read.
+
+    The paths use the same notation as `get_paths_from_disk` and can be passed to `ingest`.
+    A single file with a frame number is returned as a file, not as a sequence of one frame.
+
+
+    **Args**:
+
+    > - **path** (str): *file path to a file or a directory to search*
+    > - **as_sequence / as_single_files** (bool): [optional] defines if files with a sequential naming should be detected as a file sequence or individual files
+    > - **workers** (int): [optional] *Number of directories read at the same time*
+
+
+    **Returns**:
+    > - Iterator[str]: *File paths found in the given directory*
+
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    for path in de.iter_paths_from_disk('/mnt/delivery'):
+        print(path)
+    ```
+
+    **Example result**:
+    `["/some/file/path.1001-1099#.exr", "/other/path.mov"]`
+
+    """
+    return scanner.scan(path, as_sequence=as_sequence, workers=workers)
+
+
+def iter_changed_paths_from_disk(path, state_path, as_sequence=True, workers=None):
+    """
+    Recursively searches for files and sequences that are new or changed since the last search with the same state file.
+    Runs in this process like `iter_paths_from_disk`.
+
+    The modification time, number of entries and the found paths of each directory are stored in the state file.
+    Unchanged directories are skipped. A sequence that got new frames is returned again with its new frame range.
+    The first search returns all paths.
+
+
+    **Args**:
+
+    > - **path** (str): *directory to search*
+    > - **state_path** (str): *file path of the JSON file storing the directory state between searches*
+    > - **as_sequence / as_single_files** (bool): [optional] defines if files with a sequential naming should be detected as a file sequence or individual files
+    > - **workers** (int): [optional] *Number of directories read at the same time*
+
+
+    **Returns**:
+    > - Iterator[str]: *New or changed file paths*
 
 
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    state_path = '/some/path/delivery_scan.json'
+
+    for path in de.iter_changed_paths_from_disk('/mnt/delivery', state_path):
+        print(path)
+    ```
+
+    **Example result**:
+    `["/mnt/delivery/shot_010/plate.1001-1120#.exr"]`
+
+    """
+    return scanner.scan_changes(path,
+                                state_path,
+                                as_sequence=as_sequence,
+                                workers=workers)
+
+
+@_command(cli_full=True, cached_result=True)
 def get_meaningful_frame(path):
     """
     Validate meaningful thumbnail frame number for movie file or image sequence
@@ -1118,9 +2366,10 @@ def get_meaningful_frame(path):
     """
     command = ["get-meaningful-frame", path]
 
-    return execute_command(command, cli_full=True)
+    return command
 
 
+@_command(cli_full=True, routed=True)
 def render_element_proxies(element_uuid, mapping, library_path=None):
     """
     Render the proxy files for an element based on a template mapping
@@ -1150,4 +2399,84 @@ def render_element_proxies(element_uuid, mapping, library_path=None):
     if library_path:
         command += ["--library", library_path]
 
-    return execute_command(command, cli_full=True)
+    return command
+
+
+def render_many_element_proxies(
+    element_uuids,
+    mappings,
+    library_path=None,
+    priority=None,
+    workers=None,
+    cpu_budget=0.8,
+    memory_reserve=None,
+    retries=2,
+    progress=None,
+):
+    """
+    Render the proxy files of many elements for one or more template mappings on this host.
+
+    Each render is one `render_element_proxies` call. The renders run in priority order, at most `workers` at the same time.
+    No further render starts while the load of the host is above the CPU budget or less than `memory_reserve` bytes of memory are available.
+    Failed renders are retried.
+
+
+    **Args**:
+
+    > - **element_uuids** (List[str]): *Element UUIDs (unique IDs) in the database*
+    > - **mappings** (List[str]): *names of the template mappings that get rendered for each element*
+    > - **library_path** (str): *[optional] File path to the library file (.lib)*
+    > - **priority** (Dict[str, float] | Callable[[str], float]): *[optional] Priority per element UUID, higher priorities render first*
+    > - **workers** (int): *[optional] Maximum number of renders running at the same time (Default: half of the CPU cores)*
+    > - **cpu_budget** (float): *[optional] Share of the CPU cores the load of the host may use before no further render starts, None disables the check*
+    > - **memory_reserve** (int): *[optional] Bytes of memory that need to stay available to start a render, None disables the check*
+    > - **retries** (int): *[optional] Number of retries of a failed render*
+    > - **progress** (Callable[[RenderStats], None]): *[optional] Called after each finished render with the number of completed and failed renders and the ETA in seconds*
+
+
+    **Returns**:
+    > - List[Result]: *Result per render. `result.call` is the RenderJob with `element_uuid` and `mapping`, `result.error` the error of a failed render*
+
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+    elements = de.get_elements(library_path)
+
+    # newest elements first
+    priority = {element['uuid']: element['id'] for element in elements}
+
+    results = de.render_many_element_proxies(priority.keys(), ['render proxies'],
+                                             library_path=library_path,
+                                             priority=priority,
+                                             workers=4,
+                                             memory_reserve=8 * 1024**3,
+                                             progress=print)
+    failed = [result.call.element_uuid for result in results if not result.ok]
+    ```
+
+    **Example result**:
+    `RenderStats(total=2, completed=1, failed=0, retried=0, running=1, elapsed=12.4, eta=12.4)`
+    """
+    if isinstance(mappings, str):
+        mappings = [mappings]
+
+    scheduler = RenderScheduler(get_session().bind(render_element_proxies.quiet),
+                                workers=workers,
+                                cpu_budget=cpu_budget,
+                                memory_reserve=memory_reserve,
+                                retries=retries,
+                                progress=progress)
+    for element_uuid in element_uuids:
+        if callable(priority):
+            element_priority = priority(element_uuid)
+        else:
+            element_priority = (priority or {}).get(element_uuid, 0)
+        for mapping in mappings:
+            scheduler.submit(element_uuid,
+                             mapping,
+                             library_path=library_path,
+                             priority=element_priority)
+    return scheduler.run()
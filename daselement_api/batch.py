@@ -0,0 +1,147 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Run many API calls in parallel on a bounded thread pool.
+
+Each call runs its own CLI process (or worker, see daselement_api.worker).
+A failing call does not stop the batch, its error is returned as the result
+of that item.
+'''
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .session import get_session
+
+WORKERS = 8
+'''
+Default number of API calls running at the same time
+'''
+
+
+class Result(object):
+    '''
+    Result of a single call of a batch.
+
+    - **index** (int): *Position of the call in the batch*
+    - **call** (tuple): *The call as (function, args, kwargs)*
+    - **value**: *Return value of the call*
+    - **error** (Exception): *Raised error of the call or None*
+    '''
+
+    __slots__ = ('index', 'call', 'value', 'error')
+
+    def __init__(self, index, call, value=None, error=None):
+        self.index = index
+        self.call = call
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return 'Result({}, value={!r})'.format(self.index, self.value)
+        return 'Result({}, error={!r})'.format(self.index, self.error)
+
+
+def _normalize_call(call):
+    function, args, kwargs = (tuple(call) + ((), {}))[:3]
+    return function, tuple(args), dict(kwargs)
+
+
+def _run(index, call):
+    function, args, kwargs = call
+    try:
+        return Result(index, call, value=function(*args, **kwargs))
+    except Exception as error:
+        return Result(index, call, error=error)
+
+
+def batch(calls, workers=None, ordered=True, progress=None):
+    '''
+    Run a list of API calls in parallel.
+
+    **Args**:
+    > - **calls** (List[tuple]): *Calls as (function, args) or (function, args, kwargs)*
+    > - **workers** (int): *[optional] Number of calls running at the same time*
+    > - **ordered** (bool): *[optional] Yield results in the order of the calls. Otherwise as soon as they are completed*
+    > - **progress** (Callable[[int, int], None]): *[optional] Called with the number of completed calls and the total number of calls*
+
+    **Returns**:
+    > - Iterator[Result]
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+    element_uuids = ['8747c549ab344a3798405135ca831288', '9947c549c6014a3ca831983275884051']
+
+    calls = [(de.get_element_by_uuid, (element_uuid, library_path)) for element_uuid in element_uuids]
+    for result in de.batch(calls, workers=16):
+        if result.ok:
+            print(result.value)
+        else:
+            print(result.error)
+    ```
+    '''
+    calls = [_normalize_call(call) for call in calls]
+    total = len(calls)
+    completed = 0
+
+    # the calls run on the session of the caller
+    run = get_session().bind(_run)
+    executor = ThreadPoolExecutor(max_workers=workers or WORKERS)
+    futures = [
+        executor.submit(run, index, call) for index, call in enumerate(calls)
+    ]
+    try:
+        for future in (futures if ordered else as_completed(futures)):
+            result = future.result()
+            completed += 1
+            if progress:
+                progress(completed, total)
+            yield result
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def map(function, arguments, workers=None, ordered=True, progress=None):
+    '''
+    Run an API function for each item of a list of arguments in parallel.
+
+    **Args**:
+    > - **function** (Callable): *API function*
+    > - **arguments** (List): *Positional arguments per call. A tuple is passed as multiple arguments*
+    > - **workers** (int): *[optional] Number of calls running at the same time*
+    > - **ordered** (bool): *[optional] Yield results in the order of the arguments. Otherwise as soon as they are completed*
+    > - **progress** (Callable[[int, int], None]): *[optional] Called with the number of completed calls and the total number of calls*
+
+    **Returns**:
+    > - Iterator[Result]
+
+    **Example code**:
+    ```
+    from daselement_api import api as de
+
+    library_path = '/some/path/das-element.lib'
+
+    results = de.map(de.get_element_by_id, [(library_path, element_id) for element_id in range(1, 5001)])
+    elements = [result.value for result in results if result.ok]
+    ```
+    '''
+    calls = [(function, item if isinstance(item, tuple) else (item, ))
+             for item in arguments]
+    return batch(calls,
+                 workers=workers,
+                 ordered=ordered,
+                 progress=progress)
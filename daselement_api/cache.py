@@ -0,0 +1,170 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+In-process LRU/TTL cache for element lookups.
+
+An element is stored once per config and element UUID. The lookups by ID,
+UUID and name point to the same entry. Enable it with
+daselement_api.api.enable_element_cache().
+'''
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+
+class ElementCache(object):
+    '''
+    Thread-safe LRU cache for element entities with an optional time to live.
+
+    **Args**:
+    > - **maxsize** (int): *[optional] Maximum number of cached elements*
+    > - **ttl** (float): *[optional] Seconds until a cached element expires. None keeps elements until evicted*
+    '''
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (config, uuid) -> (element, library_path, expires, alias keys)
+        self._entries = OrderedDict()
+        # (config, library_path, kind, key) -> (config, uuid)
+        self._aliases = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _alias(config, library_path, kind, key):
+        # UUIDs are unique across libraries
+        if kind == 'uuid':
+            library_path = None
+        return (config, library_path, kind, str(key))
+
+    def get(self, config, library_path, kind, key):
+        '''
+        Get a copy of the cached element or None.
+        '''
+        with self._lock:
+            entry_key = self._aliases.get(
+                self._alias(config, library_path, kind, key))
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry[2] is not None and entry[2] < time.monotonic():
+                self._remove(entry_key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            element = entry[0]
+
+        return copy.deepcopy(element)
+
+    def put(self, config, library_path, element):
+        if not isinstance(element, dict) or not element.get('uuid'):
+            return
+
+        element = copy.deepcopy(element)
+        entry_key = (config, element['uuid'])
+        aliases = [self._alias(config, library_path, 'uuid', element['uuid'])]
+        if library_path:
+            aliases += [
+                self._alias(config, library_path, kind, element[kind])
+                for kind in ('id', 'name') if element.get(kind) is not None
+            ]
+        expires = time.monotonic() + self.ttl if self.ttl else None
+
+        with self._lock:
+            self._remove(entry_key)
+            self._entries[entry_key] = (element, library_path, expires,
+                                        aliases)
+            for alias in aliases:
+                self._aliases[alias] = entry_key
+
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return
+        for alias in entry[3]:
+            if self._aliases.get(alias) == entry_key:
+                del self._aliases[alias]
+
+    def invalidate(self, config, library_path, kind, key):
+        '''
+        Remove the element found by the lookup kind ('id', 'uuid', 'name') and key.
+        '''
+        with self._lock:
+            entry_key = self._aliases.get(
+                self._alias(config, library_path, kind, key))
+            self._remove(entry_key)
+
+    def invalidate_library(self, config, library_path):
+        '''
+        Remove all elements of the library.
+        '''
+        with self._lock:
+            for entry_key, entry in list(self._entries.items()):
+                if entry_key[0] == config and entry[1] in (library_path,
+                                                           None):
+                    self._remove(entry_key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+
+    def stats(self):
+        '''
+        Get the cache counters.
+
+        **Returns**:
+        > - Dict[str, int]: *hits, misses, evictions and current size*
+        '''
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+
+    def on_command(self, config, name, arguments, result):
+        '''
+        Invalidate the elements touched by an API call.
+        '''
+        library_path = arguments.get('library_path')
+
+        if name == 'update':
+            entity_type = str(arguments.get('entity_type', '')).lower()
+            if entity_type == 'element':
+                self.invalidate(config, library_path, 'id',
+                                arguments.get('entity_id'))
+            else:
+                # tags and categories are embedded in the elements
+                self.invalidate_library(config, library_path)
+        elif name in ('delete_element', 'render_element_proxies'):
+            self.invalidate(config, library_path, 'uuid',
+                            arguments.get('element_uuid'))
+        elif name == 'delete_elements':
+            for element_uuid in arguments.get('element_uuids') or []:
+                self.invalidate(config, library_path, 'uuid', element_uuid)
+        elif name != 'ingest':
+            return
+
+        if isinstance(result, dict) and result.get('uuid'):
+            self.invalidate(config, library_path, 'uuid', result['uuid'])
@@ -0,0 +1,202 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Compact in-memory representation of elements.
+
+An Element stores its fields in slots instead of a dict. Equal tags and
+categories of a library are one shared Tag / Category instance and
+repeated strings like the colorspace or media type are interned.
+The interner of a library is kept by the session until it gets closed.
+Elements, tags and categories can be read like the dicts of the CLI.
+Use it with daselement_api.api.get_elements_compact().
+'''
+
+import json
+import sys
+import threading
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping
+
+# fields of an element entity, other fields are kept in a dict per element
+ELEMENT_FIELDS = ('id', 'uuid', 'name', 'number', 'category_id', 'category',
+                  'tags', 'media_type', 'created_at', 'path', 'path_source',
+                  'path_proxy', 'path_thumbnail', 'path_filmstrip',
+                  'colorspace', 'colorspace_source', 'width', 'height',
+                  'channel', 'pixel_aspect', 'frame_count', 'frame_first',
+                  'frame_last', 'frame_rate', 'rating', 'permission',
+                  'feature_id')
+
+_ELEMENT_FIELD_SET = frozenset(ELEMENT_FIELDS)
+
+# fields with few distinct values
+INTERNED_FIELDS = frozenset(
+    ('category_id', 'media_type', 'colorspace', 'colorspace_source',
+     'pixel_aspect', 'frame_rate', 'rating', 'permission'))
+
+_MISSING = object()
+
+
+class Entity(Mapping):
+    '''
+    Read-only entity like a tag or category, accessed like a dict.
+    '''
+
+    __slots__ = ('_data', )
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self._data)
+
+    def to_dict(self):
+        return json.loads(json.dumps(self._data))
+
+
+class Tag(Entity):
+    __slots__ = ()
+
+
+class Category(Entity):
+    __slots__ = ()
+
+
+class Element(Mapping):
+    '''
+    Element entity with its fields in slots, accessed like a dict.
+    Fields are set with `element[key] = value`.
+    '''
+
+    __slots__ = ELEMENT_FIELDS + ('_extra', )
+
+    def __init__(self, fields=None):
+        self._extra = None
+        for key, value in (fields or {}).items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in _ELEMENT_FIELD_SET:
+            value = getattr(self, key, _MISSING)
+        else:
+            value = (self._extra or {}).get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in _ELEMENT_FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __iter__(self):
+        for key in ELEMENT_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            for key in self._extra:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in _ELEMENT_FIELD_SET:
+            return hasattr(self, key)
+        return key in (self._extra or {})
+
+    def __repr__(self):
+        return 'Element(id={!r}, name={!r})'.format(self.get('id'),
+                                                    self.get('name'))
+
+    def to_dict(self):
+        '''
+        Get the element as a plain dict like the CLI returns it.
+        '''
+        element = {}
+        for key, value in self.items():
+            if isinstance(value, Entity):
+                value = value.to_dict()
+            elif key == 'tags' and isinstance(value, tuple):
+                value = [tag.to_dict() for tag in value]
+            element[key] = value
+        return element
+
+
+class Interner(object):
+    '''
+    Shared Tag, Category and string instances of the elements of one library.
+    One instance per tag and category ID is kept, a tag with changed data like
+    its `elements_count` replaces the instance for the elements that follow.
+    '''
+
+    def __init__(self):
+        self._tags = {}
+        self._categories = {}
+        self._lock = threading.Lock()
+
+    def _intern_entity(self, cache, entity_class, data):
+        if not isinstance(data, dict):
+            return data
+        # keyed by the identity only, so the cache stays as big as the taxonomy
+        key = data.get('id') or data.get('name')
+        entity = cache.get(key)
+        if entity is not None and entity._data == data:
+            return entity
+
+        entity = entity_class({
+            sys.intern(field): self.intern_value(value)
+            for field, value in data.items()
+        })
+        if key is not None:
+            with self._lock:
+                cache[key] = entity
+        return entity
+
+    def intern_value(self, value):
+        return sys.intern(value) if isinstance(value, str) else value
+
+    def tag(self, data):
+        return self._intern_entity(self._tags, Tag, data)
+
+    def category(self, data):
+        return self._intern_entity(self._categories, Category, data)
+
+    def element(self, data):
+        '''
+        Convert an element dict to a compact Element.
+        '''
+        element = Element()
+        for key, value in data.items():
+            if key == 'category':
+                value = self.category(value)
+            elif key == 'tags' and isinstance(value, list):
+                value = tuple(self.tag(tag) for tag in value)
+            elif key in INTERNED_FIELDS:
+                value = self.intern_value(value)
+            element[key] = value
+        return element
+
+    def clear(self):
+        with self._lock:
+            self._tags.clear()
+            self._categories.clear()
@@ -0,0 +1,90 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+JSON decoding of the CLI output.
+
+The output is parsed straight from the bytes of the CLI. The fastest
+installed backend is used: orjson, ujson or the json module of the
+standard library. Set the environment variable `DASELEMENT_JSON` to
+'orjson', 'ujson' or 'json' to choose a backend. If the chosen backend is
+not installed, the json module is used with a warning.
+'''
+
+import json
+import os
+import warnings
+
+BACKENDS = ('orjson', 'ujson', 'json')
+
+
+def _import_backend(name):
+    if name == 'orjson':
+        import orjson
+        return orjson.loads
+    if name == 'ujson':
+        import ujson
+        return ujson.loads
+    if name == 'json':
+        return json.loads
+    raise ValueError('Unknown JSON backend: {}. Options: {}'.format(
+        name, ', '.join(BACKENDS)))
+
+
+def _find_backend(name=None):
+    if name:
+        return name, _import_backend(name)
+
+    for backend in BACKENDS:
+        try:
+            return backend, _import_backend(backend)
+        except ImportError:
+            continue
+
+
+def _environment_backend():
+    name = os.getenv('DASELEMENT_JSON')
+    try:
+        return _find_backend(name)
+    except (ImportError, ValueError) as error:
+        warnings.warn(
+            'DASELEMENT_JSON={}: {}. The json module is used instead.'.format(
+                name, error))
+        return 'json', json.loads
+
+
+backend, _loads = _environment_backend()
+
+
+def set_backend(name=None):
+    '''
+    Use another JSON backend. None picks the fastest installed backend.
+    '''
+    global backend, _loads
+    backend, _loads = _find_backend(name)
+
+
+def loads(data):
+    '''
+    Parse JSON from bytes or a string.
+    Invalid UTF-8 characters are dropped like the text output of the CLI.
+    '''
+    try:
+        return _loads(data)
+    except UnicodeDecodeError:
+        pass
+    except ValueError:
+        # orjson and ujson reject invalid UTF-8 as a JSON error
+        if not isinstance(data, bytes):
+            raise
+        try:
+            data.decode('utf8')
+        except UnicodeDecodeError:
+            pass
+        else:
+            raise
+    return json.loads(data.decode('utf8', 'ignore'))
@@ -0,0 +1,340 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Persistent local SQLite index of the elements of a library.
+
+The index is a snapshot of `get_elements` stored on the local disk, so
+lookups and filters do not need a CLI call. Open it with
+daselement_api.api.open_index().
+
+The index files are stored in the directory defined by the environment
+variable `DASELEMENT_INDEX_DIRECTORY` (Default: ~/.das-element/index)
+'''
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .session import get_session
+
+INDEX_DIRECTORY = os.getenv('DASELEMENT_INDEX_DIRECTORY') or os.path.join(
+    os.path.expanduser('~'), '.das-element', 'index')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS elements (
+    id INTEGER PRIMARY KEY,
+    uuid TEXT NOT NULL UNIQUE,
+    name TEXT,
+    category_id TEXT,
+    media_type TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS element_tags (
+    tag_id TEXT NOT NULL,
+    element_id INTEGER NOT NULL,
+    PRIMARY KEY (tag_id, element_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS elements_name ON elements (name);
+CREATE INDEX IF NOT EXISTS elements_category_id ON elements (category_id);
+CREATE INDEX IF NOT EXISTS elements_media_type ON elements (media_type);
+CREATE INDEX IF NOT EXISTS elements_created_at ON elements (created_at);
+CREATE INDEX IF NOT EXISTS element_tags_element_id ON element_tags (element_id);
+'''
+
+
+def get_index_path(library_path):
+    name = hashlib.md5(str(library_path).encode('utf8')).hexdigest()
+    return os.path.join(INDEX_DIRECTORY, name + '.db')
+
+
+class ElementIndex(object):
+    '''
+    Local SQLite index of the elements of a library.
+
+    **Args**:
+    > - **library_path** (str): *File path to the library file (.lib)*
+    > - **path** (str): *[optional] File path of the index file*
+    '''
+
+    def __init__(self, library_path, path=None):
+        self.library_path = library_path
+        self.path = path or get_index_path(library_path)
+        # the index reads the elements with the session that created it
+        self.session = get_session()
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._listeners = None
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.path,
+                                           check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def listen(self, listeners):
+        '''
+        Register the index to receive API calls of the list of listeners.
+        '''
+        self._listeners = listeners
+        listeners.append(self.on_command)
+
+    def close(self):
+        if self._listeners is not None and self.on_command in self._listeners:
+            self._listeners.remove(self.on_command)
+        self._listeners = None
+        with self._lock:
+            self._connection.close()
+
+    # --- writing ---
+
+    def _write(self, elements):
+        count = 0
+        for element in elements:
+            # the element might come back with another ID
+            row = self._connection.execute(
+                'SELECT id FROM elements WHERE uuid = ?',
+                (element['uuid'], )).fetchone()
+            if row is not None and row[0] != element['id']:
+                self._connection.execute(
+                    'DELETE FROM element_tags WHERE element_id = ?', row)
+            self._connection.execute('DELETE FROM elements WHERE uuid = ?',
+                                     (element['uuid'], ))
+            self._connection.execute(
+                'INSERT OR REPLACE INTO elements VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (element['id'], element['uuid'], element.get('name'),
+                 element.get('category_id'), element.get('media_type'),
+                 element.get('created_at'), json.dumps(element)))
+            self._connection.execute(
+                'DELETE FROM element_tags WHERE element_id = ?',
+                (element['id'], ))
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO element_tags VALUES (?, ?)',
+                [(tag['id'], element['id'])
+                 for tag in element.get('tags') or [] if tag.get('id')])
+            count += 1
+        return count
+
+    def add(self, elements):
+        '''
+        Insert or replace elements in the index.
+        '''
+        with self._lock, self._connection:
+            return self._write(elements)
+
+    def remove(self, element_uuids):
+        with self._lock, self._connection:
+            for element_uuid in element_uuids:
+                row = self._connection.execute(
+                    'SELECT id FROM elements WHERE uuid = ?',
+                    (element_uuid, )).fetchone()
+                if row is None:
+                    continue
+                self._connection.execute('DELETE FROM elements WHERE id = ?',
+                                         row)
+                self._connection.execute(
+                    'DELETE FROM element_tags WHERE element_id = ?', row)
+
+    def _set_meta(self, key, value):
+        self._connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                                 (key, str(value)))
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value FROM meta WHERE key = ?', (key, )).fetchone()
+        return row[0] if row else default
+
+    # --- refresh ---
+
+    def rebuild(self):
+        '''
+        Replace the index with all elements of the library.
+        This picks up changes made outside of this process to existing elements.
+
+        **Returns**:
+        > - int: *Number of indexed elements*
+        '''
+        elements = self.session.iter_elements(self.library_path)
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM elements')
+            self._connection.execute('DELETE FROM element_tags')
+            count = self._write(elements)
+            self._set_meta('refreshed_at', time.time())
+        return count
+
+    def refresh(self):
+        '''
+        Add elements created since the last refresh.
+
+        Element IDs increase with every new element, only the elements above
+        the highest indexed ID get added. The CLI can not filter `get-elements`
+        by ID or date, so all elements of the library are still read in one
+        streaming CLI call, only the writes to the index are incremental.
+        Call it when new elements are expected, not on every start.
+        An empty index gets fully rebuilt.
+        Changes made outside of this process to existing elements and
+        deleted elements are only picked up by `rebuild`.
+
+        **Returns**:
+        > - int: *Number of added elements*
+        '''
+        high_water_mark = self.high_water_mark()
+        if high_water_mark is None:
+            return self.rebuild()
+
+        elements = [
+            element
+            for element in self.session.iter_elements(self.library_path)
+            if (element.get('id') or 0) > high_water_mark
+        ]
+        with self._lock, self._connection:
+            count = self._write(elements)
+            self._set_meta('refreshed_at', time.time())
+        return count
+
+    def high_water_mark(self):
+        '''
+        Highest element ID in the index or None for an empty index.
+        '''
+        with self._lock:
+            return self._connection.execute(
+                'SELECT MAX(id) FROM elements').fetchone()[0]
+
+    # --- lookups ---
+
+    def _select(self, where='', parameters=(), suffix=''):
+        query = 'SELECT data FROM elements' + (' WHERE ' + where
+                                               if where else '') + suffix
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _first(self, where, parameters):
+        elements = self._select(where, parameters, ' LIMIT 1')
+        return elements[0] if elements else None
+
+    def get_by_id(self, element_id):
+        return self._first('id = ?', (int(element_id), ))
+
+    def get_by_uuid(self, element_uuid):
+        return self._first('uuid = ?', (element_uuid, ))
+
+    def get_by_name(self, element_name):
+        return self._first('name = ?', (element_name, ))
+
+    def filter(self,
+               category_id=None,
+               tag_ids=None,
+               media_type=None,
+               limit=None,
+               offset=0):
+        '''
+        Get elements matching all given filters, ordered by ID.
+
+        **Args**:
+        > - **category_id** (str): *[optional] Category ID like 'Q3196'*
+        > - **tag_ids** (List[str]): *[optional] Elements need to have all tags*
+        > - **media_type** (str): *[optional] Media type like 'sequence'*
+        > - **limit** (int): *[optional] Maximum number of elements*
+        > - **offset** (int): *[optional] Number of elements to skip*
+
+        **Returns**:
+        > - List[Dict]
+        '''
+        where = []
+        parameters = []
+        if category_id is not None:
+            where.append('category_id = ?')
+            parameters.append(category_id)
+        if media_type is not None:
+            where.append('media_type = ?')
+            parameters.append(media_type)
+        for tag_id in tag_ids or []:
+            where.append('id IN (SELECT element_id FROM element_tags '
+                         'WHERE tag_id = ?)')
+            parameters.append(tag_id)
+
+        suffix = ' ORDER BY id'
+        if limit is not None or offset:
+            suffix += ' LIMIT ? OFFSET ?'
+            parameters += [-1 if limit is None else limit, offset]
+
+        return self._select(' AND '.join(where), parameters, suffix)
+
+    def count(self):
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM elements').fetchone()[0]
+
+    # --- write-through ---
+
+    def _patch_embedded(self, key, entity):
+        # tags and categories are embedded in the element data
+        if key == 'tags':
+            rows = self._connection.execute(
+                'SELECT e.data FROM elements e JOIN element_tags t '
+                'ON t.element_id = e.id WHERE t.tag_id = ?',
+                (entity['id'], )).fetchall()
+        else:
+            rows = self._connection.execute(
+                'SELECT data FROM elements WHERE category_id = ?',
+                (entity['id'], )).fetchall()
+
+        elements = []
+        for row in rows:
+            element = json.loads(row[0])
+            if key == 'tags':
+                for tag in element.get('tags') or []:
+                    if tag.get('id') == entity['id']:
+                        tag.update(
+                            (k, v) for k, v in entity.items() if k in tag)
+            elif isinstance(element.get('category'), dict):
+                element['category'].update(
+                    (k, v) for k, v in entity.items()
+                    if k in element['category'])
+            elements.append(element)
+        self._write(elements)
+
+    def on_command(self, config, name, arguments, result):
+        '''
+        Apply writes of API calls to the index.
+        '''
+        library_path = arguments.get('library_path')
+        if library_path not in (None, self.library_path):
+            return
+
+        if name in ('update', 'ingest'):
+            if not isinstance(result, dict) or 'id' not in result:
+                return
+            entity_type = str(arguments.get('entity_type', 'element')).lower()
+            with self._lock, self._connection:
+                if entity_type == 'element':
+                    self._write([result])
+                elif entity_type == 'tag':
+                    self._patch_embedded('tags', result)
+                elif entity_type == 'category':
+                    self._patch_embedded('category', result)
+        elif name in ('delete_element', 'delete_elements'):
+            if result is None or not arguments.get('delete_from_database'):
+                return
+            element_uuids = arguments.get('element_uuids') or [
+                arguments.get('element_uuid')
+            ]
+            self.remove(element_uuids)
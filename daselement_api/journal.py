@@ -0,0 +1,148 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Append-only journal for resumable bulk ingests.
+
+Each line of the journal file is a JSON record of a path and its state:
+'started', 'done' (with the element UUID) or 'failed'. The latest record of
+a path wins. A re-run skips the paths that are 'done' and retries the
+failed and unfinished ones.
+'''
+
+import json
+import os
+import threading
+import time
+
+STARTED = 'started'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class IngestJournal(object):
+    '''
+    Crash-safe journal of the ingested paths.
+
+    Every record is flushed to the file right away, so a crash of the
+    process loses no records. The file gets synced to the disk in batches:
+    after `sync_every` records or `sync_interval` seconds, whatever comes
+    first. After a crash of the machine at most the records since the last
+    sync are lost, those paths get ingested again.
+
+    **Args**:
+    > - **path** (str): *File path of the journal file*
+    > - **sync_every** (int): *[optional] Number of records written between two syncs*
+    > - **sync_interval** (float): *[optional] Maximum seconds between two syncs*
+    '''
+
+    def __init__(self, path, sync_every=100, sync_interval=1.0):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._states = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._synced_at = time.monotonic()
+        self._timer = None
+        self._load()
+        self._file = open(path, 'a')
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+
+        with open(self.path) as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # a torn last line of a crashed run
+                    continue
+                self._states[record['path']] = (record['state'],
+                                                record.get('uuid'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def state(self, path):
+        '''
+        Get the latest state of the path or None if it is unknown.
+        '''
+        return self._states.get(path, (None, None))[0]
+
+    def is_done(self, path):
+        '''
+        Check if the path was already ingested, with or without a recorded element UUID.
+        '''
+        return self.state(path) == DONE
+
+    def completed_uuid(self, path):
+        '''
+        Get the element UUID if the path was already ingested, otherwise None.
+        An ingest without an element UUID in its result is done as well, see `is_done`.
+        '''
+        state, element_uuid = self._states.get(path, (None, None))
+        return element_uuid if state == DONE else None
+
+    def counts(self):
+        '''
+        Get the number of paths per state.
+        '''
+        counts = {}
+        with self._lock:
+            for state, _ in self._states.values():
+                counts[state] = counts.get(state, 0) + 1
+        return counts
+
+    def record(self, path, state, element_uuid=None):
+        record = {'path': path, 'state': state}
+        if element_uuid:
+            record['uuid'] = element_uuid
+
+        with self._lock:
+            self._states[path] = (state, element_uuid)
+            self._file.write(json.dumps(record) + '\n')
+            self._file.flush()
+            self._pending += 1
+            if (self._pending >= self.sync_every or
+                    time.monotonic() - self._synced_at >= self.sync_interval):
+                self._sync()
+            elif self._timer is None:
+                # syncs the last records if no further record gets written
+                self._timer = threading.Timer(self.sync_interval,
+                                              self._sync_pending)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _sync(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._synced_at = time.monotonic()
+
+    def _sync_pending(self):
+        with self._lock:
+            if self._pending and not self._file.closed:
+                self._sync()
+
+    def sync(self):
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._file.close()
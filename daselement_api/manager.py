@@ -10,10 +10,18 @@ Documentation for the API for das element
 Make sure to link the correct executable 'das-element-cli' in the manager.py
 '''
 
+import codecs
 import json
 import os
+import re
 import subprocess
 import sys
+import tempfile
+import time
+
+from . import decoder
+from . import metrics
+from . import worker
 
 try:
     from shutil import which as _which  # Python 3
@@ -49,6 +57,18 @@ EXECUTABLE_CLI = os.getenv('DASELEMENT_CLI')
 # EXECUTABLE_CLI_FULL = '/path/to/das-element-cli-full_2.0.3_win.exe'
 EXECUTABLE_CLI_FULL = os.getenv('DASELEMENT_CLI_FULL')
 
+# Number of long-lived CLI worker processes per executable.
+# 0 starts a new CLI process for every call (default).
+WORKER_POOL_SIZE = int(os.getenv('DASELEMENT_CLI_WORKERS') or 0)
+
+# Seconds a worker process may take for one call before it gets killed
+# and replaced. 0 waits forever.
+WORKER_TIMEOUT = float(os.getenv('DASELEMENT_CLI_WORKER_TIMEOUT') or 600)
+
+# Command to start a worker process. Defaults to: <executable> worker
+# WORKER_COMMAND = [sys.executable, '-m', 'daselement_api.worker_stub']
+WORKER_COMMAND = None
+
 
 def as_quoted_string(value):
     # wraps string into double quotes string
@@ -66,6 +86,59 @@ def strip_outer_quotes(value):
     return value
 
 
+def get_max_command_length():
+    # Windows limits the whole command line of CreateProcess
+    if sys.platform == 'win32':
+        return 32767
+
+    try:
+        limit = os.sysconf('SC_ARG_MAX')
+    except (AttributeError, ValueError, OSError):
+        limit = 131072
+
+    # the environment variables share the same space
+    environment = sum(
+        len(key) + len(value) + 2 for key, value in os.environ.items())
+    return max(4096, limit - environment - 4096)
+
+
+# Linux limits each single argument as well (MAX_ARG_STRLEN)
+MAX_ARGUMENT_LENGTH = 131072 if sys.platform.startswith('linux') else None
+
+
+def command_fits(arguments):
+    '''
+    Check if the arguments fit on the command line of the current platform.
+    '''
+    lengths = [len(str(argument)) + 1 for argument in arguments]
+    if MAX_ARGUMENT_LENGTH and lengths and max(lengths) > MAX_ARGUMENT_LENGTH:
+        return False
+    return sum(lengths) + 1024 <= get_max_command_length()
+
+
+# Arguments of a command that is too long for the command line are written
+# to a file, one argument per line, and passed as: <executable> @<file>
+# Only for a CLI that reads its arguments from an @file, the das-element-cli
+# does not document it. Off by default: a command that is too long raises an
+# error, the worker processes read their arguments from stdin without a limit.
+# Enable it with the environment variable DASELEMENT_CLI_ARGUMENTS_FILE=1
+ARGUMENTS_FILE = (os.getenv('DASELEMENT_CLI_ARGUMENTS_FILE')
+                  or '').lower() in ('1', 'true', 'yes')
+ARGUMENTS_FILE_PREFIX = '@'
+
+
+def write_arguments_file(arguments):
+    if any('\n' in argument or '\r' in argument for argument in arguments):
+        raise Exception(
+            'Command is too long for the command line and contains line breaks'
+        )
+
+    handle, path = tempfile.mkstemp(prefix='daselement_', suffix='.args')
+    with os.fdopen(handle, 'w', encoding='utf8') as arguments_file:
+        arguments_file.write('\n'.join(arguments) + '\n')
+    return path
+
+
 def resolve_executable(executable):
     if executable is None:
         return None
@@ -78,17 +151,23 @@ def resolve_executable(executable):
     return value if os.path.isfile(value) else _which(value)
 
 
-def execute_command(arguments, cli_full=False):
+def get_executable(cli_full=False):
     executable_raw = EXECUTABLE_CLI_FULL if cli_full else EXECUTABLE_CLI
     executable = resolve_executable(executable_raw)
     if not executable:
         raise Exception(
             'Please define path to Das Element CLI executable by setting the environment variables DASELEMENT_CLI and DASELEMENT_CLI_FULL, or by overriding daselement_api.manager.EXECUTABLE_CLI / EXECUTABLE_CLI_FULL.'
         )
+    return executable
+
+
+def get_worker_command(cli_full=False, executable=None):
+    if WORKER_COMMAND:
+        return list(WORKER_COMMAND)
+    return [executable or get_executable(cli_full), 'worker']
 
-    command = [executable
-               ] + [strip_outer_quotes(argument) for argument in arguments]
 
+def run_process(command, record=None, decode=True):
     if sys.version_info <= (3, 4):
         process = subprocess.Popen(command,
                                    stdout=subprocess.PIPE,
@@ -97,26 +176,299 @@ def execute_command(arguments, cli_full=False):
         output = output.strip('\n')
         error = error.strip('\n')
     else:
-        process = subprocess.run(command,
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE,
-                                 shell=False,
-                                 check=False)
-        output = process.stdout.decode('utf8', 'ignore').strip('\n')
-        error = process.stderr.decode('utf8', 'ignore').strip('\n')
+        started_at = time.perf_counter()
+        process = subprocess.Popen(command,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE,
+                                   shell=False)
+        if record is not None:
+            record.spawn_time = time.perf_counter() - started_at
+        output, error = process.communicate()
+        if record is not None:
+            record.stdout_bytes = len(output)
+            record.stderr_bytes = len(error)
+        if not decode:
+            # the output stays bytes, decoding a large output costs a copy
+            return process.returncode, output, error
+        output = output.decode('utf8', 'ignore').strip('\n')
+        error = error.decode('utf8', 'ignore').strip('\n')
 
-    returncode = process.returncode
+    return process.returncode, output, error
 
-    if returncode != 0:
-        print('Argument: {}'.format(' '.join(command)))
+
+def as_text(value):
+    if isinstance(value, bytes):
+        return value.decode('utf8', 'ignore').strip('\n')
+    return value
+
+
+class CommandError(Exception):
+    '''
+    Raised when the CLI exits with an error.
+
+    - **returncode** (int): *Exit status of the CLI*
+    - **error** (str): *Error output of the CLI*
+    '''
+
+    def __init__(self, message, returncode=None, error=''):
+        super(CommandError, self).__init__(message)
+        self.returncode = returncode
+        self.error = error
+
+
+def parse_result(command, returncode, output, error, verbose=True, raw=False):
+    # output and error are strings or the bytes of the CLI output
+    if returncode != 0 and verbose:
+        print('Argument: {}'.format(' '.join(metrics.redact(command))))
         print('Returncode: {}'.format(returncode))
         print('Error:')
-        print(output)
-        print(error)
+        print(as_text(output))
+        print(as_text(error))
         print()
-        error_lines = [line for line in error.splitlines() if line.strip()]
+
+    if returncode != 0:
+        error_lines = [
+            line for line in as_text(error).splitlines() if line.strip()
+        ]
         last_error_line = error_lines[-1] if error_lines else "Unknown error"
-        raise Exception(
-            f"Command failed with exit code {returncode}: {last_error_line}"
-        )
-    return json.loads(output)
+        raise CommandError(
+            f"Command failed with exit code {returncode}: {last_error_line}",
+            returncode=returncode,
+            error=as_text(error))
+
+    if raw:
+        return output if isinstance(output, bytes) else output.encode('utf8')
+    return decoder.loads(output)
+
+
+class CommandCall(object):
+    '''
+    One CLI call: the transport, the metrics record and the parsing of the
+    output. Used by `execute_command` and by the asyncio front-end, which
+    only waits for the process in its own way.
+
+    The transport is the worker `pool` if there is one, otherwise a new
+    process. A command that is too long for the command line raises an error,
+    with `ARGUMENTS_FILE` enabled it gets its arguments from a file
+    (`process_command` is then `[executable, '@file']`).
+    '''
+
+    def __init__(self,
+                 arguments,
+                 cli_full=False,
+                 executable=None,
+                 pool=None,
+                 hooks=None):
+        self.arguments = [strip_outer_quotes(argument) for argument in arguments]
+        self.cli_full = cli_full
+
+        if executable is None:
+            executable = get_executable(cli_full)
+            if WORKER_POOL_SIZE:
+                pool = worker.get_pool(get_worker_command(cli_full, executable),
+                                       WORKER_POOL_SIZE,
+                                       timeout=WORKER_TIMEOUT or None)
+        self.pool = pool
+        self.hooks = hooks
+
+        self.record = None
+        if metrics.is_enabled() or hooks:
+            self.record = metrics.CallRecord(self.arguments, cli_full=cli_full)
+            self.started_at = time.perf_counter()
+
+        self.arguments_path = None
+        if pool is not None:
+            self.command = pool.command + self.arguments
+            self.process_command = None
+            if self.record is not None:
+                self.record.transport = 'worker'
+        else:
+            self.command = [executable] + self.arguments
+            self.process_command = self.command
+            if not command_fits(self.command):
+                if not ARGUMENTS_FILE:
+                    raise Exception(
+                        'Command is too long for the command line ({} arguments). '
+                        'Use the CLI worker processes (DASELEMENT_CLI_WORKERS) '
+                        'or a CLI that reads its arguments from an @file '
+                        '(DASELEMENT_CLI_ARGUMENTS_FILE=1)'.format(
+                            len(self.arguments)))
+                self.arguments_path = write_arguments_file(self.arguments)
+                self.process_command = [
+                    executable, ARGUMENTS_FILE_PREFIX + self.arguments_path
+                ]
+                if self.record is not None:
+                    self.record.transport = 'arguments_file'
+
+    def worker_output(self, returncode, output, error):
+        # the worker answers with text
+        output = output.strip('\n')
+        error = error.strip('\n')
+        if self.record is not None:
+            self.record.stdout_bytes = len(output.encode('utf8'))
+            self.record.stderr_bytes = len(error.encode('utf8'))
+        return returncode, output, error
+
+    def parse(self, returncode, output, error, verbose=True, raw=False):
+        if self.record is None:
+            return parse_result(self.command,
+                                returncode,
+                                output,
+                                error,
+                                verbose=verbose,
+                                raw=raw)
+
+        self.record.returncode = returncode
+        decode_started_at = time.perf_counter()
+        result = parse_result(self.command,
+                              returncode,
+                              output,
+                              error,
+                              verbose=verbose,
+                              raw=raw)
+        self.record.decode_time = time.perf_counter() - decode_started_at
+        return result
+
+    def failed(self, error):
+        if self.record is not None:
+            self.record.error = error
+
+    def close(self):
+        if self.arguments_path is not None:
+            os.remove(self.arguments_path)
+            self.arguments_path = None
+        if self.record is not None:
+            self.record.wall_time = time.perf_counter() - self.started_at
+            metrics.emit(self.record, self.hooks)
+
+
+def execute_command(arguments,
+                    cli_full=False,
+                    verbose=True,
+                    raw=False,
+                    executable=None,
+                    pool=None,
+                    hooks=None):
+    '''
+    Run the CLI with the arguments and return the decoded JSON output.
+    With `raw` the output is returned as the bytes written by the CLI.
+
+    A Session passes its own `executable`, worker `pool` (None runs a new
+    process) and metrics `hooks`. Without an executable the module settings
+    EXECUTABLE_CLI / EXECUTABLE_CLI_FULL and WORKER_POOL_SIZE are used.
+    '''
+    call = CommandCall(arguments,
+                       cli_full=cli_full,
+                       executable=executable,
+                       pool=pool,
+                       hooks=hooks)
+    try:
+        if call.pool is not None:
+            returncode, output, error = call.worker_output(
+                *call.pool.run(call.arguments))
+        else:
+            returncode, output, error = run_process(call.process_command,
+                                                    call.record,
+                                                    decode=False)
+        return call.parse(returncode, output, error, verbose=verbose, raw=raw)
+    except Exception as call_error:
+        call.failed(call_error)
+        raise
+    finally:
+        call.close()
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_json_array(stream, chunk_size=65536):
+    '''
+    Incrementally parse a JSON array from a binary stream.
+    Yields each item as soon as it is completely read.
+    '''
+    read = getattr(stream, 'read1', stream.read)
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf8')('ignore')
+    buffer = ''
+    position = 0
+    started = False
+    eof = False
+
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+
+        if position < len(buffer):
+            char = buffer[position]
+            if not started:
+                if char != '[':
+                    raise ValueError(
+                        'Expected a JSON array, got: {!r}'.format(
+                            buffer[position:position + 80]))
+                started = True
+                position += 1
+                continue
+            if char == ']':
+                return
+            if char == ',':
+                position += 1
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                if eof:
+                    raise
+                end = None
+
+            # a value is complete when a separator follows, a number at the
+            # end of the buffer might continue in the next chunk (1 -> 1.5)
+            if end is not None:
+                following = _WHITESPACE.match(buffer, end).end()
+                if eof or (following < len(buffer)
+                           and buffer[following] in ',]'):
+                    position = end
+                    yield item
+                    continue
+        elif eof:
+            if not started:
+                return
+            raise ValueError('Unexpected end of JSON array')
+
+        chunk = read(chunk_size)
+        buffer = buffer[position:] + text_decoder.decode(chunk, final=not chunk)
+        position = 0
+        eof = not chunk
+
+
+def iter_command(arguments, cli_full=False, executable=None):
+    '''
+    Execute the CLI command and yield the items of the resulting JSON array
+    while the CLI is still writing them. Always starts a new CLI process.
+    '''
+    arguments = [strip_outer_quotes(argument) for argument in arguments]
+    command = [executable or get_executable(cli_full)] + arguments
+
+    with tempfile.TemporaryFile() as error_file:
+        process = subprocess.Popen(command,
+                                   stdout=subprocess.PIPE,
+                                   stderr=error_file,
+                                   shell=False)
+        try:
+            try:
+                for item in iter_json_array(process.stdout):
+                    yield item
+            except ValueError:
+                # report the failed command instead of the broken output
+                process.stdout.read()
+                if process.wait() == 0:
+                    raise
+
+            if process.wait() != 0:
+                error_file.seek(0)
+                error = error_file.read().decode('utf8', 'ignore').strip('\n')
+                parse_result(command, process.returncode, '', error)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
@@ -0,0 +1,309 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Instrumentation of the CLI calls.
+
+Every call of `manager.execute_command` creates a CallRecord and passes it
+to the registered hooks. Without hooks nothing gets recorded.
+
+```
+from daselement_api import api as de
+from daselement_api import metrics
+
+with metrics.profile() as profiler:
+    de.get_libraries()
+    de.get_elements('/some/path/das-element.lib')
+
+print(profiler.report())
+```
+'''
+
+import bisect
+import contextlib
+import re
+import threading
+
+# values of these options are never recorded
+SECRET_OPTIONS = ('--db_password', )
+
+# the password runs to the last @ of the authority
+_URI_PASSWORD = re.compile(r'(://[^:/@\s]*:)[^/\s]*@')
+_REDACTED = '***'
+
+_hooks = []
+
+
+def add_hook(hook):
+    '''
+    Register a function called with the CallRecord of each CLI call.
+    Hooks are called in the thread of the call and should return fast.
+    '''
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def is_enabled():
+    return bool(_hooks)
+
+
+def emit(record, hooks=None):
+    # hooks: additional hooks, like the hooks of a Session
+    for hook in list(_hooks) + list(hooks or ()):
+        hook(record)
+
+
+def redact(arguments):
+    '''
+    Get a copy of the CLI arguments without passwords.
+    '''
+    redacted = []
+    secret = False
+    for argument in arguments:
+        argument = str(argument)
+        option = argument.split('=', 1)[0]
+        if secret:
+            redacted.append(_REDACTED)
+        elif option in SECRET_OPTIONS and option != argument:
+            # --db_password=secret
+            redacted.append(option + '=' + _REDACTED)
+        else:
+            redacted.append(_URI_PASSWORD.sub(r'\1' + _REDACTED + '@', argument))
+        secret = argument in SECRET_OPTIONS
+    return redacted
+
+
+def get_subcommand(arguments):
+    '''
+    Get the CLI subcommand of the arguments, like 'get-elements'.
+    '''
+    skip = False
+    for argument in arguments:
+        if skip:
+            skip = False
+        elif argument == '--config' or argument in SECRET_OPTIONS:
+            skip = True
+        elif not str(argument).startswith('-'):
+            return str(argument)
+    return None
+
+
+class CallRecord(object):
+    '''
+    Measurements of one CLI call. Times are in seconds.
+
+    - **subcommand** (str): *CLI subcommand, like 'get-elements'*
+    - **arguments** (List[str]): *CLI arguments with the passwords redacted*
+    - **cli_full** (bool): *If the call used the full CLI executable*
+    - **transport** (str): *'process', 'arguments_file' or 'worker'*
+    - **spawn_time** (float): *Time to start the process, None for a worker*
+    - **wall_time** (float): *Time of the whole call including the JSON decode*
+    - **returncode** (int): *Exit code of the CLI*
+    - **stdout_bytes** (int): *Size of the output*
+    - **stderr_bytes** (int): *Size of the error output*
+    - **decode_time** (float): *Time to decode the JSON output, None for a failed call*
+    - **error** (Exception): *Error raised by the call or None*
+    '''
+
+    __slots__ = ('subcommand', 'arguments', 'cli_full', 'transport',
+                 'spawn_time', 'wall_time', 'returncode', 'stdout_bytes',
+                 'stderr_bytes', 'decode_time', 'error')
+
+    def __init__(self, arguments, cli_full=False, transport='process'):
+        self.subcommand = get_subcommand(arguments)
+        self.arguments = redact(arguments)
+        self.cli_full = cli_full
+        self.transport = transport
+        self.spawn_time = None
+        self.wall_time = None
+        self.returncode = None
+        self.stdout_bytes = 0
+        self.stderr_bytes = 0
+        self.decode_time = None
+        self.error = None
+
+    def as_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self):
+        return 'CallRecord({!r}, wall_time={:.4f}, returncode={})'.format(
+            self.subcommand, self.wall_time or 0.0, self.returncode)
+
+
+# upper bounds of the histogram buckets in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+           5.0, 10.0, 30.0, 60.0, float('inf'))
+
+
+class Histogram(object):
+    '''
+    Latency histogram with fixed buckets.
+    '''
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent):
+        '''
+        Estimate the percentile from the buckets, interpolated within the bucket.
+        '''
+        if not self.count:
+            return None
+
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = min(self.buckets[index], self.max)
+                lower = max(lower, self.min)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+
+class Profiler(object):
+    '''
+    In-memory aggregation of CallRecords per subcommand.
+    Register it with `add_hook(profiler)` or use `profile()`.
+
+    **Args**:
+    > - **keep_records** (bool): *[optional] Keep every CallRecord in `records`*
+    '''
+
+    def __init__(self, keep_records=False):
+        self.keep_records = keep_records
+        self.records = []
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            if self.keep_records:
+                self.records.append(record)
+
+            stats = self._stats.get(record.subcommand)
+            if stats is None:
+                stats = self._stats[record.subcommand] = {
+                    'wall_time': Histogram(),
+                    'spawn_time': Histogram(),
+                    'decode_time': Histogram(),
+                    'errors': 0,
+                    'stdout_bytes': 0,
+                    'stderr_bytes': 0
+                }
+            stats['wall_time'].add(record.wall_time or 0.0)
+            if record.spawn_time is not None:
+                stats['spawn_time'].add(record.spawn_time)
+            if record.decode_time is not None:
+                stats['decode_time'].add(record.decode_time)
+            if record.error is not None:
+                stats['errors'] += 1
+            stats['stdout_bytes'] += record.stdout_bytes
+            stats['stderr_bytes'] += record.stderr_bytes
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+            self._stats = {}
+
+    def histogram(self, subcommand, measure='wall_time'):
+        '''
+        Get the Histogram of a measure ('wall_time', 'spawn_time' or 'decode_time') of a subcommand.
+        '''
+        with self._lock:
+            stats = self._stats.get(subcommand)
+        return stats[measure] if stats else Histogram()
+
+    def summary(self):
+        '''
+        Get the statistics per subcommand, the slowest total time first.
+
+        **Returns**:
+        > - Dict[str, Dict]
+        '''
+        with self._lock:
+            items = list(self._stats.items())
+
+        summary = {}
+        for subcommand, stats in sorted(items,
+                                        key=lambda item: -item[1]['wall_time'].total):
+            wall_time = stats['wall_time']
+            summary[subcommand] = {
+                'calls': wall_time.count,
+                'errors': stats['errors'],
+                'total': wall_time.total,
+                'mean': wall_time.mean,
+                'p50': wall_time.percentile(50),
+                'p95': wall_time.percentile(95),
+                'p99': wall_time.percentile(99),
+                'max': wall_time.max,
+                'spawn_mean': stats['spawn_time'].mean,
+                'decode_mean': stats['decode_time'].mean,
+                'stdout_bytes': stats['stdout_bytes'],
+                'stderr_bytes': stats['stderr_bytes']
+            }
+        return summary
+
+    def report(self):
+        '''
+        Get the summary as a text table. Times are in milliseconds.
+        '''
+
+        def milliseconds(value):
+            return '-' if value is None else '{:.1f}'.format(value * 1000)
+
+        columns = ('calls', 'errors', 'total', 'mean', 'p50', 'p95', 'p99',
+                   'max', 'spawn_mean', 'decode_mean', 'stdout_bytes')
+        rows = [('subcommand', ) + columns]
+        for subcommand, stats in self.summary().items():
+            rows.append((str(subcommand), ) + tuple(
+                str(stats[column]) if column in ('calls', 'errors',
+                                                 'stdout_bytes') else
+                milliseconds(stats[column]) for column in columns))
+
+        widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+        return '\n'.join('  '.join(value.ljust(width) if index == 0 else value.rjust(width)
+                                   for index, (value, width) in enumerate(zip(row, widths)))
+                         for row in rows)
+
+
+@contextlib.contextmanager
+def profile(keep_records=False):
+    '''
+    Record all CLI calls while the context is active.
+    Calls of other threads running at the same time get recorded as well.
+
+    **Returns**:
+    > - Profiler
+    '''
+    profiler = Profiler(keep_records=keep_records)
+    add_hook(profiler)
+    try:
+        yield profiler
+    finally:
+        remove_hook(profiler)
@@ -0,0 +1,308 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Pipelined bulk ingest.
+
+The items to ingest are read by a discovery thread into a bounded queue,
+so ingesting starts while the discovery is still running and a slow ingest
+holds back the discovery instead of filling up the memory.
+Use it with daselement_api.api.ingest_many().
+'''
+
+import collections
+import json
+import os
+import threading
+import time
+
+try:
+    import queue
+except ImportError:  # pragma: no cover
+    import Queue as queue
+
+from .batch import Result
+from .scanner import get_sequence_files
+
+_STOP = object()
+
+
+def get_path_size(path):
+    '''
+    Get the size in bytes of a file or all files of a file sequence.
+    '''
+    size = 0
+    for file_path in get_sequence_files(path):
+        try:
+            size += os.path.getsize(file_path)
+        except OSError:
+            pass
+    return size
+
+
+def read_manifest(manifest_path):
+    '''
+    Read the items to ingest from a manifest file.
+    The manifest is a JSON list or a file with one JSON object per line.
+    Each item contains the arguments of `ingest`, like `path`, `mapping`, `category`, `tags` and `metadata`.
+    '''
+    with open(manifest_path) as manifest:
+        content = manifest.read().strip()
+
+    if content.startswith('['):
+        return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+class IngestStats(object):
+    '''
+    Live statistics of a bulk ingest.
+
+    - **queued** (int): *Number of items read from the discovery*
+    - **completed** (int): *Number of ingested items*
+    - **failed** (int): *Number of failed items*
+    - **skipped** (int): *Number of items skipped as already ingested by the journal*
+    - **bytes** (int): *Size of the ingested files*
+    '''
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.bytes = 0
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+
+    @property
+    def items_per_second(self):
+        return self.completed / max(self.elapsed, 1e-9)
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / max(self.elapsed, 1e-9)
+
+    def as_dict(self):
+        return {
+            'queued': self.queued,
+            'completed': self.completed,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'bytes': self.bytes,
+            'elapsed': self.elapsed,
+            'items_per_second': self.items_per_second,
+            'bytes_per_second': self.bytes_per_second
+        }
+
+    def __repr__(self):
+        return 'IngestStats({})'.format(', '.join(
+            '{}={}'.format(key, round(value, 2) if isinstance(value, float)
+                           else value) for key, value in self.as_dict().items()))
+
+
+class IngestPipeline(object):
+    '''
+    Ingest items concurrently while they are discovered.
+
+    **Args**:
+    > - **ingest** (Callable): *Function to ingest one item with the arguments of `api.ingest`*
+    > - **workers** (int): *[optional] Number of ingests running at the same time*
+    > - **queue_size** (int): *[optional] Maximum number of discovered items waiting to be ingested*
+    > - **mapping_limits** (Dict[str, int]): *[optional] Maximum number of ingests running at the same time per mapping. Items of a mapping at its limit wait aside, the workers go on with the items of other mappings*
+    > - **progress** (Callable[[IngestStats], None]): *[optional] Called after each item*
+    > - **continue_on_error** (bool): *[optional] Continue with the other items if one fails*
+    > - **journal** (IngestJournal): *[optional] Journal to skip already ingested paths and record the state of each path*
+    '''
+
+    def __init__(self,
+                 ingest,
+                 workers=4,
+                 queue_size=64,
+                 mapping_limits=None,
+                 progress=None,
+                 continue_on_error=True,
+                 journal=None):
+        self.ingest = ingest
+        self.journal = journal
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.mapping_limits = {
+            mapping: threading.BoundedSemaphore(limit)
+            for mapping, limit in (mapping_limits or {}).items()
+        }
+        self.progress = progress
+        self.continue_on_error = continue_on_error
+        self.stats = IngestStats()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # mapping -> items waiting for a free slot of the mapping
+        self._waiting = {}
+
+    def _discover(self, items, tasks, errors):
+        try:
+            for index, item in enumerate(items):
+                if self._stop.is_set():
+                    break
+                with self._lock:
+                    self.stats.queued += 1
+                tasks.put((index, item))
+        except Exception as error:
+            errors.append(error)
+            self._stop.set()
+        finally:
+            for _ in range(self.workers):
+                tasks.put(_STOP)
+
+    def _ingest(self, index, item):
+        journal = self.journal
+        started = False
+        try:
+            # a done path without an element UUID is skipped as well,
+            # ingesting it again would duplicate the element
+            if journal is not None and journal.is_done(item['path']):
+                with self._lock:
+                    self.stats.skipped += 1
+                return Result(index, item,
+                              value={'uuid': journal.completed_uuid(item['path'])})
+
+            # a move mapping removes the files from the path
+            size = get_path_size(item['path'])
+            if journal is not None:
+                journal.record(item['path'], 'started')
+                started = True
+            value = self.ingest(**item)
+            if journal is not None:
+                journal.record(
+                    item['path'], 'done',
+                    value.get('uuid') if isinstance(value, dict) else None)
+        except Exception as error:
+            if started and journal.state(item['path']) == 'started':
+                journal.record(item['path'], 'failed')
+            with self._lock:
+                self.stats.failed += 1
+            return Result(index, item, error=error)
+
+        with self._lock:
+            self.stats.completed += 1
+            self.stats.bytes += size
+        return Result(index, item, value=value)
+
+    def _get_mapping(self, task):
+        mapping = task[1].get('mapping') if isinstance(task[1], dict) else None
+        return mapping if mapping in self.mapping_limits else None
+
+    def _acquire(self, mapping, task):
+        # an item of a busy mapping waits aside, the worker takes the next item
+        with self._lock:
+            if self.mapping_limits[mapping].acquire(False):
+                return True
+            self._waiting.setdefault(mapping, collections.deque()).append(task)
+            return False
+
+    def _release(self, mapping):
+        # hands the slot of the mapping over to its next waiting item
+        with self._lock:
+            waiting = self._waiting.get(mapping)
+            if waiting:
+                return waiting.popleft()
+            self.mapping_limits[mapping].release()
+            return None
+
+    def _process(self, task, mapping, results, errors):
+        while task is not None:
+            try:
+                if not self._stop.is_set():
+                    self._run_task(task, results, errors)
+            finally:
+                task = self._release(mapping) if mapping is not None else None
+
+    def _drain(self, results, errors):
+        # the items still waiting for their mapping after the discovery is done
+        while True:
+            with self._lock:
+                mapping = next((mapping for mapping, waiting in
+                                self._waiting.items() if waiting), None)
+                if mapping is None:
+                    return
+                task = self._waiting[mapping].popleft()
+            self.mapping_limits[mapping].acquire()
+            self._process(task, mapping, results, errors)
+
+    def _run_task(self, task, results, errors):
+        try:
+            result = self._ingest(*task)
+        except Exception as error:
+            # a dead worker would block the discovery on a full queue
+            with self._lock:
+                self.stats.failed += 1
+            result = Result(task[0], task[1], error=error)
+        results[result.index] = result
+        if not result.ok and not self.continue_on_error:
+            self._stop.set()
+
+        if self.progress:
+            try:
+                self.progress(self.stats)
+            except Exception as error:
+                errors.append(error)
+                self._stop.set()
+
+    def _work(self, tasks, results, errors):
+        while True:
+            task = tasks.get()
+            try:
+                if task is _STOP:
+                    self._drain(results, errors)
+                    return
+                if self._stop.is_set():
+                    continue
+
+                mapping = self._get_mapping(task)
+                if mapping is not None and not self._acquire(mapping, task):
+                    continue
+                self._process(task, mapping, results, errors)
+            finally:
+                tasks.task_done()
+
+    def run(self, items):
+        '''
+        Ingest all items and return a Result per ingested item in the order of the items.
+        '''
+        tasks = queue.Queue(maxsize=self.queue_size or 0)
+        results = {}
+        errors = []
+
+        threads = [
+            threading.Thread(target=self._discover,
+                             args=(items, tasks, errors))
+        ]
+        threads += [
+            threading.Thread(target=self._work,
+                             args=(tasks, results, errors))
+            for _ in range(self.workers)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        # after a stop the workers keep draining the queue without ingesting,
+        # so the discovery never blocks on a full queue
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        results = [results[index] for index in sorted(results)]
+        if not self.continue_on_error:
+            for result in results:
+                if not result.ok:
+                    raise result.error
+        return results
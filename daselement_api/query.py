@@ -0,0 +1,455 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+In-memory query engine over a snapshot of the elements of a library.
+
+Tags and categories have inverted indexes (ID -> element IDs), numeric
+fields and the creation date have sorted indexes. A query intersects the
+element ID sets of its filters, starting with the smallest one. The
+indexes follow the writes of API calls made in this process.
+Create it with daselement_api.api.create_query_index().
+
+Tag expressions combine tag IDs or names with AND, OR, NOT and
+parentheses, like `fire AND (smoke OR flame) AND NOT torch`. Names with
+spaces are quoted: `"muzzle flash" OR explosion`.
+'''
+
+import bisect
+import re
+import threading
+
+SORTED_FIELDS = ('id', 'rating', 'width', 'height', 'resolution',
+                 'frame_count', 'created_at')
+
+_TOKEN = re.compile(r'\(|\)|"[^"]*"|\'[^\']*\'|[^\s()]+')
+_KEYWORDS = ('AND', 'OR', 'NOT')
+
+
+def get_sort_value(element, field):
+    '''
+    Get the value of an element for a sorted index or None if it has none.
+    Numbers stored as strings, like the rating, are compared as numbers.
+    '''
+    if field == 'resolution':
+        width = get_sort_value(element, 'width')
+        height = get_sort_value(element, 'height')
+        return width * height if width is not None and height is not None else None
+
+    value = element.get(field)
+    if value is None or value == '':
+        return None
+    if field == 'created_at':
+        return str(value)
+    try:
+        return float(value) if isinstance(value, float) else int(value)
+    except (TypeError, ValueError):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
+class SortedIndex(object):
+    '''
+    Sorted list of (value, element ID) pairs of one field.
+    Added and removed pairs are collected and merged into the list on the next read.
+    '''
+
+    def __init__(self):
+        self._entries = []
+        self._added = []
+        # pairs of the sorted list that are removed
+        self._removed = set()
+
+    def __len__(self):
+        return len(self._entries) - len(self._removed) + len(self._added)
+
+    def add(self, value, element_id):
+        entry = (value, element_id)
+        if entry in self._removed:
+            self._removed.discard(entry)
+        else:
+            self._added.append(entry)
+
+    def remove(self, value, element_id):
+        entry = (value, element_id)
+        entries = self._entries
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            self._removed.add(entry)
+        elif entry in self._added:
+            self._added.remove(entry)
+
+    def build(self, entries):
+        self._entries = sorted(entries)
+        self._added = []
+        self._removed = set()
+
+    def _merge(self):
+        if not self._added and not self._removed:
+            return self._entries
+        entries = self._entries
+        if self._removed:
+            entries = [entry for entry in entries if entry not in self._removed]
+        # sorting two sorted runs is a merge
+        self._added.sort()
+        entries = entries + self._added
+        entries.sort()
+        self._entries = entries
+        self._added = []
+        self._removed = set()
+        return entries
+
+    def range(self, low=None, high=None):
+        '''
+        Get the element IDs with a value between low and high, both included. None is open.
+        '''
+        entries = self._merge()
+        start = 0 if low is None else bisect.bisect_left(entries, (low, ))
+        if high is None:
+            end = len(entries)
+        else:
+            # every entry with the value high sorts before (high, inf)
+            end = bisect.bisect_right(entries, (high, float('inf')))
+        return set(element_id for _, element_id in entries[start:end])
+
+    def ordered_ids(self, descending=False):
+        entries = self._merge()
+        entries = reversed(entries) if descending else entries
+        for _, element_id in entries:
+            yield element_id
+
+
+class QueryIndex(object):
+    '''
+    Query engine over the elements of a library.
+
+    **Args**:
+    > - **elements** (Iterable[Dict]): *Elements of the library*
+    > - **library_path** (str): *[optional] File path to the library file (.lib), to follow the writes of API calls*
+    '''
+
+    def __init__(self, elements=(), library_path=None):
+        self.library_path = library_path
+        self._listeners = None
+        self._lock = threading.RLock()
+        self._elements = {}
+        self._element_ids = {}
+        self._values = {}
+        self._tags = {}
+        self._categories = {}
+        # tag and category names and IDs -> ID
+        self._tag_ids = {}
+        self._category_ids = {}
+        self._sorted = {field: SortedIndex() for field in SORTED_FIELDS}
+        # element IDs without a value per sorted field
+        self._missing = {field: set() for field in SORTED_FIELDS}
+
+        entries = {field: [] for field in SORTED_FIELDS}
+        for element in elements:
+            self._add(element, sort=False)
+            for field, value in self._values[element['id']].items():
+                entries[field].append((value, element['id']))
+        for field, index in self._sorted.items():
+            index.build(entries[field])
+
+    def listen(self, listeners):
+        '''
+        Register the index to receive API calls of the list of listeners.
+        '''
+        self._listeners = listeners
+        listeners.append(self.on_command)
+
+    def close(self):
+        if self._listeners is not None and self.on_command in self._listeners:
+            self._listeners.remove(self.on_command)
+        self._listeners = None
+
+    def __len__(self):
+        return len(self._elements)
+
+    # --- indexing ---
+
+    def _add(self, element, sort=True):
+        element_id = element['id']
+        self._remove(element_id)
+        self._elements[element_id] = element
+        self._element_ids[element.get('uuid')] = element_id
+
+        for tag in element.get('tags') or []:
+            tag_id = tag.get('id') or tag.get('name')
+            self._tags.setdefault(tag_id, set()).add(element_id)
+            self._tag_ids[tag_id] = tag_id
+            if tag.get('name'):
+                self._tag_ids.setdefault(tag['name'], tag_id)
+
+        category_id = element.get('category_id')
+        if category_id:
+            self._categories.setdefault(category_id, set()).add(element_id)
+            self._category_ids[category_id] = category_id
+            category = element.get('category')
+            if hasattr(category, 'get') and category.get('name'):
+                self._category_ids.setdefault(category['name'], category_id)
+
+        values = {}
+        for field in SORTED_FIELDS:
+            value = get_sort_value(element, field)
+            if value is None:
+                self._missing[field].add(element_id)
+                continue
+            values[field] = value
+            if sort:
+                self._sorted[field].add(value, element_id)
+        self._values[element_id] = values
+
+    def _remove(self, element_id):
+        element = self._elements.pop(element_id, None)
+        if element is None:
+            return
+
+        self._element_ids.pop(element.get('uuid'), None)
+        for missing in self._missing.values():
+            missing.discard(element_id)
+        for tag in element.get('tags') or []:
+            element_ids = self._tags.get(tag.get('id') or tag.get('name'))
+            if element_ids is not None:
+                element_ids.discard(element_id)
+        element_ids = self._categories.get(element.get('category_id'))
+        if element_ids is not None:
+            element_ids.discard(element_id)
+        for field, value in self._values.pop(element_id, {}).items():
+            self._sorted[field].remove(value, element_id)
+
+    def add(self, elements):
+        '''
+        Insert or replace elements.
+        '''
+        with self._lock:
+            for element in elements:
+                self._add(element)
+
+    def remove(self, element_uuids):
+        with self._lock:
+            for element_uuid in element_uuids:
+                element_id = self._element_ids.get(element_uuid)
+                if element_id is not None:
+                    self._remove(element_id)
+
+    # --- tag expressions ---
+
+    def _tag(self, tag):
+        tag_id = self._tag_ids.get(tag)
+        return set(self._tags.get(tag_id, ())) if tag_id is not None else set()
+
+    def match_tags(self, expression):
+        '''
+        Get the element IDs matching a tag expression like `fire AND (smoke OR flame)`.
+        '''
+        tokens = [
+            token[1:-1] if token[:1] in ('"', "'") else token
+            for token in _TOKEN.findall(expression)
+        ]
+        position = [0]
+
+        def peek():
+            return tokens[position[0]] if position[0] < len(tokens) else None
+
+        def take():
+            token = peek()
+            position[0] += 1
+            return token
+
+        def parse_or():
+            result = parse_and()
+            while peek() == 'OR':
+                take()
+                result = result | parse_and()
+            return result
+
+        def parse_and():
+            result = parse_not()
+            while peek() not in (None, 'OR', ')'):
+                if peek() == 'AND':
+                    take()
+                result = result & parse_not()
+            return result
+
+        def parse_not():
+            if peek() == 'NOT':
+                take()
+                return set(self._elements) - parse_not()
+            return parse_atom()
+
+        def parse_atom():
+            token = take()
+            if token == '(':
+                result = parse_or()
+                if take() != ')':
+                    raise ValueError(
+                        'Missing closing parenthesis in tag expression: {}'.
+                        format(expression))
+                return result
+            if token is None or token in _KEYWORDS or token == ')':
+                raise ValueError('Invalid tag expression: {}'.format(expression))
+            return self._tag(token)
+
+        with self._lock:
+            result = parse_or()
+            if peek() is not None:
+                raise ValueError('Invalid tag expression: {}'.format(expression))
+        return result
+
+    # --- queries ---
+
+    def query(self,
+              tags=None,
+              category=None,
+              media_type=None,
+              ranges=None,
+              order_by=None,
+              limit=None,
+              offset=0):
+        '''
+        Get the elements matching all filters.
+
+        **Args**:
+        > - **tags** (str | List[str]): *[optional] Tag expression like `fire AND NOT smoke` or list of tags the elements need all*
+        > - **category** (str | List[str]): *[optional] Category ID or name, or a list of them of which the element needs one*
+        > - **media_type** (str): *[optional] Media type like 'sequence'*
+        > - **ranges** (Dict[str, Tuple]): *[optional] (minimum, maximum) per field of SORTED_FIELDS, both included, None is open*
+        > - **order_by** (str): *[optional] Field of SORTED_FIELDS, descending with a leading '-' like '-created_at'. Default: element ID*
+        > - **limit** (int): *[optional] Maximum number of elements*
+        > - **offset** (int): *[optional] Number of elements to skip*
+
+        **Returns**:
+        > - List[Dict]
+        '''
+        with self._lock:
+            element_ids = self._match(tags, category, media_type, ranges)
+            ordered = self._order(element_ids, order_by)
+            end = None if limit is None else offset + limit
+            return [
+                self._elements[element_id]
+                for element_id in _slice(ordered, offset, end)
+            ]
+
+    def count(self, tags=None, category=None, media_type=None, ranges=None):
+        with self._lock:
+            element_ids = self._match(tags, category, media_type, ranges)
+            return len(self._elements) if element_ids is None else len(
+                element_ids)
+
+    def _match(self, tags, category, media_type, ranges):
+        # None stands for all elements
+        sets = []
+        if tags is not None:
+            if isinstance(tags, str):
+                sets.append(self.match_tags(tags))
+            else:
+                sets += [self._tag(tag) for tag in tags]
+        if category is not None:
+            categories = [category] if isinstance(category, str) else category
+            element_ids = set()
+            for value in categories:
+                category_id = self._category_ids.get(value)
+                element_ids |= self._categories.get(category_id, set())
+            sets.append(element_ids)
+        for field, (low, high) in (ranges or {}).items():
+            if field not in self._sorted:
+                raise ValueError('No sorted index for field: {}. Options: {}'.
+                                 format(field, ', '.join(SORTED_FIELDS)))
+            sets.append(self._sorted[field].range(low, high))
+
+        if not sets and media_type is None:
+            return None
+
+        if sets:
+            sets.sort(key=len)
+            element_ids = set(sets[0])
+            for other in sets[1:]:
+                element_ids &= other
+        else:
+            element_ids = set(self._elements)
+
+        if media_type is not None:
+            element_ids = set(
+                element_id for element_id in element_ids
+                if self._elements[element_id].get('media_type') == media_type)
+        return element_ids
+
+    def _order(self, element_ids, order_by):
+        field = (order_by or 'id').lstrip('-')
+        descending = bool(order_by) and order_by.startswith('-')
+        if field not in self._sorted:
+            raise ValueError('No sorted index for field: {}. Options: {}'.format(
+                field, ', '.join(SORTED_FIELDS)))
+
+        index = self._sorted[field]
+        if element_ids is not None and len(element_ids) * 8 < len(index):
+            # sorting a small result is cheaper than walking the index
+            with_value = [
+                element_id for element_id in element_ids
+                if field in self._values[element_id]
+            ]
+            ordered = sorted(
+                with_value,
+                key=lambda element_id:
+                (self._values[element_id][field], element_id),
+                reverse=descending)
+        else:
+            ordered = (element_id for element_id in index.ordered_ids(descending)
+                       if element_ids is None or element_id in element_ids)
+
+        # elements without a value come last
+        missing = self._missing[field]
+        if element_ids is not None:
+            missing = missing & element_ids
+        return _chain(ordered, sorted(missing))
+
+    # --- write-through ---
+
+    def on_command(self, config, name, arguments, result):
+        '''
+        Apply writes of API calls to the index.
+        '''
+        library_path = arguments.get('library_path')
+        if library_path not in (None, self.library_path):
+            return
+
+        if name in ('update', 'ingest'):
+            if not isinstance(result, dict) or 'id' not in result:
+                return
+            entity_type = str(arguments.get('entity_type', 'element')).lower()
+            if entity_type == 'element':
+                self.add([result])
+            elif entity_type == 'tag' and result.get('name'):
+                with self._lock:
+                    self._tag_ids[result['name']] = result['id']
+            elif entity_type == 'category' and result.get('name'):
+                with self._lock:
+                    self._category_ids[result['name']] = result['id']
+        elif name in ('delete_element', 'delete_elements'):
+            if result is None or not arguments.get('delete_from_database'):
+                return
+            self.remove(
+                arguments.get('element_uuids')
+                or [arguments.get('element_uuid')])
+
+
+def _chain(*iterables):
+    for iterable in iterables:
+        for item in iterable:
+            yield item
+
+
+def _slice(iterable, start, end):
+    for position, item in enumerate(iterable):
+        if end is not None and position >= end:
+            return
+        if position >= start:
+            yield item
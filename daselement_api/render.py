@@ -0,0 +1,313 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Local scheduler for rendering the proxies of many elements.
+
+Each render is one `render-element-proxies` CLI call. The scheduler runs
+them in priority order with a concurrency cap and only starts another
+render while the host stays within its CPU and memory budget.
+Failed renders are retried. Use it with
+daselement_api.api.render_many_element_proxies().
+'''
+
+import heapq
+import itertools
+import os
+import threading
+import time
+
+from .batch import Result
+
+
+def get_cpu_count():
+    return os.cpu_count() or 1
+
+
+def get_load():
+    '''
+    Get the 1 minute load average of the host or None if it is unknown.
+    '''
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+def get_available_memory():
+    '''
+    Get the available memory of the host in bytes or None if it is unknown.
+    '''
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError, ValueError):
+        pass
+    return None
+
+
+class RenderJob(object):
+    '''
+    Render of the proxies of one element for one template mapping.
+    '''
+
+    __slots__ = ('index', 'element_uuid', 'mapping', 'library_path',
+                 'priority', 'attempts', 'ready_at')
+
+    def __init__(self, index, element_uuid, mapping, library_path=None,
+                 priority=0):
+        self.index = index
+        self.element_uuid = element_uuid
+        self.mapping = mapping
+        self.library_path = library_path
+        self.priority = priority
+        self.attempts = 0
+        self.ready_at = 0.0
+
+    def __repr__(self):
+        return 'RenderJob({!r}, {!r}, priority={})'.format(
+            self.element_uuid, self.mapping, self.priority)
+
+
+class RenderStats(object):
+    '''
+    Live statistics of the scheduled renders.
+
+    - **total** (int): *Number of submitted renders*
+    - **completed** (int): *Number of successful renders*
+    - **failed** (int): *Number of renders that failed after all retries*
+    - **retried** (int): *Number of retried render attempts*
+    - **running** (int): *Number of renders running right now*
+    '''
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.running = 0
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+
+    @property
+    def remaining(self):
+        return self.total - self.completed - self.failed
+
+    @property
+    def eta(self):
+        '''
+        Estimated seconds until all renders are done or None before the first render is done.
+        '''
+        done = self.completed + self.failed
+        if not done:
+            return None
+        if not self.remaining:
+            return 0.0
+        # the throughput so far includes the effect of the concurrency
+        return self.remaining * self.elapsed / done
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'completed': self.completed,
+            'failed': self.failed,
+            'retried': self.retried,
+            'running': self.running,
+            'elapsed': self.elapsed,
+            'eta': self.eta
+        }
+
+    def __repr__(self):
+        return 'RenderStats({})'.format(', '.join(
+            '{}={}'.format(key, round(value, 2) if isinstance(value, float)
+                           else value) for key, value in self.as_dict().items()))
+
+
+class RenderScheduler(object):
+    '''
+    Run proxy renders on the local host in priority order.
+
+    A new render only starts while the load average is below `cpu_budget` of the CPU cores
+    and at least `memory_reserve` bytes of memory are available. One render always runs,
+    so a busy host slows the renders down but never stops them.
+
+    **Args**:
+    > - **render** (Callable): *Function to render one element with the arguments of `api.render_element_proxies`*
+    > - **workers** (int): *[optional] Maximum number of renders running at the same time (Default: half of the CPU cores)*
+    > - **cpu_budget** (float): *[optional] Share of the CPU cores the host load may use before no further render starts, None disables the check*
+    > - **memory_reserve** (int): *[optional] Bytes of memory that need to stay available to start a render, None disables the check*
+    > - **retries** (int): *[optional] Number of retries of a failed render*
+    > - **retry_delay** (float): *[optional] Seconds before a failed render is retried, doubled with every retry*
+    > - **progress** (Callable[[RenderStats], None]): *[optional] Called after each finished render*
+    '''
+
+    # seconds between two checks of the host budget while waiting
+    POLL_INTERVAL = 0.5
+
+    def __init__(self,
+                 render,
+                 workers=None,
+                 cpu_budget=0.8,
+                 memory_reserve=None,
+                 retries=2,
+                 retry_delay=5.0,
+                 progress=None):
+        self.render = render
+        self.workers = max(1, workers or get_cpu_count() // 2)
+        self.cpu_budget = cpu_budget
+        self.memory_reserve = memory_reserve
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.progress = progress
+        self.stats = RenderStats()
+        self._jobs = []
+        # (-priority, submit order, job) of the jobs ready to start
+        self._ready = []
+        # (ready_at, submit order, job) of the retries waiting for their delay
+        self._waiting = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+
+    def submit(self, element_uuid, mapping, library_path=None, priority=0):
+        '''
+        Add a render. Renders with a higher priority start first,
+        renders with the same priority in the order they were added.
+
+        **Returns**:
+        > - RenderJob
+        '''
+        with self._condition:
+            job = RenderJob(len(self._jobs), element_uuid, mapping,
+                            library_path, priority)
+            self._jobs.append(job)
+            self._push(job)
+            self.stats.total += 1
+            self._condition.notify()
+        return job
+
+    def stop(self):
+        '''
+        Do not start any further renders. Running renders finish.
+        '''
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _push(self, job):
+        if job.ready_at > time.monotonic():
+            heapq.heappush(self._waiting,
+                           (job.ready_at, next(self._order), job))
+        else:
+            heapq.heappush(self._ready, (-job.priority, next(self._order), job))
+
+    def _release_waiting(self, now):
+        while self._waiting and self._waiting[0][0] <= now:
+            job = heapq.heappop(self._waiting)[2]
+            heapq.heappush(self._ready, (-job.priority, next(self._order), job))
+
+    def _within_budget(self):
+        if self.cpu_budget is not None:
+            load = get_load()
+            if load is not None and load > self.cpu_budget * get_cpu_count():
+                return False
+        if self.memory_reserve is not None:
+            memory = get_available_memory()
+            if memory is not None and memory < self.memory_reserve:
+                return False
+        return True
+
+    def _next_job(self):
+        # called with the condition held, returns None when all jobs are done
+        while True:
+            if self._stop.is_set() or (not self._ready and not self._waiting
+                                       and not self.stats.running):
+                return None
+
+            now = time.monotonic()
+            self._release_waiting(now)
+            if not self._ready:
+                # wait for a retry to get ready or a running render to requeue
+                wake_at = self._waiting[0][0] if self._waiting else None
+                self._condition.wait(
+                    None if wake_at is None else max(wake_at - now, 0.001))
+                continue
+
+            if self.stats.running and not self._within_budget():
+                self._condition.wait(self.POLL_INTERVAL)
+                continue
+
+            self.stats.running += 1
+            return heapq.heappop(self._ready)[2]
+
+    def _work(self, results, errors):
+        while True:
+            with self._condition:
+                job = self._next_job()
+            if job is None:
+                return
+
+            job.attempts += 1
+            try:
+                value = self.render(element_uuid=job.element_uuid,
+                                    mapping=job.mapping,
+                                    library_path=job.library_path)
+                error = None
+            except Exception as render_error:
+                value, error = None, render_error
+
+            with self._condition:
+                self.stats.running -= 1
+                if error is not None and job.attempts <= self.retries:
+                    self.stats.retried += 1
+                    job.ready_at = time.monotonic() + self.retry_delay * 2**(
+                        job.attempts - 1)
+                    self._push(job)
+                    self._condition.notify_all()
+                    continue
+
+                if error is None:
+                    self.stats.completed += 1
+                else:
+                    self.stats.failed += 1
+                results[job.index] = Result(job.index, job, value, error)
+                self._condition.notify_all()
+
+            if self.progress:
+                try:
+                    self.progress(self.stats)
+                except Exception as error:
+                    errors.append(error)
+                    self.stop()
+
+    def run(self):
+        '''
+        Run all submitted renders and wait until they are done.
+
+        **Returns**:
+        > - List[Result]: *Result per render in the order they were submitted. `result.call` is the RenderJob. Renders skipped by `stop` have no result*
+        '''
+        results = {}
+        errors = []
+        threads = [
+            threading.Thread(target=self._work, args=(results, errors))
+            for _ in range(self.workers)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+        return [results[index] for index in sorted(results)]
@@ -0,0 +1,274 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Persistent cache for the results of `predict` and `get_meaningful_frame`.
+
+A result is keyed by the content of the media: the resolved path, the size
+and modification time of each file or frame of a sequence, the content hash
+of the model file and the other arguments. Changed media gets a new key, the
+old entry ages out. Directories are not cached.
+
+The cache is a SQLite database shared by all processes of the user.
+Enable it with daselement_api.api.enable_result_cache().
+
+The cache file is defined by the environment variable
+`DASELEMENT_RESULT_CACHE` (Default: ~/.das-element/cache/results.db)
+'''
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .scanner import get_sequence_files, read_directory, split_frame
+
+RESULT_CACHE_PATH = os.getenv('DASELEMENT_RESULT_CACHE') or os.path.join(
+    os.path.expanduser('~'), '.das-element', 'cache', 'results.db')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+'''
+
+# functions where a single frame stands for its whole sequence
+_SEQUENCE_FRAME_FUNCTIONS = ('get_meaningful_frame', )
+
+
+def get_file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as media_file:
+        for chunk in iter(lambda: media_file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_sequence_frame_files(path):
+    '''
+    Get all frames of the sequence of a single numbered file.
+    '''
+    directory, name = os.path.split(path)
+    parts = split_frame(name)
+    if parts is None:
+        return [path]
+
+    base, _, ext = parts
+    files, _ = read_directory(directory or os.curdir)
+    frames = []
+    for file_name in files:
+        frame_parts = split_frame(file_name)
+        if frame_parts and frame_parts[0] == base and frame_parts[2] == ext:
+            frames.append(os.path.join(directory, file_name))
+    return sorted(frames)
+
+
+class ResultCache(object):
+    '''
+    Content-keyed persistent cache, safe to use from several threads and processes.
+
+    **Args**:
+    > - **path** (str): *[optional] File path of the cache database*
+    > - **max_size** (int): *[optional] Maximum size of the cached results in bytes, the least recently used get evicted*
+    '''
+
+    # writes of the access time are collected and written with the next put
+    TOUCH_BATCH = 256
+    # number of puts between two sums of the sizes written by all processes
+    COUNT_EVERY = 64
+
+    def __init__(self, path=None, max_size=256 * 1024 * 1024):
+        self.path = path or RESULT_CACHE_PATH
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # (model path, size, mtime) -> content hash
+        self._model_hashes = {}
+        self._touched = {}
+        self._puts = 0
+        self._size = 0
+        self._connection = sqlite3.connect(self.path,
+                                           timeout=30,
+                                           check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._migrate()
+            self._evict()
+
+    def _migrate(self):
+        # cache files of older versions have no size per result
+        columns = [
+            row[1] for row in self._connection.execute(
+                'PRAGMA table_info(results)')
+        ]
+        if 'size' not in columns:
+            self._connection.execute(
+                'ALTER TABLE results ADD COLUMN size INTEGER NOT NULL DEFAULT 0')
+            self._connection.execute('UPDATE results SET size = length(value)')
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._connection.commit()
+            self._connection.close()
+
+    # --- keys ---
+
+    def _get_model_hash(self, model):
+        model = os.path.abspath(model)
+        stat = os.stat(model)
+        signature = (model, stat.st_size, stat.st_mtime_ns)
+        model_hash = self._model_hashes.get(signature)
+        if model_hash is None:
+            model_hash = get_file_hash(model)
+            self._model_hashes[signature] = model_hash
+        return model_hash
+
+    def get_key(self, name, arguments):
+        '''
+        Get the cache key of a call or None if the call can not be cached,
+        like for a directory or a missing file.
+
+        **Args**:
+        > - **name** (str): *Name of the API function*
+        > - **arguments** (Dict): *Arguments of the call, with `path` and the optional `model`*
+        '''
+        path = arguments.get('path')
+        if not path:
+            return None
+
+        path = os.path.abspath(path)
+        if name in _SEQUENCE_FRAME_FUNCTIONS and os.path.isfile(path):
+            files = get_sequence_frame_files(path)
+        else:
+            files = get_sequence_files(path)
+        if not files:
+            return None
+
+        digest = hashlib.sha1()
+        digest.update(name.encode('utf8'))
+        digest.update(path.encode('utf8', 'surrogateescape'))
+        try:
+            for file_path in files:
+                stat = os.stat(file_path)
+                digest.update('\0{}\0{}\0{}'.format(
+                    file_path, stat.st_size,
+                    stat.st_mtime_ns).encode('utf8', 'surrogateescape'))
+            if arguments.get('model'):
+                digest.update(
+                    self._get_model_hash(arguments['model']).encode('utf8'))
+        except OSError:
+            return None
+
+        options = {
+            key: value
+            for key, value in arguments.items() if key != 'model'
+        }
+        digest.update(
+            json.dumps(options, sort_keys=True, default=str).encode('utf8'))
+        return digest.hexdigest()
+
+    # --- entries ---
+
+    def get(self, key):
+        '''
+        Get a cached result.
+
+        **Returns**:
+        > - Tuple[bool, Any]: *If the key was found and the result*
+        '''
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value FROM results WHERE key = ?', (key, )).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.TOUCH_BATCH:
+                with self._connection:
+                    self._flush_touched()
+        return True, json.loads(row[0])
+
+    def put(self, key, value):
+        value = json.dumps(value)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO results (key, value, last_used, size) '
+                'VALUES (?, ?, ?, ?)',
+                (key, value, time.time(), len(value)))
+            self._touched.pop(key, None)
+            self._flush_touched()
+            self._puts += 1
+            self._size += len(value)
+            if (self._size > self.max_size
+                    or self._puts % self.COUNT_EVERY == 0):
+                self._evict()
+
+    def _flush_touched(self):
+        if self._touched:
+            self._connection.executemany(
+                'UPDATE results SET last_used = ? WHERE key = ?',
+                [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self):
+        self._size = self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        excess = self._size - self.max_size
+        if excess <= 0:
+            return
+
+        # the least recently used results until their size covers the excess
+        keys = []
+        freed = 0
+        rows = self._connection.execute(
+            'SELECT key, size FROM results ORDER BY last_used')
+        for key, size in rows:
+            if freed >= excess:
+                break
+            keys.append((key, ))
+            freed += size
+        rows.close()
+        self._connection.executemany('DELETE FROM results WHERE key = ?', keys)
+        self.evictions += len(keys)
+        self._size -= freed
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._touched.clear()
+            self._connection.execute('DELETE FROM results')
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': entries,
+            'size': size,
+            'max_size': self.max_size
+        }
@@ -0,0 +1,212 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Client-side routing table from element UUID to library.
+
+Without a library path the CLI searches every library of the config one
+after another. The routing table knows the UUIDs of each library, so the
+call goes straight to the owning library. The table is built in the
+background, until it is ready the CLI searches all libraries as before.
+Building it reads every element of every library, it is kept up to date
+with the ingests and deletes of this process and only rebuilt on request
+or after `max_age`. Enable it with daselement_api.api.enable_uuid_routing().
+'''
+
+import threading
+import time
+
+from .session import get_session
+
+_UUID_SIZE = 16
+
+
+def _uuid_bytes(element_uuid):
+    try:
+        value = bytes.fromhex(str(element_uuid).replace('-', ''))
+    except ValueError:
+        return None
+    return value if len(value) == _UUID_SIZE else None
+
+
+class UUIDSet(object):
+    '''
+    Compact set of UUIDs stored as one sorted bytes array (16 bytes per UUID).
+    '''
+
+    def __init__(self, element_uuids=()):
+        values = sorted(
+            set(value for value in map(_uuid_bytes, element_uuids) if value))
+        self._data = b''.join(values)
+        self._added = set()
+        # UUIDs of the sorted array that got deleted
+        self._removed = set()
+
+    def __len__(self):
+        return (len(self._data) // _UUID_SIZE + len(self._added) -
+                len(self._removed))
+
+    def __contains__(self, element_uuid):
+        value = _uuid_bytes(element_uuid)
+        if value is None:
+            return False
+        if value in self._added:
+            return True
+        if value in self._removed:
+            return False
+        return self._search(value)
+
+    def _search(self, value):
+        data = self._data
+        low, high = 0, len(data) // _UUID_SIZE
+        while low < high:
+            middle = (low + high) // 2
+            offset = middle * _UUID_SIZE
+            candidate = data[offset:offset + _UUID_SIZE]
+            if candidate < value:
+                low = middle + 1
+            elif candidate > value:
+                high = middle
+            else:
+                return True
+        return False
+
+    def add(self, element_uuid):
+        value = _uuid_bytes(element_uuid)
+        if value is None or value in self._added:
+            return
+        if value in self._removed:
+            self._removed.discard(value)
+        elif not self._search(value):
+            self._added.add(value)
+
+    def discard(self, element_uuid):
+        value = _uuid_bytes(element_uuid)
+        if value is None:
+            return
+        if value in self._added:
+            self._added.discard(value)
+        elif self._search(value):
+            self._removed.add(value)
+
+
+class UUIDRouter(object):
+    '''
+    Routing table from element UUID to library path, per config.
+
+    **Args**:
+    > - **max_age** (float): *[optional] Seconds until the table gets rebuilt in the background. None keeps it until `refresh` is called*
+    '''
+
+    # seconds until a failed build of the table is tried again
+    RETRY_INTERVAL = 30.0
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age
+        # config -> (built at, {library path: UUIDSet})
+        self._tables = {}
+        self._refreshing = set()
+        # config -> time of the last failed build
+        self._failed_at = {}
+        self._lock = threading.Lock()
+
+    def refresh(self, config=None):
+        '''
+        Rebuild the routing table for the config from all libraries.
+        This reads every element of every library.
+
+        **Args**:
+        > - **config** (str): *[optional] Config file path (Default: config of the active session)*
+        '''
+        from . import api
+
+        if config is None:
+            config = get_session().config
+
+        tables = {}
+        for library_path in api.get_libraries():
+            tables[library_path] = UUIDSet(
+                element.get('uuid')
+                for element in api.iter_elements(library_path))
+
+        with self._lock:
+            self._tables[config] = (time.monotonic(), tables)
+
+    def _refresh_in_background(self, config):
+        session = get_session()
+
+        def run():
+            try:
+                # the config of the default session might have changed
+                if session.config != config:
+                    raise Exception('Config changed: {}'.format(config))
+                self.refresh(config)
+            except Exception:
+                # the lookups keep the old table or search all libraries
+                with self._lock:
+                    self._failed_at[config] = time.monotonic()
+            else:
+                with self._lock:
+                    self._failed_at.pop(config, None)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(config)
+
+        thread = threading.Thread(target=session.bind(run))
+        thread.daemon = True
+        thread.start()
+
+    def route(self, config, element_uuid):
+        '''
+        Get the library path of the element or None if it is unknown
+        or the table is not built yet.
+        '''
+        now = time.monotonic()
+        with self._lock:
+            built_at, tables = self._tables.get(config, (None, None))
+            stale = built_at is None or (self.max_age is not None
+                                         and now - built_at > self.max_age)
+            failed_at = self._failed_at.get(config)
+            refresh = (stale and config not in self._refreshing
+                       and (failed_at is None
+                            or now - failed_at > self.RETRY_INTERVAL))
+            if refresh:
+                self._refreshing.add(config)
+
+        if refresh:
+            self._refresh_in_background(config)
+
+        for library_path, uuids in (tables or {}).items():
+            if element_uuid in uuids:
+                return library_path
+        return None
+
+    def on_command(self, config, name, arguments, result):
+        '''
+        Add ingested and remove deleted elements of the routing table.
+        '''
+        with self._lock:
+            _, tables = self._tables.get(config, (None, {}))
+        library_path = arguments.get('library_path')
+
+        if name == 'ingest' and isinstance(result, dict):
+            uuids = tables.get(library_path)
+            if uuids is not None and result.get('uuid'):
+                with self._lock:
+                    uuids.add(result['uuid'])
+        elif name in ('delete_element', 'delete_elements'):
+            if result is None or not arguments.get('delete_from_database'):
+                return
+            element_uuids = arguments.get('element_uuids') or [
+                arguments.get('element_uuid')
+            ]
+            libraries = [tables[library_path]] if library_path in tables else (
+                tables.values() if library_path is None else [])
+            with self._lock:
+                for uuids in libraries:
+                    for element_uuid in element_uuids:
+                        uuids.discard(element_uuid)
@@ -0,0 +1,353 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+In-process parallel disk scanner, the equivalent of `get_paths_from_disk`
+without starting the CLI.
+
+Directories are read with os.scandir on a thread pool. Files with a frame
+number in front of the extension are collapsed into file sequences in the
+[fileseq.FileSequence notation](https://github.com/justinfx/fileseq#filesequence)
+used by `ingest`, like `/some/folder/files.1001-1099#.exr`.
+Padding: `#` stands for 4 digits, `@` for 1 digit.
+
+A single numbered file is returned as a plain file path. A version number
+like `shot_v002.mov` is not a frame number. Frames with a different padding
+width, like `file.0001.exr` and `file.01.exr`, are separate sequences; frames
+without leading zeros grow into the next digit, like `file.9-10@.exr`.
+'''
+
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+WORKERS = 8
+'''
+Default number of directories read at the same time
+'''
+
+# frame range and padding of a path in fileseq notation, or printf padding
+_SEQUENCE_TOKEN = re.compile(r'(\d+(-\d+)?(x\d+)?(,\d+(-\d+)?(x\d+)?)*)?[#@]+|%0?\d*d')
+
+_FRAME_FILE = re.compile(r'^(?P<base>.*?)(?P<frame>\d+)(?P<ext>\.[^.\d][^.]*)?$')
+
+# a version number in front of the extension, like shot_v002.mov
+_VERSION_PREFIX = re.compile(r'(?:^|[^A-Za-z])[vV]$')
+
+
+def split_frame(name):
+    '''
+    Split a file name into base name, frame number and extension,
+    like `('fire.', '1001', '.exr')` for `fire.1001.exr`.
+    None if the name has no frame number.
+    '''
+    match = _FRAME_FILE.match(name)
+    if not match or _VERSION_PREFIX.search(match.group('base')):
+        return None
+    return match.group('base'), match.group('frame'), match.group('ext') or ''
+
+
+def _padding_groups(frame_strings):
+    # {padding width: frame strings}. A frame with leading zeros has exactly
+    # the padding of its length, one without leading zeros fits every padding
+    # up to its length and belongs to the widest of them
+    widths = sorted(set(
+        len(frame) for frame in frame_strings
+        if len(frame) > 1 and frame.startswith('0')))
+    groups = {}
+    unpadded = []
+    for frame in frame_strings:
+        if len(frame) > 1 and frame.startswith('0'):
+            groups.setdefault(len(frame), []).append(frame)
+            continue
+        fitting = [width for width in widths if width <= len(frame)]
+        if fitting:
+            groups.setdefault(fitting[-1], []).append(frame)
+        else:
+            unpadded.append(frame)
+    if unpadded:
+        width = min(len(frame) for frame in unpadded)
+        groups.setdefault(width, []).extend(unpadded)
+    return groups
+
+
+def get_padding(width):
+    if width % 4 == 0:
+        return '#' * (width // 4)
+    return '@' * width
+
+
+def format_frame_range(frames):
+    '''
+    Format sorted frame numbers like `1001-1010,1020,1030-1050x2`
+    '''
+    parts = []
+    index = 0
+    count = len(frames)
+    while index < count:
+        start = frames[index]
+        if index + 1 < count:
+            step = frames[index + 1] - start
+            end = index + 1
+            while end + 1 < count and frames[end + 1] - frames[end] == step:
+                end += 1
+            length = end - index + 1
+            if step == 1 or length >= 3:
+                part = '{}-{}'.format(start, frames[end])
+                parts.append(part if step == 1 else '{}x{}'.format(
+                    part, step))
+                index = end + 1
+                continue
+        parts.append(str(start))
+        index += 1
+    return ','.join(parts)
+
+
+def collapse_sequences(directory, names):
+    '''
+    Collapse the file names of a directory into file sequences.
+
+    **Returns**:
+    > - List[Tuple[str, List[int], int]]: *Path in fileseq notation, frame numbers and number of files per path*
+    '''
+    groups = {}
+    paths = []
+    for name in names:
+        parts = split_frame(name)
+        if parts is None:
+            paths.append((os.path.join(directory, name), [], 1))
+            continue
+        base, frame, ext = parts
+        groups.setdefault((base, ext), []).append(frame)
+
+    for (base, ext), frame_strings in groups.items():
+        for width, padded in _padding_groups(frame_strings).items():
+            if len(padded) == 1:
+                name = base + padded[0] + ext
+                paths.append((os.path.join(directory, name), [], 1))
+                continue
+
+            frames = sorted(int(frame) for frame in padded)
+            name = base + format_frame_range(frames) + get_padding(width) + ext
+            paths.append((os.path.join(directory, name), frames, len(padded)))
+
+    paths.sort()
+    return paths
+
+
+def get_sequence_files(path):
+    '''
+    Get the files of a path: the path itself for a file or all existing frames of
+    a file sequence like `/some/folder/files.1001-1099#.exr` or `/some/folder/files.%04d.exr`.
+    '''
+    if os.path.isfile(path):
+        return [path]
+
+    directory, name = os.path.split(path)
+    matches = list(_SEQUENCE_TOKEN.finditer(name))
+    if not matches:
+        return []
+
+    token = matches[-1]
+    frame_name = re.compile('^{}\\d+{}$'.format(re.escape(name[:token.start()]),
+                                               re.escape(name[token.end():])))
+    files, _ = read_directory(directory or os.curdir)
+    return sorted(
+        os.path.join(directory, file_name) for file_name in files
+        if frame_name.match(file_name))
+
+
+def read_directory(directory):
+    '''
+    Get the file names and sub-directory paths of a directory.
+    '''
+    files = []
+    directories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, directories
+
+
+def scan(path, as_sequence=True, workers=None):
+    '''
+    Recursively search for files and sequences in a directory.
+    Yields the paths of each directory as soon as it is read.
+
+    **Args**:
+    > - **path** (str): *file path to a file or a directory to search*
+    > - **as_sequence** (bool): *[optional] detect files with a sequential naming as file sequence, otherwise as individual files*
+    > - **workers** (int): *[optional] Number of directories read at the same time*
+
+    **Returns**:
+    > - Iterator[str]
+    '''
+    for directory, names in scan_directories(path, workers=workers):
+        if as_sequence:
+            for sequence_path, _, _ in collapse_sequences(directory, names):
+                yield sequence_path
+        else:
+            for name in sorted(names):
+                yield os.path.join(directory, name)
+
+
+def scan_directories(path, workers=None):
+    '''
+    Recursively read all directories below the path.
+    Yields (directory path, file names) as soon as a directory is read.
+    '''
+    if not os.path.isdir(path):
+        if os.path.isfile(path):
+            yield os.path.dirname(path), [os.path.basename(path)]
+        return
+
+    with ThreadPoolExecutor(max_workers=workers or WORKERS) as executor:
+        pending = {executor.submit(read_directory, path): path}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                files, directories = future.result()
+                for sub_directory in directories:
+                    pending[executor.submit(read_directory,
+                                            sub_directory)] = sub_directory
+                if files:
+                    yield directory, files
+
+
+# directories changed this short before the scan might change again
+# within the mtime resolution of the file system
+_UNSTABLE_NS = 2 * 10**9
+
+
+def load_state(state_path):
+    try:
+        with open(state_path) as state_file:
+            return json.load(state_file)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def save_state(state_path, state):
+    directory = os.path.dirname(os.path.abspath(state_path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(handle, 'w') as state_file:
+        json.dump(state, state_file)
+    os.replace(temp_path, state_path)
+
+
+def _visit_directory(directory, known):
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+    if known and known['mtime_ns'] == mtime_ns and not known.get('unstable'):
+        return mtime_ns, None, known['directories']
+
+    files, directories = read_directory(directory)
+    return mtime_ns, files, directories
+
+
+def scan_changes(path, state_path, as_sequence=True, workers=None):
+    '''
+    Recursively search for files and sequences that are new or changed
+    since the last scan with the same state file.
+
+    Directories whose modification time did not change are not read again.
+    A sequence with new frames is reported with its full new frame range.
+    A file overwritten in place keeps the modification time of its directory and is not reported.
+    The first scan reports all paths, as does a scan with a missing or broken state file.
+
+    **Args**:
+    > - **path** (str): *directory to search*
+    > - **state_path** (str): *file path of the JSON file storing the directory state between scans*
+    > - **as_sequence** (bool): *[optional] detect files with a sequential naming as file sequence, otherwise as individual files*
+    > - **workers** (int): *[optional] Number of directories read at the same time*
+
+    **Returns**:
+    > - Iterator[str]
+    '''
+    state = load_state(state_path)
+    if state.get('root') != path or state.get('as_sequence') != as_sequence:
+        state = {'root': path, 'as_sequence': as_sequence, 'directories': {}}
+    known_directories = state['directories']
+    visited = {}
+    completed = False
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers or WORKERS) as executor:
+
+            def submit(directory):
+                known = known_directories.get(directory)
+                pending[executor.submit(_visit_directory, directory,
+                                        known)] = directory
+
+            pending = {}
+            submit(path)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory = pending.pop(future)
+                    result = future.result()
+                    if result is None:
+                        continue
+
+                    mtime_ns, files, directories = result
+                    for sub_directory in directories:
+                        submit(sub_directory)
+
+                    if files is None:
+                        visited[directory] = known_directories[directory]
+                        continue
+
+                    if as_sequence:
+                        paths = [
+                            sequence_path for sequence_path, _, _ in
+                            collapse_sequences(directory, files)
+                        ]
+                    else:
+                        paths = [
+                            os.path.join(directory, name)
+                            for name in sorted(files)
+                        ]
+
+                    known = known_directories.get(directory)
+                    known_paths = set(known['paths']) if known else set()
+                    for changed_path in paths:
+                        if changed_path not in known_paths:
+                            yield changed_path
+
+                    visited[directory] = {
+                        'mtime_ns': mtime_ns,
+                        'unstable': time.time() * 10**9 - mtime_ns <
+                        _UNSTABLE_NS,
+                        'entries': len(files) + len(directories),
+                        'directories': directories,
+                        'paths': paths
+                    }
+        completed = True
+    finally:
+        # after a stopped scan the directories that were not reached keep
+        # their previous state, after a full scan they were deleted
+        if not completed:
+            for directory, known in known_directories.items():
+                visited.setdefault(directory, known)
+        state['directories'] = visited
+        save_state(state_path, state)
@@ -0,0 +1,396 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Sessions with their own config, CLI executables, caches, worker pool and metrics.
+
+A Session has every function of daselement_api.api as a method. Several
+sessions with different configs or CLI versions can be used at the same
+time from many threads. The functions of daselement_api.api run on the
+default session, which follows the module settings `api.config`,
+`manager.EXECUTABLE_CLI` / `EXECUTABLE_CLI_FULL` and `manager.WORKER_POOL_SIZE`.
+
+```
+from daselement_api import api as de
+from daselement_api.session import Session
+
+studio = Session(config='/some/path/studio.conf', cli='/path/to/das-element-cli_2.0.3_lin')
+studio.enable_element_cache()
+element = studio.get_element_by_uuid('9947c549c6014a3ca831983275884051')
+
+# the functions of the api module run on the session inside the block
+with studio.activate():
+    libraries = de.get_libraries()
+
+studio.close()
+```
+'''
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+
+from . import compact
+from . import manager
+from . import metrics
+from . import worker
+
+# functions of daselement_api.api that are methods of a Session
+API_FUNCTIONS = (
+    'create_config', 'get_config_presets', 'get_library_presets',
+    'create_library', 'get_libraries', 'get_library_template_mappings',
+    'add_library', 'remove_library', 'get_categories', 'get_category',
+    'get_tags', 'get_tag', 'get_taxonomy', 'get_elements', 'iter_elements',
+    'get_elements_compact', 'get_elements_table', 'open_index',
+    'create_query_index', 'get_element_by_id', 'get_element_by_uuid',
+    'get_element_by_name', 'get_elements_by_ids', 'get_elements_by_uuids',
+    'get_elements_by_names', 'update', 'update_many', 'delete_element',
+    'delete_elements', 'ingest', 'ingest_many', 'predict', 'predict_many',
+    'get_paths_from_disk', 'iter_paths_from_disk',
+    'iter_changed_paths_from_disk', 'get_meaningful_frame',
+    'render_element_proxies', 'render_many_element_proxies', 'batch', 'map',
+    'enable_element_cache', 'disable_element_cache', 'enable_result_cache',
+    'disable_result_cache', 'enable_taxonomy_cache', 'disable_taxonomy_cache',
+    'enable_uuid_routing', 'disable_uuid_routing')
+
+# a context variable, so asyncio tasks have their own active session like threads
+_active_session = contextvars.ContextVar('daselement_session', default=None)
+
+
+def get_session():
+    '''
+    Get the session active in this thread or asyncio task, the default session if none is active.
+    '''
+    session = _active_session.get()
+    return session if session is not None else default_session
+
+
+def _iterate(session, iterator):
+    # generators run their body on each next(), in the thread of the caller
+    try:
+        while True:
+            with session.activate():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        with session.activate():
+            iterator.close()
+
+
+class _SessionFunction(object):
+    # an api function called on a session, with its `quiet` and `raw` variants
+
+    def __init__(self, session, function):
+        self._session = session
+        self._function = function
+        functools.update_wrapper(self, function)
+        for name in ('quiet', 'raw', 'build_command'):
+            if hasattr(function, name):
+                setattr(self, name, session.bind(getattr(function, name)))
+        if hasattr(function, 'cli_full'):
+            self.cli_full = function.cli_full
+
+    def __call__(self, *args, **kwargs):
+        return self._session.bind(self._function)(*args, **kwargs)
+
+    def __repr__(self):
+        return '<{} of {!r}>'.format(self._function.__name__, self._session)
+
+
+class _ApiFunction(object):
+    # descriptor of a Session method calling a function of the api module
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, session, owner=None):
+        from . import api
+
+        function = getattr(api, self.name)
+        if session is None:
+            return function
+        # one bound function per session, built again if the api function was replaced
+        bound = session._functions.get(self.name)
+        if bound is None or bound._function is not function:
+            bound = session._functions[self.name] = _SessionFunction(
+                session, function)
+        return bound
+
+
+class Session(object):
+    '''
+    Config, CLI executables, caches, worker pool and metrics hooks for API calls.
+    Every function of daselement_api.api is a method of the session.
+    A session can be used from many threads at the same time.
+
+    **Args**:
+    > - **config** (str): *[optional] File path to a custom config file (.conf)*
+    > - **cli** (str): *[optional] Path to the CLI executable (Default: environment variable `DASELEMENT_CLI`)*
+    > - **cli_full** (str): *[optional] Path to the full CLI executable (Default: environment variable `DASELEMENT_CLI_FULL`)*
+    > - **workers** (int): *[optional] Number of long-lived CLI worker processes per executable, 0 starts a new CLI process for every call (Default: environment variable `DASELEMENT_CLI_WORKERS`)*
+
+    **Example code**:
+    ```
+    from daselement_api.session import Session
+
+    session = Session(config='/some/path/my-config.conf')
+    libraries = session.get_libraries()
+    output = session.get_elements.raw(library_path)
+    session.close()
+    ```
+    '''
+
+    def __init__(self, config=None, cli=None, cli_full=None, workers=None):
+        self._config = config
+        self._executables = {
+            False: manager.resolve_executable(
+                manager.EXECUTABLE_CLI if cli is None else cli),
+            True: manager.resolve_executable(
+                manager.EXECUTABLE_CLI_FULL if cli_full is None else cli_full),
+        }
+        self.workers = manager.WORKER_POOL_SIZE if workers is None else workers
+        self.lock = threading.RLock()
+        self.listeners = []
+        self.hooks = []
+        self.element_cache = None
+        self.result_cache = None
+        self.taxonomy_cache = None
+        self.uuid_router = None
+        # measured costs of the bulk lookups, see api.BULK_SCAN_THRESHOLD
+        self.lookup_costs = None
+        self._pools = {}
+        self._interners = {}
+        self._functions = {}
+
+    def __repr__(self):
+        return 'Session(config={!r})'.format(self.config)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def config(self):
+        return self._config
+
+    # --- activation ---
+
+    @contextlib.contextmanager
+    def activate(self):
+        '''
+        Run the functions of daselement_api.api on this session in the current thread or asyncio task while the context is active.
+        '''
+        token = _active_session.set(self)
+        try:
+            yield self
+        finally:
+            _active_session.reset(token)
+
+    def bind(self, function):
+        '''
+        Get a function that calls the function with this session active,
+        for example in a thread started by the function.
+        '''
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.activate():
+                result = function(*args, **kwargs)
+            if inspect.isgenerator(result):
+                return _iterate(self, result)
+            return result
+
+        return wrapper
+
+    # --- CLI calls ---
+
+    def get_executable(self, cli_full=False):
+        executable = self._executables[bool(cli_full)]
+        if not executable:
+            raise Exception(
+                'Please define path to Das Element CLI executable by passing `cli` and `cli_full` to the Session, or by setting the environment variables DASELEMENT_CLI and DASELEMENT_CLI_FULL.'
+            )
+        return executable
+
+    def get_pool(self, cli_full=False):
+        '''
+        Get the worker pool of the executable, None if the session runs a new process for every call.
+        '''
+        if not self.workers:
+            return None
+        command = manager.get_worker_command(cli_full,
+                                             self.get_executable(cli_full))
+        timeout = manager.WORKER_TIMEOUT or None
+        key = (tuple(command), self.workers, timeout)
+        with self.lock:
+            pool = self._pools.get(key)
+            if pool is None or pool._closed:
+                pool = self._pools[key] = worker.WorkerPool(
+                    command, self.workers, timeout=timeout)
+            return pool
+
+    def execute(self, arguments, cli_full=False, verbose=True, raw=False):
+        '''
+        Run the CLI with the arguments and return the decoded JSON output.
+        '''
+        return manager.execute_command(arguments,
+                                       cli_full=cli_full,
+                                       verbose=verbose,
+                                       raw=raw,
+                                       executable=self.get_executable(cli_full),
+                                       pool=self.get_pool(cli_full),
+                                       hooks=self.hooks)
+
+    def iter_command(self, arguments, cli_full=False):
+        '''
+        Run the CLI with the arguments and yield the items of the JSON array output.
+        '''
+        return manager.iter_command(arguments,
+                                    cli_full=cli_full,
+                                    executable=self.get_executable(cli_full))
+
+    def get_interner(self, library_path):
+        '''
+        Get the shared tags, categories and strings of the compact elements of a library.
+
+        **Returns**:
+        > - daselement_api.compact.Interner
+        '''
+        key = (self.config, library_path)
+        with self.lock:
+            interner = self._interners.get(key)
+            if interner is None:
+                interner = self._interners[key] = compact.Interner()
+            return interner
+
+    # --- metrics ---
+
+    def add_hook(self, hook):
+        '''
+        Register a function called with the CallRecord of each CLI call of this session.
+        '''
+        with self.lock:
+            self.hooks = self.hooks + [hook]
+
+    def remove_hook(self, hook):
+        with self.lock:
+            self.hooks = [item for item in self.hooks if item is not hook]
+
+    @contextlib.contextmanager
+    def profile(self, keep_records=False):
+        '''
+        Record the CLI calls of this session while the context is active.
+
+        **Returns**:
+        > - daselement_api.metrics.Profiler
+        '''
+        profiler = metrics.Profiler(keep_records=keep_records)
+        self.add_hook(profiler)
+        try:
+            yield profiler
+        finally:
+            self.remove_hook(profiler)
+
+    def close(self):
+        '''
+        Disable the caches and stop the worker processes of the session.
+        '''
+        with self.activate():
+            self.disable_element_cache()
+            self.disable_result_cache()
+            self.disable_taxonomy_cache()
+            self.disable_uuid_routing()
+
+        with self.lock:
+            self._interners = {}
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+
+for _name in API_FUNCTIONS:
+    setattr(Session, _name, _ApiFunction(_name))
+
+
+def _api():
+    from . import api
+    return api
+
+
+def _manager():
+    return manager
+
+
+def _setting(module, name):
+    # property reading and writing a setting of a module
+
+    def get_setting(session):
+        return getattr(module(), name)
+
+    def set_setting(session, value):
+        setattr(module(), name, value)
+
+    return property(get_setting, set_setting)
+
+
+class _DefaultSession(Session):
+    # the session of the functions of daselement_api.api,
+    # its state is kept in the module settings
+
+    config = _setting(_api, 'config')
+    listeners = _setting(_api, '_listeners')
+    element_cache = _setting(_api, 'element_cache')
+    result_cache = _setting(_api, 'result_cache')
+    taxonomy_cache = _setting(_api, 'taxonomy_cache')
+    uuid_router = _setting(_api, 'uuid_router')
+    workers = _setting(_manager, 'WORKER_POOL_SIZE')
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.hooks = []
+        self.lookup_costs = None
+        self._pools = {}
+        self._interners = {}
+        self._functions = {}
+
+    def __repr__(self):
+        return 'Session(default)'
+
+    def get_executable(self, cli_full=False):
+        return manager.get_executable(cli_full)
+
+    def get_pool(self, cli_full=False):
+        if not self.workers:
+            return None
+        return worker.get_pool(
+            manager.get_worker_command(cli_full, self.get_executable(cli_full)),
+            self.workers,
+            timeout=manager.WORKER_TIMEOUT or None)
+
+    def close(self):
+        # the shared worker pools get stopped at exit
+        with self.activate():
+            self.disable_element_cache()
+            self.disable_result_cache()
+            self.disable_taxonomy_cache()
+            self.disable_uuid_routing()
+
+        with self.lock:
+            self._interners = {}
+
+
+default_session = _DefaultSession()
+'''
+Session of the functions of daselement_api.api
+'''
@@ -0,0 +1,254 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Columnar table of the elements of a library backed by NumPy arrays.
+
+Numeric fields are int64 arrays (-1 for a missing value), strings are
+dictionary encoded (int32 codes into a list of distinct values) and the
+tags of the elements are stored in CSR form: the tags of row `i` are
+`tag_codes[tag_offsets[i]:tag_offsets[i + 1]]`.
+
+NumPy is an optional dependency: `pip install daselement-api[table]`
+Use it with daselement_api.api.get_elements_table().
+'''
+
+from array import array
+
+NUMERIC_COLUMNS = ('id', 'width', 'height', 'frame_first', 'frame_last',
+                   'frame_count', 'channel', 'rating', 'feature_id')
+
+STRING_COLUMNS = ('uuid', 'name', 'number', 'category_id', 'media_type',
+                  'colorspace', 'colorspace_source', 'frame_rate',
+                  'pixel_aspect', 'permission', 'created_at', 'path',
+                  'path_source', 'path_proxy', 'path_thumbnail',
+                  'path_filmstrip')
+
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            'The element table requires NumPy. Install it with: '
+            'pip install daselement-api[table]')
+    return numpy
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+class _Encoder(object):
+    # dictionary encoding of one string column while reading the elements
+
+    def __init__(self):
+        self.codes = array('i')
+        self.values = []
+        self.lookup = {}
+
+    def add(self, value):
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+
+class StringColumn(object):
+    '''
+    Dictionary encoded string column.
+
+    - **codes** (numpy.ndarray): *int32 code per row*
+    - **values** (List[str]): *Distinct values, the code is the index*
+    '''
+
+    __slots__ = ('codes', 'values', '_lookup')
+
+    def __init__(self, codes, values):
+        self.codes = codes
+        self.values = values
+        self._lookup = {value: code for code, value in enumerate(values)}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def code(self, value):
+        '''
+        Get the code of a value or -1 if no row has the value.
+        '''
+        return self._lookup.get(value, -1)
+
+    def equals(self, value):
+        '''
+        Get a boolean mask of the rows with the value.
+        '''
+        return self.codes == self.code(value)
+
+    def isin(self, values):
+        '''
+        Get a boolean mask of the rows with one of the values.
+        '''
+        numpy = import_numpy()
+        codes = [self.code(value) for value in values]
+        return numpy.isin(self.codes, [code for code in codes if code >= 0])
+
+
+class ElementTable(object):
+    '''
+    Columnar table of elements. Get a column with `table['width']`.
+
+    **Example code**:
+    ```
+    table = de.get_elements_table(library_path)
+
+    mask = ((table['width'] >= 3840)
+            & table['media_type'].equals('sequence')
+            & (table['frame_count'] > 100)
+            & (table['rating'] >= 3)
+            & table.has_tag('Q3196'))
+    element_ids = table['id'][mask]
+    ```
+    '''
+
+    def __init__(self, columns, tag_offsets, tag_codes, tags):
+        self.columns = columns
+        self.tag_offsets = tag_offsets
+        self.tag_codes = tag_codes
+        # distinct tags, the tag code is the index
+        self.tags = tags
+        self._tag_lookup = {}
+        for code, tag in enumerate(tags):
+            for key in ('id', 'name'):
+                if tag.get(key) is not None:
+                    self._tag_lookup.setdefault(tag[key], code)
+        self._tag_rows = None
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def tag_code(self, tag):
+        '''
+        Get the code of a tag by ID or name, -1 for an unknown tag.
+        '''
+        return self._tag_lookup.get(tag, -1)
+
+    def _get_tag_rows(self):
+        # row number of each entry of tag_codes
+        if self._tag_rows is None:
+            numpy = import_numpy()
+            self._tag_rows = numpy.repeat(
+                numpy.arange(len(self), dtype=numpy.int64),
+                numpy.diff(self.tag_offsets))
+        return self._tag_rows
+
+    def has_tag(self, tag):
+        '''
+        Get a boolean mask of the rows with the tag (ID or name).
+        '''
+        numpy = import_numpy()
+        mask = numpy.zeros(len(self), dtype=bool)
+        code = self.tag_code(tag)
+        if code >= 0:
+            mask[self._get_tag_rows()[self.tag_codes == code]] = True
+        return mask
+
+    def has_all_tags(self, tags):
+        numpy = import_numpy()
+        mask = numpy.ones(len(self), dtype=bool)
+        for tag in tags:
+            mask &= self.has_tag(tag)
+        return mask
+
+    def has_any_tags(self, tags):
+        numpy = import_numpy()
+        codes = [self.tag_code(tag) for tag in tags]
+        mask = numpy.zeros(len(self), dtype=bool)
+        hits = numpy.isin(self.tag_codes, [code for code in codes if code >= 0])
+        mask[self._get_tag_rows()[hits]] = True
+        return mask
+
+    def row_tags(self, row):
+        '''
+        Get the tags of a row.
+        '''
+        start, end = self.tag_offsets[row], self.tag_offsets[row + 1]
+        return [self.tags[code] for code in self.tag_codes[start:end]]
+
+    def row(self, row):
+        '''
+        Get the values of a row as a dict. Tags are listed, the category only by its ID.
+        '''
+        values = {}
+        for name, column in self.columns.items():
+            value = column[row]
+            values[name] = value if isinstance(column,
+                                               StringColumn) else int(value)
+        values['tags'] = self.row_tags(row)
+        return values
+
+    def rows(self, mask):
+        '''
+        Get the row numbers of a boolean mask.
+        '''
+        return import_numpy().flatnonzero(mask)
+
+
+def build_table(elements):
+    '''
+    Build an ElementTable from an iterable of element dicts.
+    The elements are read one at a time, the dicts are not kept.
+    '''
+    numpy = import_numpy()
+
+    numeric = {name: array('q') for name in NUMERIC_COLUMNS}
+    strings = {name: _Encoder() for name in STRING_COLUMNS}
+    tag_offsets = array('q', [0])
+    tag_codes = array('i')
+    tags = []
+    tag_lookup = {}
+
+    for element in elements:
+        for name, values in numeric.items():
+            values.append(_as_int(element.get(name)))
+        for name, encoder in strings.items():
+            value = element.get(name)
+            encoder.add(value if value is None else str(value))
+        for tag in element.get('tags') or []:
+            key = tag.get('id') or tag.get('name')
+            code = tag_lookup.get(key)
+            if code is None:
+                code = tag_lookup[key] = len(tags)
+                tags.append(tag)
+            tag_codes.append(code)
+        tag_offsets.append(len(tag_codes))
+
+    columns = {
+        name: numpy.frombuffer(values, dtype=numpy.int64).copy()
+        for name, values in numeric.items()
+    }
+    for name, encoder in strings.items():
+        columns[name] = StringColumn(
+            numpy.frombuffer(encoder.codes, dtype=numpy.int32).copy(),
+            encoder.values)
+
+    return ElementTable(columns,
+                        numpy.frombuffer(tag_offsets, dtype=numpy.int64).copy(),
+                        numpy.frombuffer(tag_codes, dtype=numpy.int32).copy(),
+                        tags)
@@ -0,0 +1,332 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Cached tags and categories of a library with the category hierarchy.
+
+All tags and categories are loaded once per library. Tags and categories
+are found by ID like 'Q3196' or by name like 'fire'. The ancestors and
+descendants of each category are computed when the taxonomy is loaded.
+Enable it with daselement_api.api.enable_taxonomy_cache().
+'''
+
+import copy
+import threading
+import time
+
+
+def _entity_ids(entities):
+    # parents and children are lists of entities or IDs
+    for entity in entities or []:
+        entity_id = entity.get('id') if isinstance(entity, dict) else entity
+        if entity_id:
+            yield entity_id
+
+
+def _entity_keys(values):
+    # tags and categories of the API calls are IDs, names or entities
+    if values is None or isinstance(values, (str, dict)):
+        values = [values]
+    for value in values:
+        if isinstance(value, dict):
+            value = value.get('id') or value.get('name')
+        if value:
+            yield value
+
+
+class Taxonomy(object):
+    '''
+    Tags and categories of a library.
+
+    **Args**:
+    > - **tags** (List[Dict]): *All tags of the library, like the result of `get_tags`*
+    > - **categories** (List[Dict]): *All categories of the library, like the result of `get_categories`*
+    '''
+
+    def __init__(self, tags, categories):
+        self.loaded_at = time.monotonic()
+        # the elements_count of the tags and categories changed since loading
+        self.counts_stale = False
+        self.tags = {}
+        self.categories = {}
+        self._tag_keys = {}
+        self._category_keys = {}
+
+        for tag in tags:
+            self.tags[tag['id']] = tag
+        for category in categories:
+            self.categories[category['id']] = category
+
+        # IDs win over names of other entities
+        for entities, keys in ((self.tags, self._tag_keys),
+                               (self.categories, self._category_keys)):
+            for entity_id, entity in entities.items():
+                if entity.get('name') is not None:
+                    keys.setdefault(entity['name'], entity_id)
+            keys.update((entity_id, entity_id) for entity_id in entities)
+
+        # the parents keep the order of the CLI, the first one is the main parent.
+        # Parents only known from the children of a category come after them
+        self._parents = {}
+        self._children = {}
+        for category_id, category in self.categories.items():
+            parents = [
+                parent_id for parent_id in _entity_ids(category.get('parents'))
+                if parent_id != category_id
+            ]
+            parents += [
+                parent_id for parent_id in self._parents.get(category_id, ())
+                if parent_id not in parents
+            ]
+            self._parents[category_id] = tuple(parents)
+            self._children.setdefault(category_id, set())
+            for parent_id in self._parents[category_id]:
+                self._children.setdefault(parent_id, set()).add(category_id)
+            for child_id in _entity_ids(category.get('children')):
+                if child_id != category_id:
+                    self._children[category_id].add(child_id)
+                    parents = self._parents.get(child_id, ())
+                    if category_id not in parents:
+                        self._parents[child_id] = parents + (category_id, )
+
+        self._ancestors = {}
+        for category_id in list(self._parents) + list(self._children):
+            self._get_ancestors(category_id)
+        self._descendants = {category_id: set() for category_id in self._ancestors}
+        for category_id, ancestors in self._ancestors.items():
+            for ancestor_id in ancestors:
+                self._descendants.setdefault(ancestor_id, set()).add(category_id)
+        self._descendants = {
+            category_id: frozenset(descendants)
+            for category_id, descendants in self._descendants.items()
+        }
+
+    def _get_ancestors(self, category_id):
+        # iterative, the hierarchy can be deep and might contain cycles
+        if category_id in self._ancestors:
+            return self._ancestors[category_id]
+
+        ancestors = set()
+        stack = list(self._parents.get(category_id, ()))
+        while stack:
+            parent_id = stack.pop()
+            if parent_id in ancestors or parent_id == category_id:
+                continue
+            ancestors.add(parent_id)
+            known = self._ancestors.get(parent_id)
+            if known is not None:
+                ancestors |= known
+            else:
+                stack.extend(self._parents.get(parent_id, ()))
+
+        self._ancestors[category_id] = frozenset(ancestors)
+        return self._ancestors[category_id]
+
+    # --- lookups ---
+
+    def tag_id(self, value):
+        '''
+        Get the tag ID of a tag ID or name, None if it is unknown.
+        '''
+        return self._tag_keys.get(value)
+
+    def category_id(self, value):
+        '''
+        Get the category ID of a category ID or name, None if it is unknown.
+        '''
+        return self._category_keys.get(value)
+
+    def get_tag(self, value):
+        return self.tags.get(self._tag_keys.get(value))
+
+    def get_category(self, value):
+        return self.categories.get(self._category_keys.get(value))
+
+    # --- hierarchy ---
+
+    def parents(self, category):
+        '''
+        Get the IDs of the direct parent categories.
+        '''
+        return list(self._parents.get(self.category_id(category), ()))
+
+    def children(self, category):
+        '''
+        Get the IDs of the direct child categories.
+        '''
+        return sorted(self._children.get(self.category_id(category), ()))
+
+    def ancestors(self, category):
+        '''
+        Get the IDs of all parent categories up to the roots.
+
+        **Returns**:
+        > - FrozenSet[str]
+        '''
+        return self._ancestors.get(self.category_id(category), frozenset())
+
+    def descendants(self, category):
+        '''
+        Get the IDs of all child categories down to the leaves.
+
+        **Returns**:
+        > - FrozenSet[str]
+        '''
+        return self._descendants.get(self.category_id(category), frozenset())
+
+    def is_a(self, category, other):
+        '''
+        Check if the category is the other category or one of its descendants,
+        like `is_a('torch', 'fire')`.
+        '''
+        category_id = self.category_id(category)
+        other_id = self.category_id(other)
+        if category_id is None or other_id is None:
+            return False
+        return category_id == other_id or other_id in self._ancestors.get(
+            category_id, ())
+
+    def parent_chain(self, category):
+        '''
+        Get the category IDs from the category up to its root,
+        following the first parent, like ['Q327954', 'Q235544', 'Q3196'] for torch -> flame -> fire.
+        '''
+        category_id = self.category_id(category)
+        chain = []
+        while category_id is not None and category_id not in chain:
+            chain.append(category_id)
+            parents = self._parents.get(category_id)
+            category_id = parents[0] if parents else None
+        return chain
+
+
+class TaxonomyCache(object):
+    '''
+    Taxonomies per config and library.
+
+    **Args**:
+    > - **max_age** (float): *[optional] Seconds until a taxonomy gets loaded again. None keeps it until an update of a tag or category*
+    '''
+
+    def __init__(self, max_age=300):
+        self.max_age = max_age
+        self._taxonomies = {}
+        self._lock = threading.Lock()
+        self._loading = {}
+
+    def _is_fresh(self, taxonomy, counts):
+        if taxonomy is None or (counts and taxonomy.counts_stale):
+            return False
+        return (self.max_age is None
+                or time.monotonic() - taxonomy.loaded_at <= self.max_age)
+
+    def get(self, config, library_path, counts=False):
+        '''
+        Get the taxonomy of the library, loaded if it is missing or expired.
+        With `counts` it is loaded again as well if the elements_count changed since loading.
+        '''
+        key = (config, library_path)
+        with self._lock:
+            taxonomy = self._taxonomies.get(key)
+            if self._is_fresh(taxonomy, counts):
+                return taxonomy
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        # one thread loads, the others wait for it
+        with loading:
+            with self._lock:
+                taxonomy = self._taxonomies.get(key)
+            if self._is_fresh(taxonomy, counts):
+                return taxonomy
+
+            taxonomy = self.load(library_path)
+            with self._lock:
+                self._taxonomies[key] = taxonomy
+            return taxonomy
+
+    def load(self, library_path):
+        from . import api, decoder
+
+        # raw calls bypass the caches, including this one
+        tags = decoder.loads(api.get_tags.raw(library_path))
+        categories = decoder.loads(api.get_categories.raw(library_path))
+        return Taxonomy(tags or [], categories or [])
+
+    def lookup(self, config, library_path, kind, key=None):
+        '''
+        Get a copy of the cached result of `get_tag` / `get_category` (with the key)
+        or `get_tags` / `get_categories` (without a key). None if the key is unknown.
+        '''
+        # the results contain the elements_count
+        taxonomy = self.get(config, library_path, counts=True)
+        if kind == 'tag':
+            entities, get = taxonomy.tags, taxonomy.get_tag
+        else:
+            entities, get = taxonomy.categories, taxonomy.get_category
+        result = list(entities.values()) if key is None else get(key)
+        return copy.deepcopy(result)
+
+    def invalidate(self, config=None, library_path=None):
+        '''
+        Remove the taxonomy of a library or all taxonomies.
+        '''
+        with self._lock:
+            for key in list(self._taxonomies):
+                if (config is None or key[0] == config) and (
+                        library_path is None or key[1] == library_path):
+                    del self._taxonomies[key]
+
+    def clear(self):
+        self.invalidate()
+
+    def _counts_changed(self, config, library_path):
+        # the hierarchy stays valid, the tags and categories with their
+        # elements_count get loaded again on the next lookup
+        with self._lock:
+            taxonomy = self._taxonomies.get((config, library_path))
+            if taxonomy is not None:
+                taxonomy.counts_stale = True
+
+    def _is_known(self, config, library_path, tags, categories):
+        # new tags get created on the fly by ingests and element updates
+        with self._lock:
+            taxonomy = self._taxonomies.get((config, library_path))
+        if taxonomy is None:
+            return True
+        return all(
+            taxonomy.tag_id(key) is not None
+            for key in _entity_keys(tags)) and all(
+                taxonomy.category_id(key) is not None
+                for key in _entity_keys(categories))
+
+    def on_command(self, config, name, arguments, result):
+        '''
+        Invalidate the taxonomy after API calls that change or create tags and categories,
+        or change the number of elements of a tag or category.
+        '''
+        library_path = arguments.get('library_path')
+        entity_type = str(arguments.get('entity_type', '')).lower()
+        if name == 'update' and entity_type in ('tag', 'category'):
+            self.invalidate(config, library_path)
+        elif name == 'update' and entity_type == 'element':
+            data = arguments.get('data')
+            if not isinstance(data, dict) or not any(
+                    key in data for key in ('tags', 'category', 'category_id')):
+                return
+            if self._is_known(config, library_path, data.get('tags'),
+                              [data.get('category'), data.get('category_id')]):
+                self._counts_changed(config, library_path)
+            else:
+                self.invalidate(config, library_path)
+        elif name == 'ingest':
+            if self._is_known(config, library_path, arguments.get('tags'),
+                              [arguments.get('category')]):
+                self._counts_changed(config, library_path)
+            else:
+                self.invalidate(config, library_path)
+        elif name in ('delete_element', 'delete_elements'):
+            self._counts_changed(config, library_path)
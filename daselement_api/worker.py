@@ -0,0 +1,275 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Pool of long-lived CLI worker processes.
+
+Instead of starting a new CLI process for every call, a worker process is
+started once and keeps its config and database connections open.
+The worker reads one JSON request per line from stdin and writes one JSON
+response per line to stdout:
+
+    request:  {"id": 1, "arguments": ["get-elements", "/some/path/das-element.lib"]}
+    response: {"id": 1, "returncode": 0, "stdout": "[...]", "stderr": ""}
+
+Closing stdin asks the worker to shut down.
+
+Enable the pool by setting the environment variable `DASELEMENT_CLI_WORKERS`
+to the number of worker processes, or by overriding
+daselement_api.manager.WORKER_POOL_SIZE. A local stub worker implementing the
+protocol is available in daselement_api.worker_stub.
+'''
+
+import atexit
+import json
+import subprocess
+import threading
+
+try:
+    import queue
+except ImportError:  # pragma: no cover
+    import Queue as queue
+
+
+class WorkerCrashed(Exception):
+    '''
+    Raised when a worker process dies while handling a request.
+    '''
+
+
+class WorkerTimeout(WorkerCrashed):
+    '''
+    Raised when a worker process does not answer a request in time.
+    The worker process gets killed.
+    '''
+
+
+class Worker(object):
+    '''
+    A single long-lived worker process.
+    '''
+
+    def __init__(self, command, timeout=None):
+        self.command = list(command)
+        self.timeout = timeout
+        self.process = None
+        self._request_id = 0
+
+    def start(self):
+        self.process = subprocess.Popen(self.command,
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        shell=False)
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def request(self, arguments):
+        '''
+        Send a request to the worker and wait for the response.
+
+        Returns a tuple of (returncode, stdout, stderr). Raises WorkerCrashed
+        with `delivered=False` if the request could not be sent, so it is safe
+        to send it again to another worker.
+        '''
+        self._request_id += 1
+        line = json.dumps({
+            'id': self._request_id,
+            'arguments': [str(argument) for argument in arguments]
+        }) + '\n'
+
+        try:
+            self.process.stdin.write(line.encode('utf8'))
+            self.process.stdin.flush()
+        except (AttributeError, IOError, OSError, ValueError):
+            error = WorkerCrashed('Worker process is not running')
+            error.delivered = False
+            raise error
+
+        # a hung worker gets killed, which ends the readline
+        timer = None
+        timed_out = []
+        if self.timeout:
+            process = self.process
+
+            def kill():
+                timed_out.append(True)
+                process.kill()
+
+            timer = threading.Timer(self.timeout, kill)
+            timer.daemon = True
+            timer.start()
+        try:
+            response = self.process.stdout.readline()
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+        if not response or timed_out:
+            self.process.wait()
+            if timed_out:
+                error = WorkerTimeout(
+                    'Worker process did not answer within {} seconds'.format(
+                        self.timeout))
+            else:
+                error = WorkerCrashed(
+                    'Worker process exited with code {} while handling a request'.
+                    format(self.process.returncode))
+            error.delivered = True
+            raise error
+
+        try:
+            data = json.loads(response.decode('utf8', 'ignore'))
+        except ValueError:
+            data = None
+        if not isinstance(data, dict) or data.get('id') != self._request_id:
+            # the next response line might belong to this request
+            self.kill()
+            error = WorkerCrashed(
+                'Worker process answered out of order' if isinstance(data, dict)
+                else 'Worker process sent an invalid response')
+            error.delivered = True
+            raise error
+
+        return (data.get('returncode', 1), data.get('stdout', ''),
+                data.get('stderr', ''))
+
+    def kill(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+        self.stop()
+
+    def stop(self, timeout=5):
+        if self.process is None:
+            return
+
+        process, self.process = self.process, None
+        try:
+            process.stdin.close()
+        except (IOError, OSError):
+            pass
+
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        finally:
+            process.stdout.close()
+
+
+class WorkerPool(object):
+    '''
+    A bounded pool of worker processes. Workers are started on demand and
+    replaced when they crash or do not answer within `timeout` seconds.
+    '''
+
+    def __init__(self, command, size, timeout=None):
+        self.command = list(command)
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _acquire(self):
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._closed:
+                    raise Exception('Worker pool is shut down')
+                if len(self._workers) < self.size:
+                    worker = Worker(self.command, timeout=self.timeout)
+                    self._workers.append(worker)
+                    worker.start()
+                    return worker
+
+            worker = self._idle.get()
+
+        if worker is None:
+            # shut down, wake up the next waiting thread as well
+            self._idle.put(None)
+            raise Exception('Worker pool is shut down')
+        return worker
+
+    def _release(self, worker):
+        if self._closed:
+            worker.stop()
+            return
+        self._idle.put(worker)
+
+    def _respawn(self, worker):
+        worker.stop()
+        with self._lock:
+            if self._closed:
+                return worker
+            worker.start()
+        return worker
+
+    def run(self, arguments):
+        '''
+        Run the CLI arguments on the next free worker.
+
+        Returns a tuple of (returncode, stdout, stderr).
+        '''
+        worker = self._acquire()
+        try:
+            if not worker.is_alive():
+                self._respawn(worker)
+            try:
+                return worker.request(arguments)
+            except WorkerCrashed as error:
+                self._respawn(worker)
+                # a request that never reached the worker is safe to resend
+                if error.delivered:
+                    raise
+                return worker.request(arguments)
+        finally:
+            self._release(worker)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+
+        # threads waiting for a free worker get woken up by the None
+        self._idle.put(None)
+        for worker in workers:
+            worker.stop()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(command, size, timeout=None):
+    '''
+    Get the shared worker pool for the worker command, size and timeout.
+    '''
+    key = (tuple(command), size, timeout)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = _pools[key] = WorkerPool(command, size, timeout=timeout)
+        return pool
+
+
+def shutdown():
+    '''
+    Stop all worker processes.
+    '''
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(shutdown)
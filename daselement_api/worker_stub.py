@@ -0,0 +1,73 @@
+#           __                   __                          __
+#      ____/ /___ ______   ___  / /__  ____ ___  ___  ____  / /_
+#     / __  / __ `/ ___/  / _ \/ / _ \/ __ `__ \/ _ \/ __ \/ __/
+#    / /_/ / /_/ (__  )  /  __/ /  __/ / / / / /  __/ / / / /_
+#    \__,_/\__,_/____/   \___/_/\___/_/ /_/ /_/\___/_/ /_/\__/
+#
+#                  Copyright (c) 2026 das element
+'''
+Local stub worker implementing the worker protocol of daselement_api.worker
+without the Das Element CLI.
+
+Every request is answered with the received arguments and the process ID of
+the worker. Some arguments trigger special behaviour:
+
+- `stub-fail`: answer with exit code 1 and an error message
+- `stub-crash`: exit the worker process without answering
+- `stub-sleep <seconds>`: wait before answering
+
+Usage:
+
+```python
+import sys
+from daselement_api import manager as de_manager
+
+de_manager.WORKER_POOL_SIZE = 4
+de_manager.WORKER_COMMAND = [sys.executable, '-m', 'daselement_api.worker_stub']
+```
+'''
+
+import json
+import os
+import sys
+import time
+
+
+def handle(arguments):
+    if 'stub-crash' in arguments:
+        os._exit(3)
+
+    if 'stub-sleep' in arguments:
+        time.sleep(float(arguments[arguments.index('stub-sleep') + 1]))
+
+    if 'stub-fail' in arguments:
+        return 1, '', 'Stub failure for: {}'.format(' '.join(arguments))
+
+    return 0, json.dumps({'arguments': arguments, 'pid': os.getpid()}), ''
+
+
+def main():
+    stdin = getattr(sys.stdin, 'buffer', sys.stdin)
+    stdout = getattr(sys.stdout, 'buffer', sys.stdout)
+
+    for line in iter(stdin.readline, b''):
+        if not line.strip():
+            continue
+
+        request = json.loads(line.decode('utf8'))
+        if 'stub-garbage' in request.get('arguments', []):
+            # a log line in front of the response
+            stdout.write(b'Loading library\n')
+        returncode, output, error = handle(request.get('arguments', []))
+        response = json.dumps({
+            'id': request.get('id'),
+            'returncode': returncode,
+            'stdout': output,
+            'stderr': error
+        }) + '\n'
+        stdout.write(response.encode('utf8'))
+        stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+from daselement_api.session import Session
+
+STUB_CLI = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'benchmarks', 'stub_cli.py')
+
+LIBRARY_PATH = '/mnt/library/das-element.lib'
+
+
+@pytest.fixture
+def session(monkeypatch):
+    # a session running the synthetic CLI of the benchmarks
+    monkeypatch.setenv('STUB_CLI_ELEMENTS', '200')
+    session = Session(cli=STUB_CLI, cli_full=STUB_CLI, workers=0)
+    yield session
+    session.close()
@@ -0,0 +1,44 @@
+import asyncio
+import threading
+
+from daselement_api import aio
+from daselement_api.taxonomy import Taxonomy, TaxonomyCache
+
+from conftest import LIBRARY_PATH
+
+
+class ThreadRecordingCache(TaxonomyCache):
+
+    def __init__(self):
+        super(ThreadRecordingCache, self).__init__(max_age=None)
+        self.threads = []
+
+    def load(self, library_path):
+        self.threads.append(threading.current_thread())
+        return Taxonomy([{'id': 'T1', 'name': 'fire'}], [])
+
+
+def test_steps_run_outside_of_the_event_loop(session):
+    cache = ThreadRecordingCache()
+    session.taxonomy_cache = cache
+    session.listeners.append(cache.on_command)
+
+    async def main():
+        with session.activate():
+            return await aio.get_tags(LIBRARY_PATH)
+
+    assert asyncio.run(main()) == [{'id': 'T1', 'name': 'fire'}]
+    assert cache.threads and threading.main_thread() not in cache.threads
+
+
+def test_call_runs_the_cli_of_the_task_session(session):
+
+    async def main():
+        with session.activate():
+            elements = await aio.get_elements(LIBRARY_PATH)
+            element = await aio.get_element_by_id(LIBRARY_PATH, elements[3]['id'])
+        return elements, element
+
+    elements, element = asyncio.run(main())
+    assert len(elements) == 200
+    assert element['uuid'] == elements[3]['uuid']
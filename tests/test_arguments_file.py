@@ -0,0 +1,32 @@
+import pytest
+
+from daselement_api import manager
+
+from conftest import LIBRARY_PATH
+
+
+def long_command():
+    # one argument longer than a single command line argument may be
+    return ['get-element-by-name', LIBRARY_PATH, 'x' * 200000]
+
+
+def test_too_long_command_raises(session, monkeypatch):
+    monkeypatch.setattr(manager, 'ARGUMENTS_FILE', False)
+    with pytest.raises(Exception) as error:
+        session.execute(long_command(), verbose=False)
+    assert 'too long for the command line' in str(error.value)
+
+
+def test_arguments_file_opt_in(session, monkeypatch):
+    monkeypatch.setattr(manager, 'ARGUMENTS_FILE', True)
+    # the stub CLI reads @file arguments and reports the missing element
+    with pytest.raises(Exception) as error:
+        session.execute(long_command(), verbose=False)
+    assert 'too long' not in str(error.value)
+
+
+def test_delete_elements_gets_chunked(session):
+    uuids = ['{:032x}'.format(index) for index in range(20000)]
+    with session.profile(keep_records=True) as profiler:
+        session.delete_elements.quiet(uuids, library_path=LIBRARY_PATH)
+    assert len(profiler.records) > 1
@@ -0,0 +1,50 @@
+import time
+
+from daselement_api import api as de
+from daselement_api import batch
+
+
+def slow(value, seconds=0.0):
+    time.sleep(seconds)
+    if value < 0:
+        raise ValueError('negative value: {}'.format(value))
+    return value * 2
+
+
+def test_batch_order():
+    calls = [(slow, (value, 0.2 if value == 0 else 0.0)) for value in range(5)]
+    results = list(de.batch(calls, workers=5))
+    assert [result.index for result in results] == list(range(5))
+    assert [result.value for result in results] == [0, 2, 4, 6, 8]
+
+    # unordered results come as soon as they are completed
+    results = list(de.batch(calls, workers=5, ordered=False))
+    assert results[-1].index == 0
+    assert sorted(result.index for result in results) == list(range(5))
+
+
+def test_errors_are_results():
+    progress = []
+    calls = [(slow, (1, )), (slow, (-1, )), (slow, (), {'value': 3})]
+    results = list(de.batch(calls, workers=2,
+                            progress=lambda done, total: progress.append((done, total))))
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].value is None
+    assert results[1].call == (slow, (-1, ), {})
+    assert results[2].value == 6
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_map():
+    results = list(de.map(slow, [3, (-2, 0.0), 1], workers=2))
+    assert [result.value for result in results] == [6, None, 2]
+    assert not results[1].ok
+    assert de.map is batch.map
+
+    # the builtin map stays usable in the api module
+    assert 'map' not in vars(de)
+
+
+def test_session_map(session):
+    assert [result.value for result in session.map(slow, [1, 2])] == [2, 4]
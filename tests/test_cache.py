@@ -0,0 +1,81 @@
+from daselement_api import cache as cache_module
+from daselement_api.cache import ElementCache
+from conftest import LIBRARY_PATH
+
+
+def element(element_id):
+    return {'id': element_id, 'uuid': 'uuid{}'.format(element_id),
+            'name': 'fire_{:05d}'.format(element_id), 'tags': []}
+
+
+def test_lookups_share_an_entry():
+    cache = ElementCache()
+    cache.put(None, LIBRARY_PATH, element(1))
+    assert cache.get(None, LIBRARY_PATH, 'id', 1) == element(1)
+    assert cache.get(None, LIBRARY_PATH, 'name', 'fire_00001') == element(1)
+    # UUIDs are found without a library path
+    assert cache.get(None, None, 'uuid', 'uuid1') == element(1)
+    assert cache.get('/other.conf', LIBRARY_PATH, 'id', 1) is None
+
+    # the cached element is a copy
+    cache.get(None, LIBRARY_PATH, 'id', 1)['tags'].append('fire')
+    assert cache.get(None, LIBRARY_PATH, 'id', 1)['tags'] == []
+
+
+def test_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+    cache = ElementCache(ttl=10)
+    cache.put(None, LIBRARY_PATH, element(1))
+    now[0] += 9
+    assert cache.get(None, LIBRARY_PATH, 'id', 1) is not None
+    now[0] += 2
+    assert cache.get(None, LIBRARY_PATH, 'id', 1) is None
+    assert cache.stats()['size'] == 0
+
+
+def test_lru():
+    cache = ElementCache(maxsize=2)
+    cache.put(None, LIBRARY_PATH, element(1))
+    cache.put(None, LIBRARY_PATH, element(2))
+    cache.get(None, LIBRARY_PATH, 'id', 1)
+    cache.put(None, LIBRARY_PATH, element(3))
+    assert cache.get(None, LIBRARY_PATH, 'id', 2) is None
+    assert cache.get(None, LIBRARY_PATH, 'name', 'fire_00001') is not None
+    assert cache.get(None, LIBRARY_PATH, 'uuid', 'uuid3') is not None
+    assert cache.stats() == {'hits': 3, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2}
+
+
+def test_invalidation_on_writes():
+    cache = ElementCache()
+    for element_id in (1, 2, 3):
+        cache.put(None, LIBRARY_PATH, element(element_id))
+
+    def cached():
+        return [element_id for element_id in (1, 2, 3)
+                if cache.get(None, LIBRARY_PATH, 'id', element_id)]
+
+    cache.on_command(None, 'get_element_by_id', {'library_path': LIBRARY_PATH}, element(1))
+    cache.on_command(None, 'update', {
+        'library_path': LIBRARY_PATH, 'entity_type': 'Element', 'entity_id': 1}, element(1))
+    assert cached() == [2, 3]
+    cache.on_command(None, 'delete_elements', {
+        'library_path': LIBRARY_PATH, 'element_uuids': ['uuid2']}, True)
+    assert cached() == [3]
+    # tags are part of the elements
+    cache.on_command(None, 'update', {'library_path': LIBRARY_PATH, 'entity_type': 'Tag'}, {})
+    assert cached() == []
+
+
+def test_session_cache(session):
+    calls = []
+    session.add_hook(lambda record: calls.append(record.subcommand))
+    session.enable_element_cache()
+    first = session.get_element_by_id(LIBRARY_PATH, 1)
+    assert session.get_element_by_name(LIBRARY_PATH, first['name']) == first
+    assert session.get_element_by_uuid(first['uuid']) == first
+    assert calls == ['get-element-by-id']
+
+    session.update(LIBRARY_PATH, 'Element', 1, {'rating': 5})
+    session.get_element_by_id(LIBRARY_PATH, 1)
+    assert calls == ['get-element-by-id', 'update', 'get-element-by-id']
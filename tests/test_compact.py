@@ -0,0 +1,64 @@
+import copy
+
+from daselement_api.compact import Category, Element, Interner, Tag
+from conftest import LIBRARY_PATH
+
+FIRE = {'id': 'Q3196', 'name': 'fire', 'type': 'default', 'elements_count': 56}
+TORCH = {'child_counter': 1, 'id': 'Q327954', 'name': 'torch', 'type': 'default'}
+
+
+def element(element_id, tags=(FIRE, )):
+    return {
+        'id': element_id,
+        'uuid': 'uuid{}'.format(element_id),
+        'name': 'torch_{:05d}'.format(element_id),
+        'category': copy.deepcopy(TORCH),
+        'category_id': 'Q327954',
+        'colorspace': ''.join(['ACES', '2065-1']),
+        'tags': copy.deepcopy(list(tags)),
+        'metadata': {'shot': 'a010'},
+        'width': 1920,
+    }
+
+
+def test_interning():
+    interner = Interner()
+    first, second = interner.element(element(1)), interner.element(element(2))
+    assert isinstance(first['category'], Category)
+    assert isinstance(first['tags'][0], Tag)
+    assert first['category'] is second['category']
+    assert first['tags'][0] is second['tags'][0]
+    assert first['colorspace'] is second['colorspace']
+
+    # a changed count replaces the one instance of the tag
+    third = interner.element(element(3, [dict(FIRE, elements_count=57)]))
+    assert third['tags'][0]['elements_count'] == 57
+    assert interner.element(element(4))['tags'][0] is not first['tags'][0]
+    assert len(interner._tags) == 1
+
+    interner.clear()
+    assert interner.element(element(5))['category'] is not first['category']
+
+
+def test_to_dict_round_trip():
+    data = element(1, [FIRE, {'id': 'something', 'name': 'something custom tag',
+                              'type': 'custom', 'elements_count': 1}])
+    compact = Interner().element(data)
+    assert compact.to_dict() == data
+    assert type(compact.to_dict()['tags']) is list
+    assert dict(compact['category']) == TORCH
+    assert compact['metadata'] == {'shot': 'a010'}
+    assert 'path' not in compact and compact.get('path') is None
+    assert set(compact) == set(data)
+
+    empty = Element()
+    assert len(empty) == 0 and empty.to_dict() == {}
+
+
+def test_session_elements(session):
+    elements = session.get_elements(LIBRARY_PATH)
+    compact = session.get_elements_compact(LIBRARY_PATH)
+    assert [element.to_dict() for element in compact] == elements
+    # the interner of the library is kept by the session
+    again = session.get_elements_compact(LIBRARY_PATH)
+    assert again[0]['category'] is compact[0]['category']
@@ -0,0 +1,57 @@
+import sys
+
+import pytest
+
+from daselement_api import decoder
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = decoder.backend
+    yield
+    decoder.set_backend(backend)
+
+
+def installed_backends():
+    backends = []
+    for name in decoder.BACKENDS:
+        try:
+            decoder._import_backend(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+def test_fastest_installed_backend(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    monkeypatch.setitem(sys.modules, 'ujson', None)
+    decoder.set_backend()
+    assert decoder.backend == 'json'
+
+
+def test_environment_backend(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'ujson', None)
+    for name in ('ujson', 'yaml'):
+        monkeypatch.setenv('DASELEMENT_JSON', name)
+        with pytest.warns(UserWarning, match='DASELEMENT_JSON={}'.format(name)):
+            assert decoder._environment_backend()[0] == 'json'
+
+    monkeypatch.setenv('DASELEMENT_JSON', 'json')
+    assert decoder._environment_backend()[0] == 'json'
+    with pytest.raises(ValueError):
+        decoder.set_backend('yaml')
+
+
+@pytest.mark.parametrize('backend', installed_backends())
+def test_bytes_and_text(backend):
+    decoder.set_backend(backend)
+    data = '[{"name": "fire_00001", "tags": [{"name": "flamme été"}], "rating": 3}]'
+    expected = [{'name': 'fire_00001', 'tags': [{'name': 'flamme été'}], 'rating': 3}]
+    assert decoder.loads(data) == expected
+    assert decoder.loads(data.encode('utf8')) == expected
+
+    # invalid UTF-8 is dropped like in the text output of the CLI
+    assert decoder.loads(b'{"name": "fire\xff_00001"}') == {'name': 'fire_00001'}
+    with pytest.raises(ValueError):
+        decoder.loads(b'{"name": ')
@@ -0,0 +1,72 @@
+from daselement_api import api as de
+from daselement_api.index import ElementIndex
+
+
+class Library(object):
+    # the session of the index, lists the elements instead of the CLI
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.reads = 0
+
+    def iter_elements(self, library_path):
+        self.reads += 1
+        return iter([dict(element) for element in self.elements])
+
+
+def element(element_id, uuid, tags=()):
+    return {
+        'id': element_id,
+        'uuid': uuid,
+        'name': uuid,
+        'tags': [{'id': tag} for tag in tags]
+    }
+
+
+def open_index(tmp_path, library, refresh=False):
+    index = ElementIndex('/library', path=str(tmp_path / 'index.db'))
+    index.session = library
+    if refresh or index.high_water_mark() is None:
+        index.refresh()
+    return index
+
+
+def test_open_reads_the_library_only_once(tmp_path, monkeypatch):
+    library = Library([element(1, 'a', ['T1']), element(2, 'b')])
+    monkeypatch.setattr(de, 'ElementIndex', lambda *args, **kwargs: index)
+
+    index = ElementIndex('/library', path=str(tmp_path / 'index.db'))
+    index.session = library
+    de.open_index('/library').close()
+    assert library.reads == 1
+
+    index = ElementIndex('/library', path=str(tmp_path / 'index.db'))
+    index.session = library
+    opened = de.open_index('/library')
+    assert library.reads == 1
+    assert opened.count() == 2
+    opened.close()
+
+
+def test_refresh_adds_new_elements(tmp_path):
+    library = Library([element(1, 'a'), element(2, 'b')])
+    index = open_index(tmp_path, library)
+    library.elements.append(element(3, 'c', ['T1']))
+    assert index.refresh() == 1
+    assert index.get_by_uuid('c')['id'] == 3
+    assert [item['id'] for item in index.filter(tag_ids=['T1'])] == [3]
+    index.close()
+
+
+def test_write_drops_tags_of_a_changed_id(tmp_path):
+    library = Library([element(1, 'a', ['T1'])])
+    index = open_index(tmp_path, library)
+    library.elements = [element(5, 'a', ['T2'])]
+    index.rebuild()
+    index.add([element(6, 'a', ['T2'])])
+    assert index.filter(tag_ids=['T1']) == []
+    assert [item['id'] for item in index.filter(tag_ids=['T2'])] == [6]
+    rows = index._connection.execute(
+        'SELECT element_id FROM element_tags').fetchall()
+    assert rows == [(6, )]
+    index.close()
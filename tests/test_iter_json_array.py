@@ -0,0 +1,58 @@
+import io
+import json
+import random
+
+import pytest
+
+from daselement_api.manager import iter_json_array
+
+
+def random_value(rng, depth=0):
+    kind = rng.choice(['int', 'float', 'exp', 'string', 'literal', 'dict', 'list']
+                      if depth < 3 else ['int', 'float', 'exp', 'string', 'literal'])
+    if kind == 'int':
+        return rng.randint(-10**12, 10**12)
+    if kind == 'float':
+        return round(rng.uniform(-1000, 1000), rng.randint(0, 6))
+    if kind == 'exp':
+        return rng.uniform(-1, 1) * 10**rng.randint(-30, 30)
+    if kind == 'string':
+        return ''.join(rng.choice('ab "\\\n,]}é火') for _ in range(rng.randint(0, 8)))
+    if kind == 'literal':
+        return rng.choice([True, False, None])
+    if kind == 'dict':
+        return {str(index): random_value(rng, depth + 1) for index in range(rng.randint(0, 3))}
+    return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+
+
+def dumps(rng, values):
+    separator = rng.choice([',', ', ', ' ,\n ', ',\t'])
+    text = rng.choice(['[', ' [ ', '[\n']) + separator.join(
+        json.dumps(value, ensure_ascii=rng.random() < 0.5) for value in values)
+    return (text + rng.choice([']', ' ]', '\n]\n'])).encode('utf8')
+
+
+def parse(data, chunk_size):
+    return list(iter_json_array(io.BytesIO(data), chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize('data, chunk_size', [(b'[1.5, 2]', 3), (b'["a", 1.25]', 8),
+                                              (b'[1e5,-2E-3]', 2), (b'[]', 1)])
+def test_numbers_at_chunk_boundaries(data, chunk_size):
+    assert parse(data, chunk_size) == json.loads(data)
+
+
+def test_fuzz_chunk_sizes():
+    rng = random.Random(4)
+    for _ in range(300):
+        values = [random_value(rng) for _ in range(rng.randint(0, 12))]
+        data = dumps(rng, values)
+        for chunk_size in (1, 2, 3, 5, 8, 13, 64):
+            assert parse(data, chunk_size) == json.loads(data)
+
+
+def test_invalid_array():
+    with pytest.raises(ValueError):
+        parse(b'[1, 2', 2)
+    with pytest.raises(ValueError):
+        parse(b'{"a": 1}', 4)
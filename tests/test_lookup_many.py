@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from daselement_api import api
+from daselement_api.session import Session
+from conftest import LIBRARY_PATH
+
+
+class Router(object):
+    # routes every UUID to the library
+
+    def route(self, config, element_uuid):
+        return LIBRARY_PATH
+
+
+def record_subcommands(session, monkeypatch):
+    # the CLI calls of the lookups and the scanned libraries
+    subcommands = []
+    session.add_hook(lambda record: subcommands.append(record.subcommand))
+    iter_elements = api.iter_elements
+
+    def scan(library_path):
+        subcommands.append(('scan', library_path))
+        return iter_elements(library_path)
+
+    monkeypatch.setattr(api, 'iter_elements', scan)
+    return subcommands
+
+
+def test_parallel_lookups(session, monkeypatch):
+    subcommands = record_subcommands(session, monkeypatch)
+    elements = session.get_elements_by_ids(LIBRARY_PATH, [2, 999, 1, 2])
+    assert list(elements) == [2, 999, 1]
+    assert elements[1]['id'] == 1 and elements[2]['id'] == 2
+    assert elements[999] is None
+    assert subcommands == ['get-element-by-id'] * 3
+
+
+def test_scan(session, monkeypatch):
+    monkeypatch.setattr(api, 'BULK_SCAN_THRESHOLD', 2)
+    names = [element['name'] for element in session.get_elements(LIBRARY_PATH)[:3]]
+    names = [names[2], 'missing', names[0]]
+    subcommands = record_subcommands(session, monkeypatch)
+    elements = session.get_elements_by_names(LIBRARY_PATH, names)
+    assert list(elements) == names
+    assert [elements[name] and elements[name]['id'] for name in names] == [3, None, 1]
+    assert subcommands == [('scan', LIBRARY_PATH)]
+
+
+def test_scan_without_library_path(session, monkeypatch):
+    monkeypatch.setattr(api, 'BULK_SCAN_THRESHOLD', 2)
+    uuids = [element['uuid'] for element in session.get_elements(LIBRARY_PATH)[:3]]
+    subcommands = record_subcommands(session, monkeypatch)
+
+    # without a routing table the CLI searches the libraries for each key
+    assert all(session.get_elements_by_uuids(uuids).values())
+    assert subcommands == ['get-element-by-uuid'] * 3
+
+    del subcommands[:]
+    session.uuid_router = Router()
+    try:
+        assert all(session.get_elements_by_uuids(uuids).values())
+    finally:
+        session.uuid_router = None
+    assert subcommands == [('scan', LIBRARY_PATH)]
+
+
+def test_errors_are_raised(session, tmp_path):
+    with pytest.raises(Exception, match='Das Element CLI executable'):
+        Session(cli='', cli_full='', workers=0).get_elements_by_ids(LIBRARY_PATH, [1, 2])
+
+    cli = tmp_path / 'locked_cli'
+    cli.write_text('#!/bin/sh\necho "library is locked" >&2\nexit 2\n')
+    os.chmod(str(cli), 0o755)
+    locked = Session(cli=str(cli), cli_full=str(cli), workers=0)
+    with pytest.raises(Exception, match='exit code 2: library is locked'):
+        locked.get_elements_by_ids(LIBRARY_PATH, [1, 2])
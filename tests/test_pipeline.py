@@ -0,0 +1,143 @@
+import os
+import threading
+
+import pytest
+
+from daselement_api.journal import IngestJournal
+from daselement_api.pipeline import IngestPipeline
+
+
+def ingest(path, **kwargs):
+    if path.endswith('fail'):
+        raise Exception('Ingest failed: ' + path)
+    return {'uuid': path}
+
+
+def run(pipeline, items, timeout=10):
+    # fails instead of hanging the test run
+    outcome = {}
+
+    def target():
+        try:
+            outcome['results'] = pipeline.run(items)
+        except Exception as error:
+            outcome['error'] = error
+
+    thread = threading.Thread(target=target)
+    thread.daemon = True
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'pipeline hangs'
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['results']
+
+
+def test_failed_items_are_results():
+    items = [{'path': '/items/{}{}'.format(index, 'fail' if index % 3 else '')}
+             for index in range(50)]
+    pipeline = IngestPipeline(ingest, workers=2, queue_size=2)
+    results = run(pipeline, items)
+    assert [result.index for result in results] == list(range(50))
+    assert pipeline.stats.failed == sum(not result.ok for result in results)
+    assert pipeline.stats.completed == 17
+
+
+def test_broken_item_does_not_hang(tmp_path):
+    items = [{'path': '/items/{}'.format(index)} for index in range(20)]
+    items[5] = {'mapping': 'no path'}
+    with IngestJournal(str(tmp_path / 'journal.jsonl')) as journal:
+        pipeline = IngestPipeline(ingest, workers=2, queue_size=2,
+                                  journal=journal)
+        results = run(pipeline, items)
+    assert not results[5].ok
+    assert pipeline.stats.failed == 1
+    assert pipeline.stats.completed == 19
+
+
+def test_progress_error_is_raised():
+
+    def progress(stats):
+        raise ValueError('progress failed')
+
+    items = [{'path': '/items/{}'.format(index)} for index in range(20)]
+    pipeline = IngestPipeline(ingest, workers=2, queue_size=2,
+                              progress=progress)
+    with pytest.raises(ValueError):
+        run(pipeline, items)
+
+
+def test_journal_syncs_after_interval(tmp_path, monkeypatch):
+    synced = threading.Event()
+    monkeypatch.setattr('daselement_api.journal.os.fsync',
+                        lambda fileno: synced.set())
+    journal = IngestJournal(str(tmp_path / 'journal.jsonl'),
+                            sync_interval=0.05)
+    try:
+        journal.record('/items/1', 'started')
+        with open(journal.path) as journal_file:
+            assert '/items/1' in journal_file.read()
+        assert synced.wait(2)
+    finally:
+        journal.close()
+
+
+def test_busy_mapping_does_not_block_other_mappings():
+    others_done = threading.Event()
+    done = []
+
+    def ingest_item(path, mapping):
+        if mapping == 'slow':
+            # only finishes once the other mapping got ingested
+            assert others_done.wait(5)
+        done.append(path)
+        if sum(1 for item in done if item.startswith('/fast')) == 10:
+            others_done.set()
+        return {'uuid': path}
+
+    items = [{'path': '/slow/{}'.format(index), 'mapping': 'slow'}
+             for index in range(3)]
+    items += [{'path': '/fast/{}'.format(index), 'mapping': 'fast'}
+              for index in range(10)]
+    pipeline = IngestPipeline(ingest_item, workers=2, queue_size=4,
+                              mapping_limits={'slow': 1})
+    results = run(pipeline, items)
+    assert all(result.ok for result in results)
+    assert len(results) == 13
+    assert done[:10] == ['/fast/{}'.format(index) for index in range(10)]
+
+
+def test_size_is_measured_before_a_move(tmp_path):
+    source = tmp_path / 'clip.mov'
+    source.write_bytes(b'x' * 100)
+
+    def move(path, **kwargs):
+        os.remove(path)
+        return {'uuid': 'moved'}
+
+    pipeline = IngestPipeline(move, workers=1)
+    run(pipeline, [{'path': str(source), 'mapping': 'move'}])
+    assert pipeline.stats.bytes == 100
+
+
+def test_resume_skips_done_paths_without_uuid(tmp_path):
+    journal_path = str(tmp_path / 'journal.jsonl')
+    with IngestJournal(journal_path) as journal:
+        journal.record('/items/0', 'done')
+        journal.record('/items/1', 'done', 'uuid-1')
+        journal.record('/items/2', 'started')
+
+    ingested = []
+
+    def ingest_item(path, **kwargs):
+        ingested.append(path)
+        return True
+
+    items = [{'path': '/items/{}'.format(index)} for index in range(3)]
+    with IngestJournal(journal_path) as journal:
+        pipeline = IngestPipeline(ingest_item, workers=1, journal=journal)
+        results = run(pipeline, items)
+        assert journal.is_done('/items/2')
+    assert ingested == ['/items/2']
+    assert pipeline.stats.skipped == 2
+    assert [result.value for result in results] == [{'uuid': None}, {'uuid': 'uuid-1'}, True]
@@ -0,0 +1,77 @@
+import os
+
+from daselement_api.manager import strip_outer_quotes
+from daselement_api.session import Session
+
+PREDICTION = [{'tag': 'flame', 'id': 'Q235544'}]
+
+
+class PredictSession(Session):
+    # answers `predict` calls like the CLI with the given output paths
+
+    def __init__(self, outputs):
+        super(PredictSession, self).__init__(cli='cli', cli_full='cli')
+        self.outputs = outputs
+        self.commands = []
+
+    def execute(self, arguments, cli_full=False, verbose=True, raw=False):
+        self.commands.append(arguments)
+        paths = [strip_outer_quotes(argument) for argument in arguments[7:]]
+        result = {}
+        for path in paths:
+            for output_path in self.outputs.get(path, [path]):
+                result[output_path] = PREDICTION
+        return result
+
+
+def predict_many(session, paths, **kwargs):
+    results = list(session.predict_many(paths, '/models/model.wit', **kwargs))
+    return sorted(results, key=lambda result: (result.index, result.call))
+
+
+def test_normalized_output_path():
+    session = PredictSession({'/shots/a//clip.mov': ['/shots/a/clip.mov']})
+    results = predict_many(session, ['/shots/b.mov', '/shots/a//clip.mov'])
+    assert [(result.index, result.call) for result in results] == [
+        (0, '/shots/b.mov'), (1, '/shots/a/clip.mov')]
+    assert all(result.ok for result in results)
+
+
+def test_directory_input():
+    session = PredictSession({
+        '/delivery': ['/delivery/a.mov', '/delivery/fire/fire.1001-1010#.exr']
+    })
+    results = predict_many(session, ['/shots/b.mov', '/delivery', '/shots/c.mov'])
+    assert [(result.index, result.call) for result in results] == [
+        (0, '/shots/b.mov'), (1, '/delivery/a.mov'),
+        (1, '/delivery/fire/fire.1001-1010#.exr'), (2, '/shots/c.mov')]
+
+
+def test_missing_path_gets_an_error():
+    session = PredictSession({'/shots/broken.mov': []})
+    results = predict_many(session, ['/shots/b.mov', '/shots/broken.mov'],
+                           chunk_size=5)
+    assert len(session.commands) == 1
+    assert [result.index for result in results] == [0, 1]
+    assert results[0].ok
+    assert not results[1].ok
+    assert '/shots/broken.mov' in str(results[1].error)
+
+
+def test_cached_prediction_of_predict(tmp_path):
+    clip = tmp_path / 'clip.mov'
+    clip.write_bytes(b'clip')
+    model = tmp_path / 'model.wit'
+    model.write_bytes(b'model')
+
+    session = PredictSession({})
+    session.enable_result_cache(path=str(tmp_path / 'cache'))
+    key = session.result_cache.get_key('predict', {
+        'path': str(clip), 'model': str(model), 'top': 2,
+        'filmstrip_frames': 36})
+    # stored by `predict` under the output path of the CLI
+    session.result_cache.put(key, {os.path.join(str(tmp_path), '.', 'clip.mov'): PREDICTION})
+
+    results = list(session.predict_many([str(clip)], str(model)))
+    assert not session.commands
+    assert [result.value for result in results] == [PREDICTION]
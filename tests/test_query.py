@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from daselement_api.query import QueryIndex, SortedIndex
+
+LIBRARY_PATH = '/mnt/library/das-element.lib'
+
+
+def element(element_id, tags, category='Q3196', rating=None, **values):
+    return dict({
+        'id': element_id,
+        'uuid': 'uuid{}'.format(element_id),
+        'tags': [{'id': 'T' + tag, 'name': tag} for tag in tags],
+        'category_id': category,
+        'category': {'id': category, 'name': {'Q3196': 'fire', 'Q235544': 'flame'}[category]},
+        'rating': rating,
+        'media_type': 'image',
+    }, **values)
+
+
+ELEMENTS = [
+    element(1, ['fire', 'smoke'], rating='3', width=1920, height=1080),
+    element(2, ['fire'], rating='5', width=3840, height=2160),
+    element(3, ['smoke', 'muzzle flash'], category='Q235544', rating='1'),
+    element(4, ['fire', 'smoke', 'torch'], category='Q235544', width=1280, height=720),
+]
+
+
+def ids(elements):
+    return [element['id'] for element in elements]
+
+
+@pytest.fixture
+def index():
+    return QueryIndex(ELEMENTS, library_path=LIBRARY_PATH)
+
+
+def test_tag_expressions(index):
+    assert index.match_tags('fire AND smoke') == {1, 4}
+    assert index.match_tags('fire smoke NOT torch') == {1}
+    assert index.match_tags('Tfire OR "muzzle flash"') == {1, 2, 3, 4}
+    assert index.match_tags('NOT (fire OR smoke)') == set()
+    assert index.match_tags('unknown OR torch') == {4}
+    for expression in ('fire AND', '(fire OR smoke', 'fire )'):
+        with pytest.raises(ValueError):
+            index.match_tags(expression)
+
+
+def test_query(index):
+    assert ids(index.query(tags=['fire', 'smoke'])) == [1, 4]
+    assert ids(index.query(category='flame')) == [3, 4]
+    assert ids(index.query(category=['fire', 'Q235544'], tags='smoke')) == [1, 3, 4]
+    assert ids(index.query(ranges={'rating': (3, None)})) == [1, 2]
+    assert ids(index.query(ranges={'resolution': (None, 1920 * 1080)})) == [1, 4]
+    # elements without a value come last
+    assert ids(index.query(order_by='-rating')) == [2, 1, 3, 4]
+    assert ids(index.query(order_by='width', offset=1, limit=2)) == [1, 2]
+    assert index.count(tags='smoke', media_type='image') == 3
+    with pytest.raises(ValueError):
+        index.query(order_by='name')
+
+
+def test_incremental_updates(index):
+    index.on_command(None, 'update', {
+        'library_path': LIBRARY_PATH, 'entity_type': 'Element'
+    }, element(2, ['smoke'], rating='2', width=640, height=480))
+    index.on_command(None, 'ingest', {'library_path': LIBRARY_PATH},
+                     element(5, ['explosion'], rating='4'))
+    # writes of other libraries are ignored
+    index.on_command(None, 'ingest', {'library_path': '/other.lib'},
+                     element(6, ['fire']))
+
+    assert index.match_tags('fire') == {1, 4}
+    assert index.match_tags('smoke') == {1, 2, 3, 4}
+    assert ids(index.query(order_by='-rating')) == [5, 1, 2, 3, 4]
+    assert ids(index.query(ranges={'width': (None, 1280)})) == [2, 4]
+
+    index.on_command(None, 'delete_element', {
+        'library_path': LIBRARY_PATH, 'element_uuid': 'uuid1', 'delete_from_database': True
+    }, True)
+    # kept in the database
+    index.on_command(None, 'delete_elements', {
+        'library_path': LIBRARY_PATH, 'element_uuids': ['uuid3'], 'delete_from_database': False
+    }, True)
+    assert len(index) == 4
+    assert index.match_tags('smoke') == {2, 3, 4}
+    assert ids(index.query(order_by='rating')) == [3, 2, 5, 4]
+
+    index.on_command(None, 'update', {
+        'library_path': LIBRARY_PATH, 'entity_type': 'Tag'
+    }, {'id': 'Texplosion', 'name': 'blast'})
+    assert index.match_tags('blast') == {5}
+
+
+def test_sorted_index():
+    rng = random.Random(1)
+    index = SortedIndex()
+    index.build([(value, value) for value in range(0, 100, 2)])
+    expected = set((value, value) for value in range(0, 100, 2))
+    for _ in range(2000):
+        entry = (rng.randrange(100), rng.randrange(100))
+        entry = (entry[0], entry[0])
+        if entry in expected and rng.random() < 0.5:
+            index.remove(*entry)
+            expected.discard(entry)
+        elif entry not in expected:
+            index.add(*entry)
+            expected.add(entry)
+        if rng.random() < 0.05:
+            assert index.range(20, 60) == set(
+                element_id for value, element_id in expected if 20 <= value <= 60)
+        assert len(index) == len(expected)
+    assert list(index.ordered_ids()) == [element_id for _, element_id in sorted(expected)]
+    assert list(index.ordered_ids(descending=True)) == [
+        element_id for _, element_id in sorted(expected, reverse=True)]
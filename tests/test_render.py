@@ -0,0 +1,42 @@
+import pytest
+
+from daselement_api.render import RenderScheduler
+
+
+def test_priority_order_and_retries():
+    order = []
+    attempts = {}
+
+    def render(element_uuid, mapping, library_path=None):
+        order.append(element_uuid)
+        attempts[element_uuid] = attempts.get(element_uuid, 0) + 1
+        if element_uuid == 'retry' and attempts[element_uuid] < 3:
+            raise Exception('Render failed')
+        return True
+
+    scheduler = RenderScheduler(render, workers=1, cpu_budget=None,
+                                retries=2, retry_delay=0.01)
+    for index in range(5):
+        scheduler.submit('low{}'.format(index), 'proxy', priority=0)
+    scheduler.submit('retry', 'proxy', priority=5)
+    scheduler.submit('high', 'proxy', priority=10)
+
+    results = scheduler.run()
+    assert all(result.ok for result in results)
+    assert order[:3] == ['high', 'retry', 'low0']
+    assert order.count('retry') == 3
+    assert scheduler.stats.retried == 2
+    assert scheduler.stats.completed == 7
+
+
+def test_progress_error_is_raised():
+
+    def progress(stats):
+        raise ValueError('progress failed')
+
+    scheduler = RenderScheduler(lambda **kwargs: True, workers=2,
+                                cpu_budget=None, progress=progress)
+    for index in range(10):
+        scheduler.submit('element{}'.format(index), 'proxy')
+    with pytest.raises(ValueError):
+        scheduler.run()
@@ -0,0 +1,76 @@
+import os
+import sqlite3
+
+from daselement_api.result_cache import ResultCache
+
+
+def write(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_key_of_a_sequence(tmp_path):
+    frames = [write(tmp_path / 'fire.{}.exr'.format(frame), b'frame')
+              for frame in range(1001, 1004)]
+    write(tmp_path / 'fire_v002.mov', b'other')
+    cache = ResultCache(path=str(tmp_path / 'results.db'))
+    sequence = str(tmp_path / 'fire.1001-1003#.exr')
+
+    keys = set()
+    for name, path in [('predict', sequence), ('get_meaningful_frame', frames[0])]:
+        key = cache.get_key(name, {'path': path})
+        assert key == cache.get_key(name, {'path': path})
+        keys.add(key)
+
+        # a changed frame and a new frame invalidate the key
+        write(tmp_path / 'fire.1002.exr', b'changed frame')
+        keys.add(cache.get_key(name, {'path': path}))
+        write(tmp_path / 'fire.1004.exr', b'frame')
+        keys.add(cache.get_key(name, {'path': path.replace('1003', '1004')}))
+    assert len(keys) == 6
+    cache.close()
+
+
+def test_key_of_the_model(tmp_path):
+    clip = write(tmp_path / 'clip.mov', b'clip')
+    model = write(tmp_path / 'model.wit', b'model')
+    cache = ResultCache(path=str(tmp_path / 'results.db'))
+    arguments = {'path': clip, 'model': model, 'top': 2}
+    key = cache.get_key('predict', arguments)
+
+    write(tmp_path / 'model.wit', b'new model')
+    new_key = cache.get_key('predict', arguments)
+    assert new_key != key
+    assert cache.get_key('predict', dict(arguments, top=3)) not in (key, new_key)
+    assert cache.get_key('predict', dict(arguments, path=str(tmp_path))) is None
+    cache.close()
+
+
+def test_evict_by_size(tmp_path):
+    cache = ResultCache(path=str(tmp_path / 'results.db'), max_size=1000)
+    for index in range(10):
+        cache.put(str(index), 'x' * 198)
+        # the first results are the least recently used
+        cache.get('0')
+    stats = cache.stats()
+    assert stats['size'] <= 1000
+    assert stats['entries'] == 5
+    assert cache.get('0')[0] and not cache.get('1')[0]
+    assert cache.get('9') == (True, 'x' * 198)
+    cache.close()
+
+
+def test_cache_file_without_sizes(tmp_path):
+    path = str(tmp_path / 'results.db')
+    connection = sqlite3.connect(path)
+    connection.execute(
+        'CREATE TABLE results (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)')
+    connection.execute("INSERT INTO results VALUES ('key', '[1, 2]', 0)")
+    connection.commit()
+    connection.close()
+
+    cache = ResultCache(path=path)
+    assert cache.get('key') == (True, [1, 2])
+    assert cache.stats()['size'] == len('[1, 2]')
+    cache.close()
+    assert os.path.isfile(path)
@@ -0,0 +1,105 @@
+import threading
+import time
+
+from daselement_api.routing import UUIDRouter, UUIDSet
+
+UUIDS = ['{:032x}'.format(index) for index in range(1, 101)]
+
+
+def test_uuid_set_add():
+    uuids = UUIDSet(UUIDS[:50])
+    uuids.add(UUIDS[0])
+    uuids.add(UUIDS[60])
+    uuids.add(UUIDS[60])
+    assert len(uuids) == 51
+    assert UUIDS[60] in uuids
+    assert UUIDS[70] not in uuids
+
+
+class StaticRouter(UUIDRouter):
+
+    def __init__(self, fail=False):
+        super(StaticRouter, self).__init__(max_age=None)
+        self.fail = fail
+        self.release = threading.Event()
+
+    def refresh(self, config=None):
+        self.release.wait(5)
+        if self.fail:
+            raise Exception('Library not found')
+        with self._lock:
+            self._tables[config] = (time.monotonic(), {
+                '/first.lib': UUIDSet(UUIDS[:50]),
+                '/second.lib': UUIDSet(UUIDS[50:])
+            })
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_first_build_runs_in_background():
+    router = StaticRouter()
+    # not ready yet, the CLI searches all libraries
+    assert router.route(None, UUIDS[70]) is None
+    router.release.set()
+    wait_for(lambda: router.route(None, UUIDS[70]) == '/second.lib')
+    assert router.route(None, UUIDS[0]) == '/first.lib'
+
+
+def test_failed_build_does_not_break_lookups():
+    router = StaticRouter(fail=True)
+    router.release.set()
+    assert router.route(None, UUIDS[0]) is None
+    wait_for(lambda: not router._refreshing)
+    assert router.route(None, UUIDS[0]) is None
+    # no new build until the retry interval is over
+    assert not router._refreshing
+
+
+def test_uuid_set_discard():
+    uuids = UUIDSet(UUIDS[:50])
+    uuids.add(UUIDS[60])
+    uuids.discard(UUIDS[0])
+    uuids.discard(UUIDS[60])
+    uuids.discard(UUIDS[70])
+    assert len(uuids) == 49
+    assert UUIDS[0] not in uuids and UUIDS[60] not in uuids
+    uuids.add(UUIDS[0])
+    assert UUIDS[0] in uuids and len(uuids) == 50
+
+
+def test_deleted_elements_are_not_routed():
+    router = StaticRouter()
+    router.release.set()
+    router.refresh(None)
+    router.on_command(None, 'delete_elements', {
+        'library_path': None,
+        'element_uuids': [UUIDS[0], UUIDS[70]],
+        'delete_from_database': True
+    }, True)
+    router.on_command(None, 'delete_element', {
+        'library_path': '/first.lib',
+        'element_uuid': UUIDS[1],
+        'delete_from_database': False
+    }, True)
+    assert router.route(None, UUIDS[0]) is None
+    assert router.route(None, UUIDS[70]) is None
+    assert router.route(None, UUIDS[1]) == '/first.lib'
+
+    router.on_command(None, 'ingest', {'library_path': '/second.lib'},
+                      {'uuid': UUIDS[0]})
+    assert router.route(None, UUIDS[0]) == '/second.lib'
+
+
+def test_changed_config_counts_as_failed_build():
+    router = UUIDRouter()
+    router.refresh = lambda config=None: None
+    assert router.route('/other.conf', UUIDS[0]) is None
+    wait_for(lambda: not router._refreshing)
+    assert '/other.conf' in router._failed_at
+    assert router.route('/other.conf', UUIDS[0]) is None
+    assert not router._refreshing
@@ -0,0 +1,101 @@
+import os
+
+from daselement_api import scanner
+
+
+def write(path, content=b'frame'):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+def age(directory, seconds=60):
+    # directories changed right before the scan get read again on the next scan
+    for root, _, _ in os.walk(str(directory)):
+        stat = os.stat(root)
+        os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+
+
+def changes(root, state_path, as_sequence=True):
+    return sorted(scanner.scan_changes(str(root), str(state_path),
+                                       as_sequence=as_sequence))
+
+
+def test_added_files(tmp_path):
+    root = tmp_path / 'shots'
+    state_path = tmp_path / 'state.json'
+    for frame in (1001, 1002):
+        write(root / 'fire' / 'fire.{}.exr'.format(frame))
+    write(root / 'clip.mov')
+    age(root)
+
+    assert changes(root, state_path) == [
+        str(root / 'clip.mov'), str(root / 'fire' / 'fire.1001-1002#.exr')]
+    assert changes(root, state_path) == []
+
+    # a new frame reports the sequence with its full frame range
+    write(root / 'fire' / 'fire.1003.exr')
+    write(root / 'smoke' / 'smoke.mov')
+    age(root)
+    assert changes(root, state_path) == [
+        str(root / 'fire' / 'fire.1001-1003#.exr'), str(root / 'smoke' / 'smoke.mov')]
+    assert changes(root, state_path) == []
+
+
+def test_removed_files(tmp_path):
+    root = tmp_path / 'shots'
+    state_path = tmp_path / 'state.json'
+    write(root / 'a.mov')
+    write(root / 'b.mov')
+    write(root / 'old' / 'old.mov')
+    age(root)
+    assert len(changes(root, state_path)) == 3
+
+    os.remove(str(root / 'b.mov'))
+    os.remove(str(root / 'old' / 'old.mov'))
+    os.rmdir(str(root / 'old'))
+    age(root)
+    assert changes(root, state_path) == []
+
+    state = scanner.load_state(str(state_path))
+    assert list(state['directories']) == [str(root)]
+    assert state['directories'][str(root)]['paths'] == [str(root / 'a.mov')]
+
+    # a file added again is new
+    write(root / 'b.mov')
+    age(root)
+    assert changes(root, state_path) == [str(root / 'b.mov')]
+
+
+def test_modified_files(tmp_path):
+    root = tmp_path / 'shots'
+    state_path = tmp_path / 'state.json'
+    write(root / 'clip.mov')
+    age(root)
+    assert changes(root, state_path) == [str(root / 'clip.mov')]
+
+    # a changed file keeps its path and the directory its modification time
+    write(root / 'clip.mov', b'new content')
+    assert changes(root, state_path) == []
+
+    # a directory changed shortly before the scan is read again
+    write(root / 'clip_v002.mov')
+    assert changes(root, state_path) == [str(root / 'clip_v002.mov')]
+    state = scanner.load_state(str(state_path))
+    assert state['directories'][str(root)]['unstable']
+    write(root / 'clip_v003.mov')
+    assert changes(root, state_path) == [str(root / 'clip_v003.mov')]
+
+
+def test_corrupt_state_file(tmp_path):
+    root = tmp_path / 'shots'
+    state_path = tmp_path / 'state.json'
+    write(root / 'clip.mov')
+    age(root)
+    state_path.write_text('{"root": "/shots", "directories": {')
+
+    # a broken state file starts a full scan and gets replaced
+    assert changes(root, state_path) == [str(root / 'clip.mov')]
+    assert changes(root, state_path) == []
+
+    # as does the state of another root or mode
+    assert changes(root, state_path, as_sequence=False) == [str(root / 'clip.mov')]
@@ -0,0 +1,48 @@
+from daselement_api.scanner import collapse_sequences, split_frame
+
+
+def collapse(names):
+    return [path for path, _, _ in collapse_sequences('/shots', names)]
+
+
+def frames(prefix, numbers, padding=4, ext='.exr'):
+    return ['{}{:0{}d}{}'.format(prefix, number, padding, ext) for number in numbers]
+
+
+def test_sequence_notation():
+    # the notation of `get-paths-from-disk`
+    assert collapse(frames('path.', range(1001, 1100))) == ['/shots/path.1001-1099#.exr']
+    assert collapse(frames('fire_', range(1, 4), padding=5, ext='.jpg')) == [
+        '/shots/fire_1-3@@@@@.jpg']
+
+
+def test_versioned_files_are_no_sequence():
+    assert collapse(['shot_v002.mov', 'shot_v003.mov', 'shotV4.mov']) == [
+        '/shots/shotV4.mov', '/shots/shot_v002.mov', '/shots/shot_v003.mov']
+    assert split_frame('shot_v002.mov') is None
+    assert collapse(frames('shot_v002.', [1001, 1002])) == [
+        '/shots/shot_v002.1001-1002#.exr']
+
+
+def test_mixed_padding():
+    names = frames('a.', [1, 2]) + frames('a.', [1, 2], padding=2)
+    assert collapse(names) == ['/shots/a.1-2#.exr', '/shots/a.1-2@@.exr']
+
+    # frames without leading zeros grow past the padding
+    assert collapse(frames('b.', [8, 9, 10], padding=1)) == ['/shots/b.8-10@.exr']
+    assert collapse(frames('c.', [9998, 9999, 10000])) == ['/shots/c.9998-10000#.exr']
+    assert collapse(['d.5.exr'] + frames('d.', [10, 11])) == [
+        '/shots/d.10-11#.exr', '/shots/d.5.exr']
+
+
+def test_single_numbered_file():
+    assert collapse(['plate.1001.exr', 'notes.txt', 'plate.1001.jpg']) == [
+        '/shots/notes.txt', '/shots/plate.1001.exr', '/shots/plate.1001.jpg']
+
+
+def test_gaps_and_steps():
+    assert collapse(frames('e.', [1001, 1002, 1003, 1005])) == [
+        '/shots/e.1001-1003,1005#.exr']
+    assert collapse(frames('f.', [1, 3, 5, 6])) == ['/shots/f.1-5x2,6#.exr']
+    paths = collapse_sequences('/shots', frames('g.', [1, 2, 4]))
+    assert paths == [('/shots/g.1-2,4#.exr', [1, 2, 4], 3)]
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+from daselement_api.session import Session, default_session, get_session
+
+
+def test_activate_nests():
+    first, second = Session(config='/first.conf'), Session(config='/second.conf')
+    with first.activate():
+        with second.activate():
+            assert get_session() is second
+        assert get_session() is first
+    assert get_session() is default_session
+
+
+def test_tasks_and_threads_have_their_own_session():
+    sessions = [Session(config='/{}.conf'.format(index)) for index in range(3)]
+
+    async def task(session):
+        with session.activate():
+            await asyncio.sleep(0.01)
+            return get_session() is session
+
+    async def main():
+        return await asyncio.gather(*[task(session) for session in sessions])
+
+    assert asyncio.run(main()) == [True] * 3
+
+    seen = []
+    with sessions[0].activate():
+        thread = threading.Thread(target=lambda: seen.append(get_session()))
+        thread.start()
+        thread.join()
+    assert seen == [default_session]
+
+
+def test_session_function_is_cached(session):
+    assert session.get_elements is session.get_elements
+    assert session.get_elements.quiet is session.get_elements.quiet
+    assert Session(cli='cli', cli_full='cli').get_elements is not session.get_elements
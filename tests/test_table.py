@@ -0,0 +1,61 @@
+import pytest
+
+from daselement_api.table import NUMERIC_COLUMNS, STRING_COLUMNS, build_table
+from conftest import LIBRARY_PATH
+
+numpy = pytest.importorskip('numpy')
+
+FIRE = {'id': 'Q3196', 'name': 'fire'}
+SMOKE = {'id': 'Q5300', 'name': 'smoke'}
+
+
+def test_empty():
+    table = build_table(iter([]))
+    assert len(table) == 0
+    assert set(table.columns) == set(NUMERIC_COLUMNS + STRING_COLUMNS)
+    assert table['width'].dtype == numpy.int64 and len(table['width']) == 0
+    assert len(table['media_type']) == 0
+    assert list(table.tag_offsets) == [0]
+    for mask in (table.has_tag('fire'), table.has_all_tags(['fire']),
+                 table.has_any_tags(['fire', 'smoke']), table['media_type'].equals('image'),
+                 table['media_type'].isin(['image'])):
+        assert mask.dtype == bool and len(mask) == 0
+    assert len(table.rows(table.has_tag('fire'))) == 0
+
+
+def test_single_element():
+    table = build_table([{'id': 7, 'width': '1920', 'rating': None, 'media_type': 'image',
+                          'tags': [FIRE, SMOKE]}])
+    assert len(table) == 1
+    assert list(table['id']) == [7] and list(table['width']) == [1920]
+    # missing values
+    assert list(table['rating']) == [-1] and table['name'][0] is None
+
+    assert list(table.has_tag('fire')) == [True]
+    assert list(table.has_tag('Q5300')) == [True]
+    assert list(table.has_tag('torch')) == [False]
+    assert list(table.has_all_tags(['fire', 'torch'])) == [False]
+    assert list(table.has_any_tags(['fire', 'torch'])) == [True]
+    assert list(table['media_type'].equals('image')) == [True]
+    assert list(table['media_type'].isin(['sequence', 'movie'])) == [False]
+
+    row = table.row(0)
+    assert row['id'] == 7 and row['media_type'] == 'image'
+    assert row['tags'] == [FIRE, SMOKE]
+
+
+def test_single_element_without_tags():
+    table = build_table([{'id': 1}])
+    assert list(table.tag_offsets) == [0, 0]
+    assert table.row_tags(0) == []
+    assert list(table.has_any_tags(['fire'])) == [False]
+
+
+def test_session_table(session):
+    elements = session.get_elements(LIBRARY_PATH)
+    table = session.get_elements_table(LIBRARY_PATH)
+    assert len(table) == len(elements)
+    assert list(table['id']) == [element['id'] for element in elements]
+    tag = elements[0]['tags'][0]['id']
+    expected = [any(item['id'] == tag for item in element['tags']) for element in elements]
+    assert list(table.has_tag(tag)) == expected
@@ -0,0 +1,89 @@
+from daselement_api.taxonomy import Taxonomy, TaxonomyCache
+
+TAGS = [{'id': 'T1', 'name': 'fire'}, {'id': 'T2', 'name': 'smoke'}]
+CATEGORIES = [
+    {'id': 'Q327954', 'name': 'torch', 'parents': ['Q235544', 'Q9999']},
+    {'id': 'Q9999', 'name': 'light source', 'children': ['Q327954']},
+    {'id': 'Q235544', 'name': 'flame', 'parents': [{'id': 'Q3196'}]},
+    {'id': 'Q3196', 'name': 'fire', 'children': [{'id': 'Q235544'}]},
+]
+
+
+class StaticCache(TaxonomyCache):
+
+    def __init__(self):
+        super(StaticCache, self).__init__(max_age=None)
+        self.loads = 0
+
+    def load(self, library_path):
+        self.loads += 1
+        return Taxonomy(TAGS, CATEGORIES)
+
+
+def test_parent_order():
+    for _ in range(20):
+        taxonomy = Taxonomy(TAGS, CATEGORIES)
+        assert taxonomy.parents('torch') == ['Q235544', 'Q9999']
+        assert taxonomy.parent_chain('torch') == ['Q327954', 'Q235544', 'Q3196']
+
+    # a parent only known from its children comes after the own parents
+    categories = [CATEGORIES[1], CATEGORIES[0]] + CATEGORIES[2:]
+    taxonomy = Taxonomy(TAGS, categories)
+    assert taxonomy.parents('torch') == ['Q235544', 'Q9999']
+
+
+def test_invalidate_on_new_tags_only():
+    cache = StaticCache()
+    cache.get(None, '/library')
+    arguments = {'library_path': '/library', 'category': 'torch'}
+
+    cache.on_command(None, 'ingest', dict(arguments, tags=['fire', 'T2']), {})
+    cache.get(None, '/library')
+    assert cache.loads == 1
+
+    cache.on_command(None, 'update', {
+        'library_path': '/library',
+        'entity_type': 'Element',
+        'data': {'tags': [{'id': 'T1'}]}
+    }, {})
+    cache.get(None, '/library')
+    assert cache.loads == 1
+
+    cache.on_command(None, 'ingest', dict(arguments, tags=['new tag']), {})
+    cache.get(None, '/library')
+    assert cache.loads == 2
+
+    cache.on_command(None, 'update', {
+        'library_path': '/library',
+        'entity_type': 'Tag',
+        'data': {'name': 'flames'}
+    }, {})
+    cache.get(None, '/library')
+    assert cache.loads == 3
+
+
+def test_elements_count_after_writes():
+    cache = StaticCache()
+    cache.lookup(None, '/library', 'tag')
+    taxonomy = cache.get(None, '/library')
+
+    for name, arguments in [
+        ('ingest', {'tags': ['fire'], 'category': 'torch'}),
+        ('delete_element', {'element_uuid': '9947c549c6014a3ca831983275884051'}),
+        ('delete_elements', {'element_uuids': ['9947c549c6014a3ca831983275884051']}),
+        ('update', {'entity_type': 'Element', 'data': {'tags': ['smoke']}}),
+    ]:
+        loads = cache.loads
+        cache.on_command(None, name, dict(arguments, library_path='/library'), {})
+        # the hierarchy is still valid, the counts are loaded again
+        assert cache.get(None, '/library') is taxonomy
+        assert cache.loads == loads
+        cache.lookup(None, '/library', 'tag', 'fire')
+        assert cache.loads == loads + 1
+        taxonomy = cache.get(None, '/library')
+
+    # an element update without tags or category changes no count
+    cache.on_command(None, 'update', {
+        'library_path': '/library', 'entity_type': 'Element', 'data': {'rating': 3}}, {})
+    cache.lookup(None, '/library', 'tag')
+    assert cache.loads == 5
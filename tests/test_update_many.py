@@ -0,0 +1,40 @@
+import pytest
+
+from daselement_api import api
+from conftest import LIBRARY_PATH
+
+
+def test_equal_data_is_serialized_once(session, monkeypatch):
+    payloads = []
+    as_quoted_dict = api.as_quoted_dict
+
+    def serialize(data):
+        payloads.append(data)
+        return as_quoted_dict(data)
+
+    monkeypatch.setattr(api, 'as_quoted_dict', serialize)
+    updates = [(1, {'rating': 3, 'metadata': {'shot': 'a'}}),
+               (2, {'metadata': {'shot': 'a'}, 'rating': 3}),
+               (3, {'rating': 4}),
+               (4, {'rating': 3, 'metadata': {'shot': 'a'}})]
+    results = session.update_many(LIBRARY_PATH, 'Element', updates, workers=2)
+    assert payloads == [updates[0][1], updates[2][1]]
+    assert [result.value['id'] for result in results] == [1, 2, 3, 4]
+    assert [result.value['rating'] for result in results] == [3, 3, 4, 3]
+
+
+def test_errors_per_entity(session):
+    notified = []
+    session.listeners.append(
+        lambda config, name, arguments, result: notified.append(
+            (arguments['entity_id'], result is not None)))
+    updates = [(1, {'rating': 3}), ('missing', {'rating': 3}), (3, {'rating': 3})]
+
+    results = session.update_many(LIBRARY_PATH, 'Element', updates)
+    assert [result.ok for result in results] == [True, False, True]
+    assert 'exit code 1' in str(results[1].error)
+    # the listeners get the failed update as well
+    assert set(notified) == {(1, True), (3, True), ('missing', False)}
+
+    with pytest.raises(Exception, match='exit code 1'):
+        session.update_many(LIBRARY_PATH, 'Element', updates, continue_on_error=False)
@@ -0,0 +1,93 @@
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from daselement_api import worker
+
+STUB_COMMAND = [sys.executable, '-m', 'daselement_api.worker_stub']
+
+
+@pytest.fixture
+def pool():
+    pool = worker.WorkerPool(STUB_COMMAND, 1, timeout=2)
+    yield pool
+    pool.close()
+
+
+def get_pid(pool):
+    returncode, output, error = pool.run(['get-libraries'])
+    assert returncode == 0
+    return json.loads(output)['pid']
+
+
+def test_request(pool):
+    returncode, output, error = pool.run(['get-libraries', 'stub-fail'])
+    assert returncode == 1
+    assert 'Stub failure' in error
+    assert get_pid(pool) == get_pid(pool)
+
+
+def test_crash_respawns_worker(pool):
+    pid = get_pid(pool)
+    with pytest.raises(worker.WorkerCrashed) as error:
+        pool.run(['stub-crash'])
+    assert error.value.delivered
+    assert get_pid(pool) != pid
+
+
+def test_timeout_kills_and_respawns_worker(pool):
+    pid = get_pid(pool)
+    started_at = time.monotonic()
+    with pytest.raises(worker.WorkerTimeout):
+        pool.run(['stub-sleep', '30'])
+    assert time.monotonic() - started_at < 10
+    assert get_pid(pool) != pid
+
+
+def test_close_wakes_up_waiting_threads(pool):
+    errors = []
+
+    def run(arguments):
+        try:
+            pool.run(arguments)
+        except Exception as error:
+            errors.append(error)
+
+    busy = threading.Thread(target=run, args=(['stub-sleep', '1'], ))
+    busy.start()
+    time.sleep(0.5)
+    waiting = threading.Thread(target=run, args=(['get-libraries'], ))
+    waiting.start()
+    time.sleep(0.2)
+
+    pool.close()
+    waiting.join(5)
+    busy.join(5)
+    assert not waiting.is_alive() and not busy.is_alive()
+    assert any('shut down' in str(error) for error in errors)
+    with pytest.raises(Exception):
+        pool.run(['get-libraries'])
+
+
+def test_invalid_response_replaces_worker(pool):
+    pid = get_pid(pool)
+    with pytest.raises(worker.WorkerCrashed, match='invalid response') as error:
+        pool.run(['get-libraries', 'stub-garbage'])
+    assert error.value.delivered
+    # the response of the request is not read by the next one
+    new_pid = get_pid(pool)
+    assert new_pid != pid
+    assert get_pid(pool) == new_pid
+
+
+def test_pool_per_size_and_timeout():
+    try:
+        pool = worker.get_pool(STUB_COMMAND, 1, timeout=2)
+        assert worker.get_pool(STUB_COMMAND, 1, timeout=2) is pool
+        assert worker.get_pool(STUB_COMMAND, 2, timeout=2).size == 2
+        assert worker.get_pool(STUB_COMMAND, 1, timeout=5).timeout == 5
+    finally:
+        worker.shutdown()